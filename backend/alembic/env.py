@@ -13,12 +13,15 @@ from alembic import context
 # to autogenerate.  The individual table modules are imported for their
 # side-effect of registering with Base.metadata.
 from database import Base  # noqa: F401
+import card.db.card_catalog_table  # noqa: F401
 import card.db.card_table  # noqa: F401
+import evaluation.db.grading_job_table  # noqa: F401
 import exam.db.exam_tables  # noqa: F401
 import navigation.db.navigation_tables  # noqa: F401
 import scheduling.db.scheduling_table  # noqa: F401
 import scheduling.db.review_log_table  # noqa: F401
 import settings.db.settings_table  # noqa: F401
+import study.db.daily_activity_table  # noqa: F401
 
 config = context.config
 
@@ -0,0 +1,56 @@
+"""daily activity rollup
+
+Revision ID: 0002_daily_activity
+Revises: 0001_initial
+Create Date: 2026-10-17 00:00:00
+
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002_daily_activity"
+down_revision: Union[str, None] = "0001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_activity",
+        sa.Column("activity_date", sa.Date, primary_key=True),
+        sa.Column("review_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("streak_days", sa.Integer, nullable=False, server_default="1"),
+    )
+
+    # Backfill from existing review logs, bucketed into days of the same zone
+    # the service uses (STUDY_ACTIVITY_TIMEZONE). Consecutive days form an
+    # island with a constant ``day - row_number()``; the streak on each day is
+    # its position inside that island.
+    activity_timezone = os.getenv("STUDY_ACTIVITY_TIMEZONE", "").strip() or "UTC"
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO daily_activity (activity_date, review_count, streak_days)
+            SELECT day, review_count,
+                   row_number() OVER (PARTITION BY island ORDER BY day)
+            FROM (
+                SELECT day, review_count,
+                       day - (row_number() OVER (ORDER BY day))::int AS island
+                FROM (
+                    SELECT (reviewed_at AT TIME ZONE :activity_timezone)::date AS day,
+                           count(*) AS review_count
+                    FROM review_logs
+                    GROUP BY 1
+                ) AS days
+            ) AS islands
+            """
+        ).bindparams(activity_timezone=activity_timezone)
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_activity")
@@ -0,0 +1,30 @@
+"""card catalogue version counter
+
+Revision ID: 0003_card_catalog_version
+Revises: 0002_daily_activity
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003_card_catalog_version"
+down_revision: Union[str, None] = "0002_daily_activity"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "card_catalog_version",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("version", sa.Integer, nullable=False, server_default="1"),
+    )
+    op.execute("INSERT INTO card_catalog_version (id, version) VALUES (1, 1)")
+
+
+def downgrade() -> None:
+    op.drop_table("card_catalog_version")
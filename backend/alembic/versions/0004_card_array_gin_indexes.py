@@ -0,0 +1,28 @@
+"""GIN indexes on cards.tags and cards.exam_sheets
+
+Revision ID: 0004_card_array_gin_indexes
+Revises: 0003_card_catalog_version
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0004_card_array_gin_indexes"
+down_revision: Union[str, None] = "0003_card_catalog_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_cards_tags", "cards", ["tags"], postgresql_using="gin")
+    op.create_index(
+        "ix_cards_exam_sheets", "cards", ["exam_sheets"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cards_exam_sheets", table_name="cards")
+    op.drop_index("ix_cards_tags", table_name="cards")
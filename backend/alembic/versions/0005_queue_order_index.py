@@ -0,0 +1,40 @@
+"""composite index matching the study queue order
+
+Revision ID: 0005_queue_order_index
+Revises: 0004_card_array_gin_indexes
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005_queue_order_index"
+down_revision: Union[str, None] = "0004_card_array_gin_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (due, last_review NULLS FIRST, card_id) is exactly the queue ORDER BY, so
+    # LIMITed queue reads become index-ordered scans without a Sort node. The
+    # old single-column index on ``due`` is a prefix of it and is dropped.
+    op.create_index(
+        "ix_card_scheduling_info_queue_order",
+        "card_scheduling_info",
+        ["due", sa.text("last_review ASC NULLS FIRST"), "card_id"],
+    )
+    op.drop_index("ix_card_scheduling_info_due", table_name="card_scheduling_info")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_card_scheduling_info_due",
+        "card_scheduling_info",
+        ["due"],
+    )
+    op.drop_index(
+        "ix_card_scheduling_info_queue_order", table_name="card_scheduling_info"
+    )
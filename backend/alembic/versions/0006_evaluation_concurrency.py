@@ -0,0 +1,33 @@
+"""evaluation concurrency setting
+
+Revision ID: 0006_evaluation_concurrency
+Revises: 0005_queue_order_index
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006_evaluation_concurrency"
+down_revision: Union[str, None] = "0005_queue_order_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "app_settings",
+        sa.Column(
+            "evaluation_concurrency",
+            sa.Integer,
+            nullable=False,
+            server_default="4",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("app_settings", "evaluation_concurrency")
@@ -0,0 +1,41 @@
+"""evaluation result cache
+
+Revision ID: 0007_evaluation_cache
+Revises: 0006_evaluation_concurrency
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007_evaluation_cache"
+down_revision: Union[str, None] = "0006_evaluation_concurrency"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evaluation_cache",
+        sa.Column("cache_key", sa.String(64), primary_key=True),
+        sa.Column("model", sa.String(160), nullable=False),
+        sa.Column("score", sa.Float, nullable=False),
+        sa.Column("is_correct", sa.Boolean, nullable=False),
+        sa.Column("feedback", sa.Text, nullable=False),
+        sa.Column("errors", sa.JSON, nullable=False, server_default="[]"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index("ix_evaluation_cache_model", "evaluation_cache", ["model"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evaluation_cache_model", table_name="evaluation_cache")
+    op.drop_table("evaluation_cache")
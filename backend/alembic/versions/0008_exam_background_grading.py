@@ -0,0 +1,38 @@
+"""background grading of saved exam answers
+
+Revision ID: 0008_exam_background_grading
+Revises: 0007_evaluation_cache
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008_exam_background_grading"
+down_revision: Union[str, None] = "0007_evaluation_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "exam_answers",
+        sa.Column("graded_answer_hash", sa.String(64), nullable=True),
+    )
+    op.add_column(
+        "app_settings",
+        sa.Column(
+            "exam_background_grading",
+            sa.Boolean,
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("app_settings", "exam_background_grading")
+    op.drop_column("exam_answers", "graded_answer_hash")
@@ -0,0 +1,35 @@
+"""grading jobs for asynchronous submit
+
+Revision ID: 0009_grading_jobs
+Revises: 0008_exam_background_grading
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0009_grading_jobs"
+down_revision: Union[str, None] = "0008_exam_background_grading"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "grading_jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("session_id", sa.String(36), nullable=False),
+        sa.Column("status", sa.String(32), nullable=False),
+        sa.Column("error", sa.Text, nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint("kind", "session_id", name="uq_grading_jobs_kind_session"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("grading_jobs")
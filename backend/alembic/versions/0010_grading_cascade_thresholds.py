@@ -0,0 +1,43 @@
+"""grading cascade coverage thresholds
+
+Revision ID: 0010_grading_cascade_thresholds
+Revises: 0009_grading_jobs
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0010_grading_cascade_thresholds"
+down_revision: Union[str, None] = "0009_grading_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "app_settings",
+        sa.Column(
+            "grading_cascade_low_coverage",
+            sa.Float,
+            nullable=False,
+            server_default=sa.text("0.0"),
+        ),
+    )
+    op.add_column(
+        "app_settings",
+        sa.Column(
+            "grading_cascade_high_coverage",
+            sa.Float,
+            nullable=False,
+            server_default=sa.text("1.0"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("app_settings", "grading_cascade_high_coverage")
+    op.drop_column("app_settings", "grading_cascade_low_coverage")
@@ -0,0 +1,25 @@
+"""configurable OpenAI base URL
+
+Revision ID: 0011_openai_base_url
+Revises: 0010_grading_cascade_thresholds
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0011_openai_base_url"
+down_revision: Union[str, None] = "0010_grading_cascade_thresholds"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("app_settings", sa.Column("openai_base_url", sa.Text, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("app_settings", "openai_base_url")
@@ -0,0 +1,30 @@
+"""structured navigation key answers
+
+Revision ID: 0012_nav_parsed_key_answers
+Revises: 0011_openai_base_url
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "0012_nav_parsed_key_answers"
+down_revision: Union[str, None] = "0011_openai_base_url"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled by the seed script; rows left NULL are parsed when loaded.
+    op.add_column(
+        "navigation_tasks",
+        sa.Column("parsed_key_answers", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("navigation_tasks", "parsed_key_answers")
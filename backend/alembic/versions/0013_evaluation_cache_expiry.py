@@ -0,0 +1,27 @@
+"""index evaluation cache rows by age for expiry
+
+Revision ID: 0013_evaluation_cache_expiry
+Revises: 0012_nav_parsed_key_answers
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0013_evaluation_cache_expiry"
+down_revision: Union[str, None] = "0012_nav_parsed_key_answers"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows older than the cache TTL are deleted on each write.
+    op.create_index(
+        "ix_evaluation_cache_created_at", "evaluation_cache", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evaluation_cache_created_at", table_name="evaluation_cache")
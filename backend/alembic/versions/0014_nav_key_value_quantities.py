@@ -0,0 +1,27 @@
+"""re-parse navigation key answers with per-value quantities
+
+Revision ID: 0014_nav_key_value_quantities
+Revises: 0013_evaluation_cache_expiry
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0014_nav_key_value_quantities"
+down_revision: Union[str, None] = "0013_evaluation_cache_expiry"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored values lack their quantity label; NULL rows are parsed when
+    # loaded until the seed script writes them again.
+    op.execute("UPDATE navigation_tasks SET parsed_key_answers = NULL")
+
+
+def downgrade() -> None:
+    # Values with a quantity still load in the previous format.
+    pass
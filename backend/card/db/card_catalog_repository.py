@@ -0,0 +1,44 @@
+"""Async PostgreSQL implementation of CardCatalogSourcePort."""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from card.db.card_catalog_table import CARD_CATALOG_VERSION_ROW_ID, CardCatalogVersionRow
+from card.db.card_db_mapper import CardDbMapper
+from card.db.card_table import CardRow
+from card.model.card_catalog import CardCatalog
+
+
+class CardCatalogRepository:
+    """Reads the card catalogue snapshot and maintains its version counter."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_version(self) -> int:
+        stmt = select(CardCatalogVersionRow.version).where(
+            CardCatalogVersionRow.id == CARD_CATALOG_VERSION_ROW_ID
+        )
+        return await self._session.scalar(stmt) or 0
+
+    async def load(self) -> CardCatalog:
+        version = await self.get_version()
+        result = await self._session.execute(select(CardRow).order_by(CardRow.card_id))
+        return CardCatalog(
+            version=version,
+            cards=tuple(CardDbMapper.to_domain(row) for row in result.scalars().all()),
+        )
+
+    async def bump_version(self) -> None:
+        """Increment the catalogue version so running apps reload their cache."""
+        stmt = insert(CardCatalogVersionRow).values(
+            id=CARD_CATALOG_VERSION_ROW_ID, version=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CardCatalogVersionRow.id],
+            set_={"version": CardCatalogVersionRow.version + 1},
+        )
+        await self._session.execute(stmt)
@@ -0,0 +1,19 @@
+"""SQLAlchemy ORM model for the ``card_catalog_version`` table."""
+
+from __future__ import annotations
+
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+CARD_CATALOG_VERSION_ROW_ID = 1
+
+
+class CardCatalogVersionRow(Base):
+    """Single-row version counter, bumped whenever the card catalogue changes."""
+
+    __tablename__ = "card_catalog_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
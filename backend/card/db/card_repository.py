@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from card.db.card_db_mapper import CardDbMapper
@@ -37,6 +37,24 @@ class CardRepository:
         rows = result.scalars().all()
         return [CardDbMapper.to_domain(row) for row in rows]
 
+    async def get_by_exam_sheet(self, sheet_number: int) -> list[Card]:
+        """Return the cards on the given exam sheet, ordered by card ID."""
+        stmt = (
+            select(CardRow)
+            .where(CardRow.exam_sheets.contains([sheet_number]))
+            .order_by(CardRow.card_id)
+        )
+        result = await self._session.execute(stmt)
+        rows = result.scalars().all()
+        return [CardDbMapper.to_domain(row) for row in rows]
+
+    async def count_by_exam_sheet(self) -> dict[int, int]:
+        """Return the number of cards per exam sheet."""
+        sheets = select(func.unnest(CardRow.exam_sheets).label("sheet_number")).subquery()
+        stmt = select(sheets.c.sheet_number, func.count()).group_by(sheets.c.sheet_number)
+        result = await self._session.execute(stmt)
+        return {sheet_number: count for sheet_number, count in result.all()}
+
     async def save(self, card: Card) -> None:
         """Insert or update a card."""
         row = CardDbMapper.to_row(card)
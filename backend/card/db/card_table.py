@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,6 +13,10 @@ class CardRow(Base):
     """Persistent representation of a flashcard."""
 
     __tablename__ = "cards"
+    __table_args__ = (
+        Index("ix_cards_tags", "tags", postgresql_using="gin"),
+        Index("ix_cards_exam_sheets", "exam_sheets", postgresql_using="gin"),
+    )
 
     card_id: Mapped[str] = mapped_column(String(36), primary_key=True)
 
@@ -1,9 +1,11 @@
 from card.model.card import Card
+from card.model.card_catalog import CardCatalog
 from card.model.card_content import CardContent
 from card.model.card_image import CardImage
 
 __all__ = [
     "Card",
+    "CardCatalog",
     "CardContent",
     "CardImage",
 ]
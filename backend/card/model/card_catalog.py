@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from card.model.card import Card
+
+
+@dataclass(frozen=True)
+class CardCatalog:
+    """Immutable, indexed snapshot of all cards at a given catalogue version.
+
+    Snapshots are shared between concurrent requests, so the contained cards
+    must be treated as read-only.
+    """
+
+    version: int
+    cards: tuple[Card, ...] = ()
+    _by_id: Mapping[str, Card] = field(init=False, repr=False, compare=False)
+    _by_tag: Mapping[str, tuple[int, ...]] = field(init=False, repr=False, compare=False)
+    _by_exam_sheet: Mapping[int, tuple[Card, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        by_tag: dict[str, list[int]] = {}
+        by_exam_sheet: dict[int, list[Card]] = {}
+        for position, card in enumerate(self.cards):
+            for tag in dict.fromkeys(card.tags):
+                by_tag.setdefault(tag, []).append(position)
+            for sheet_number in dict.fromkeys(card.exam_sheets):
+                by_exam_sheet.setdefault(sheet_number, []).append(card)
+
+        object.__setattr__(
+            self, "_by_id", MappingProxyType({card.card_id: card for card in self.cards})
+        )
+        object.__setattr__(
+            self,
+            "_by_tag",
+            MappingProxyType({tag: tuple(positions) for tag, positions in by_tag.items()}),
+        )
+        object.__setattr__(
+            self,
+            "_by_exam_sheet",
+            MappingProxyType(
+                {sheet: tuple(cards) for sheet, cards in by_exam_sheet.items()}
+            ),
+        )
+
+    def list_all(self) -> list[Card]:
+        return list(self.cards)
+
+    def get_by_id(self, card_id: str) -> Card | None:
+        return self._by_id.get(card_id)
+
+    def get_by_tags(self, tags: Iterable[str]) -> list[Card]:
+        """Return cards having at least one of ``tags``, in catalogue order."""
+        positions: set[int] = set()
+        for tag in tags:
+            positions.update(self._by_tag.get(tag, ()))
+        return [self.cards[position] for position in sorted(positions)]
+
+    def get_by_exam_sheet(self, sheet_number: int) -> list[Card]:
+        return list(self._by_exam_sheet.get(sheet_number, ()))
+
+    def count_by_exam_sheet(self) -> dict[int, int]:
+        return {sheet: len(cards) for sheet, cards in self._by_exam_sheet.items()}
@@ -0,0 +1,63 @@
+"""Process-wide cache of the card catalogue.
+
+Cards only change when the seed script runs, which bumps the catalogue
+version. The cache keeps one immutable snapshot and reloads it only when
+the persisted version differs; the version itself is re-read at most once
+per check interval. Indexes derived from the cards are rebuilt through
+``on_reload``, in a worker thread so the event loop keeps serving.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from card.model.card_catalog import CardCatalog
+from card.service.card_catalog_source_port import CardCatalogSourcePort
+
+
+class CardCatalogCache:
+    """Holds the current CardCatalog snapshot and refreshes it on version bumps."""
+
+    def __init__(
+        self,
+        check_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        on_reload: Callable[[CardCatalog], None] | None = None,
+    ) -> None:
+        self._check_interval_seconds = max(0.0, check_interval_seconds)
+        self._clock = clock
+        self._on_reload = on_reload
+        self._catalog: CardCatalog | None = None
+        self._next_check = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def catalog(self) -> CardCatalog | None:
+        return self._catalog
+
+    async def get(self, source: CardCatalogSourcePort) -> CardCatalog:
+        """Return the current snapshot, reloading it from ``source`` if stale."""
+        if self._is_fresh():
+            return self._catalog
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._catalog
+
+            version = await source.get_version()
+            if self._catalog is None or self._catalog.version != version:
+                catalog = await source.load()
+                if self._on_reload is not None:
+                    await asyncio.to_thread(self._on_reload, catalog)
+                self._catalog = catalog
+            self._next_check = self._clock() + self._check_interval_seconds
+            return self._catalog
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next ``get`` reloads it."""
+        self._catalog = None
+
+    def _is_fresh(self) -> bool:
+        return self._catalog is not None and self._clock() < self._next_check
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from card.model.card_catalog import CardCatalog
+
+
+class CardCatalogSourcePort(Protocol):
+    """Port for reading the persisted card catalogue and its version."""
+
+    async def get_version(self) -> int:
+        """Return the current catalogue version."""
+        ...
+
+    async def load(self) -> CardCatalog:
+        """Load every card into a new catalogue snapshot."""
+        ...
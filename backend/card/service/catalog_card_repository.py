@@ -0,0 +1,35 @@
+"""In-memory implementation of CardRepositoryPort backed by a CardCatalog."""
+
+from __future__ import annotations
+
+from card.model.card import Card
+from card.model.card_catalog import CardCatalog
+
+
+class CatalogCardRepository:
+    """Implements CardRepositoryPort on top of an immutable catalogue snapshot."""
+
+    def __init__(self, catalog: CardCatalog) -> None:
+        self._catalog = catalog
+
+    async def list_all(self) -> list[Card]:
+        """Return all cards."""
+        return self._catalog.list_all()
+
+    async def get_by_id(self, card_id: str) -> Card | None:
+        """Return the card with the given ID, or None if not found."""
+        return self._catalog.get_by_id(card_id)
+
+    async def get_by_tags(self, tags: list[str]) -> list[Card]:
+        """Return all cards that have at least one of the given tags."""
+        return self._catalog.get_by_tags(tags)
+
+    async def get_by_exam_sheet(self, sheet_number: int) -> list[Card]:
+        """Return the cards on the given exam sheet, ordered by card ID."""
+        cards = self._catalog.get_by_exam_sheet(sheet_number)
+        cards.sort(key=lambda card: card.card_id)
+        return cards
+
+    async def count_by_exam_sheet(self) -> dict[int, int]:
+        """Return the number of cards per exam sheet."""
+        return self._catalog.count_by_exam_sheet()
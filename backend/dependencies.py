@@ -7,34 +7,122 @@ so toggling AI in the settings page takes effect without restarting the server.
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import logging
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import timezone, tzinfo
+from zoneinfo import ZoneInfo
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from card.db.card_repository import CardRepository
-from database import async_session_factory
+from card.db.card_catalog_repository import CardCatalogRepository
+from card.model.card_catalog import CardCatalog
+from card.service.card_catalog_cache import CardCatalogCache
+from card.service.catalog_card_repository import CatalogCardRepository
+from database import async_session_factory, engine
+from evaluation.db.grading_job_repository import GradingJobRepository
+from evaluation.model.grading_job import GradingJob, GradingProgress
+from evaluation.service.circuit_breaker import CircuitBreaker
+from evaluation.service.evaluation_executor import EvaluationExecutor
+from evaluation.service.evaluation_memory_cache import EvaluationMemoryCache
+from evaluation.service.grading_job_service import GradingJobService
+from evaluation.service.openai_client_registry import OpenAiClientRegistry
+from exam.db.evaluation_cache_repository import EvaluationCacheRepository
 from exam.db.exam_repository import ExamRepository
+from exam.model.exam_result import ExamEvaluation
+from exam.service.caching_exam_evaluator import CachingExamEvaluator
+from exam.service.cascading_exam_evaluator import CascadingExamEvaluator, GradingCascadeStats
 from exam.service.exam_service import ExamService
 from exam.service.heuristic_exam_evaluator import HeuristicExamEvaluator
 from exam.service.openai_exam_evaluator import OpenAiExamEvaluator
+from exam.service.similarity_exam_evaluator import (
+    ReferenceVectorIndex,
+    SimilarityExamEvaluator,
+)
 from navigation.db.navigation_repository import NavigationRepository
 from navigation.service.heuristic_navigation_evaluator import HeuristicNavigationEvaluator
 from navigation.service.navigation_service import NavigationService
 from navigation.service.openai_navigation_evaluator import OpenAiNavigationEvaluator
 from scheduling.db.scheduling_repository import SchedulingRepository
 from scheduling.service.scheduling_service import SchedulingService
+from settings.db.settings_change_listener import SettingsChangeListener
 from settings.db.settings_repository import SettingsRepository
 from settings.model.app_settings import AppSettings
+from settings.service.settings_cache import SettingsCache
 from settings.service.settings_service import SettingsService
+from study.db.daily_activity_repository import DailyActivityRepository
+from study.db.study_queue_repository import StudyQueueRepository
 from study.service.exam_evaluator_adapter import ExamBackedStudyAnswerEvaluator
 from study.service.study_service import StudyService
 from transcription.service.audio_transcription_service import AudioTranscriptionService
 from transcription.service.openai_audio_transcriber import OpenAiAudioTranscriber
 
+logger = logging.getLogger(__name__)
+
 OPENAI_CHAT_TIMEOUT_SECONDS = 25.0
+# Upper bound per answer during submit; slightly above the OpenAI client timeout.
+EVALUATION_TIMEOUT_SECONDS = 30.0
 OPENAI_TRANSCRIPTION_TIMEOUT_SECONDS = 30.0
 TRANSCRIPTION_DEFAULT_LANGUAGE = "de"
 TRANSCRIPTION_MAX_FILE_BYTES = 10 * 1024 * 1024
+CARD_CATALOG_VERSION_CHECK_SECONDS = 30.0
+EVALUATION_CACHE_MAX_ENTRIES = 4096
+EVALUATION_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+# Process-wide LRU in front of the evaluation_cache table.
+EVALUATION_MEMORY_CACHE: EvaluationMemoryCache[ExamEvaluation] = EvaluationMemoryCache(
+    max_entries=EVALUATION_CACHE_MAX_ENTRIES,
+    ttl_seconds=EVALUATION_CACHE_TTL_SECONDS,
+)
+
+
+# Settings are read on nearly every request; updates invalidate this copy
+# locally and, via LISTEN/NOTIFY, in every other worker.
+SETTINGS_CACHE = SettingsCache()
+SETTINGS_CHANGE_LISTENER = SettingsChangeListener(engine, SETTINGS_CACHE.invalidate)
+
+# Long-lived OpenAI clients, so grading calls reuse pooled connections.
+OPENAI_CLIENTS = OpenAiClientRegistry()
+
+# Shared by the exam and navigation evaluators: both call the same provider.
+# Hedged duplicate requests are opt-in as they cost extra completions.
+OPENAI_CHAT_CIRCUIT_BREAKER = CircuitBreaker(
+    hedge=os.getenv("OPENAI_HEDGED_REQUESTS", "").lower() in {"1", "true", "yes", "on"},
+)
+
+# Process-wide counts of answers the grading cascade kept away from the LLM.
+GRADING_CASCADE_STATS = GradingCascadeStats()
+
+# Grader used without AI: "heuristic" (keyword rubric) or "similarity"
+# (TF-IDF n-gram similarity against REFERENCE_VECTORS, rebuilt on every
+# catalogue reload).
+OFFLINE_EXAM_EVALUATOR = os.getenv("OFFLINE_EXAM_EVALUATOR", "heuristic").strip().lower()
+REFERENCE_VECTORS = ReferenceVectorIndex()
+
+
+def _rebuild_reference_vectors(catalog: CardCatalog) -> None:
+    if OFFLINE_EXAM_EVALUATOR == "similarity":
+        REFERENCE_VECTORS.build((card.short_answer, card.answer.text) for card in catalog.cards)
+
+
+# Shared by every request in this process; reloaded when the seed script
+# bumps the catalogue version.
+CARD_CATALOG_CACHE = CardCatalogCache(
+    check_interval_seconds=CARD_CATALOG_VERSION_CHECK_SECONDS,
+    on_reload=_rebuild_reference_vectors,
+)
+
+
+def _get_activity_timezone() -> tzinfo:
+    """Time zone whose calendar days count towards streaks and reviewed_today."""
+    name = os.getenv("STUDY_ACTIVITY_TIMEZONE", "UTC").strip()
+    if not name or name.upper() == "UTC":
+        return timezone.utc
+    return ZoneInfo(name)
+
+
+STUDY_ACTIVITY_TIMEZONE = _get_activity_timezone()
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -48,21 +136,62 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def load_card_catalog(session: AsyncSession) -> CardCatalog:
+    return await CARD_CATALOG_CACHE.get(CardCatalogRepository(session))
+
+
 async def get_settings_service(session: AsyncSession) -> SettingsService:
-    return SettingsService(SettingsRepository(session))
+    return SettingsService(SettingsRepository(session), cache=SETTINGS_CACHE)
 
 
 async def _read_settings(session: AsyncSession) -> AppSettings:
-    return await (await get_settings_service(session)).get()
+    settings = await (await get_settings_service(session)).get()
+    # Drop pooled clients whose API key or endpoint is no longer configured.
+    await OPENAI_CLIENTS.retain(
+        settings.openai_api_key if settings.ai_ready else None,
+        settings.openai_base_url,
+    )
+    return settings
 
 
-def _build_exam_evaluator(settings: AppSettings):
+def _build_exam_evaluator(settings: AppSettings, session: AsyncSession):
     if not settings.ai_ready:
-        return HeuristicExamEvaluator()
-    return OpenAiExamEvaluator(
-        api_key=settings.openai_api_key or "",
-        model=settings.openai_chat_model,
-        timeout_seconds=OPENAI_CHAT_TIMEOUT_SECONDS,
+        return _with_evaluation_cache(_build_offline_exam_evaluator(), session)
+    # Only answers the heuristic cannot settle reach the (cached) LLM.
+    return CascadingExamEvaluator(
+        heuristic=HeuristicExamEvaluator(),
+        escalate_to=_with_evaluation_cache(
+            OpenAiExamEvaluator(
+                api_key=settings.openai_api_key or "",
+                model=settings.openai_chat_model,
+                timeout_seconds=OPENAI_CHAT_TIMEOUT_SECONDS,
+                client=OPENAI_CLIENTS.get(
+                    settings.openai_api_key or "",
+                    OPENAI_CHAT_TIMEOUT_SECONDS,
+                    settings.openai_base_url,
+                ),
+                circuit_breaker=OPENAI_CHAT_CIRCUIT_BREAKER,
+            ),
+            session,
+        ),
+        low_coverage=settings.grading_cascade_low_coverage,
+        high_coverage=settings.grading_cascade_high_coverage,
+        stats=GRADING_CASCADE_STATS,
+    )
+
+
+def _build_offline_exam_evaluator():
+    if OFFLINE_EXAM_EVALUATOR == "similarity":
+        return SimilarityExamEvaluator(REFERENCE_VECTORS)
+    return HeuristicExamEvaluator()
+
+
+def _with_evaluation_cache(evaluator, session: AsyncSession) -> CachingExamEvaluator:
+    return CachingExamEvaluator(
+        inner=evaluator,
+        memory=EVALUATION_MEMORY_CACHE,
+        store=EvaluationCacheRepository(session),
+        ttl_seconds=EVALUATION_CACHE_TTL_SECONDS,
     )
 
 
@@ -73,6 +202,19 @@ def _build_navigation_evaluator(settings: AppSettings):
         api_key=settings.openai_api_key or "",
         model=settings.openai_chat_model,
         timeout_seconds=OPENAI_CHAT_TIMEOUT_SECONDS,
+        client=OPENAI_CLIENTS.get(
+            settings.openai_api_key or "",
+            OPENAI_CHAT_TIMEOUT_SECONDS,
+            settings.openai_base_url,
+        ),
+        circuit_breaker=OPENAI_CHAT_CIRCUIT_BREAKER,
+    )
+
+
+def _build_evaluation_executor(settings: AppSettings) -> EvaluationExecutor:
+    return EvaluationExecutor(
+        max_concurrency=settings.evaluation_concurrency,
+        timeout_seconds=EVALUATION_TIMEOUT_SECONDS,
     )
 
 
@@ -83,6 +225,11 @@ def _build_audio_transcription_service(settings: AppSettings) -> AudioTranscript
             api_key=settings.openai_api_key or "",
             model=settings.openai_transcription_model,
             timeout_seconds=OPENAI_TRANSCRIPTION_TIMEOUT_SECONDS,
+            client=OPENAI_CLIENTS.get(
+                settings.openai_api_key or "",
+                OPENAI_TRANSCRIPTION_TIMEOUT_SECONDS,
+                settings.openai_base_url,
+            ),
         )
     return AudioTranscriptionService(
         transcriber=transcriber,
@@ -94,30 +241,149 @@ def _build_audio_transcription_service(settings: AppSettings) -> AudioTranscript
 async def get_study_service(session: AsyncSession) -> StudyService:
     settings = await _read_settings(session)
     return StudyService(
-        card_repo=CardRepository(session),
+        card_repo=await get_card_repository(session),
         scheduling_repo=SchedulingRepository(session),
+        queue_repo=StudyQueueRepository(session),
+        activity_repo=DailyActivityRepository(session),
         scheduling_service=SchedulingService(),
-        answer_evaluator=ExamBackedStudyAnswerEvaluator(_build_exam_evaluator(settings)),
+        answer_evaluator=ExamBackedStudyAnswerEvaluator(
+            _build_exam_evaluator(settings, session)
+        ),
+        activity_timezone=STUDY_ACTIVITY_TIMEZONE,
     )
 
 
-async def get_exam_service(session: AsyncSession) -> ExamService:
+async def get_exam_service(
+    session: AsyncSession,
+    evaluation_session: AsyncSession | None = None,
+) -> ExamService:
+    """Build the exam service; ``evaluation_session`` backs the evaluation cache
+    when grading must not share ``session`` (see ExamService.submit_session)."""
     settings = await _read_settings(session)
     return ExamService(
         exam_repo=ExamRepository(session),
-        card_repo=CardRepository(session),
-        evaluator=_build_exam_evaluator(settings),
+        card_repo=await get_card_repository(session),
+        evaluator=_build_exam_evaluator(settings, evaluation_session or session),
+        evaluation_executor=_build_evaluation_executor(settings),
+        background_grading=settings.exam_background_grading,
     )
 
 
+async def grade_exam_answer_in_background(
+    session_id: str,
+    card_id: str,
+    student_answer: str,
+) -> None:
+    """Background job: speculatively grade a saved exam answer.
+
+    Runs after the response was sent, so it opens its own DB session.
+    Failures are logged and swallowed; submit grades the answer instead.
+    """
+    async with async_session_factory() as session:
+        try:
+            exam_service = await get_exam_service(session)
+            await exam_service.grade_saved_answer(session_id, card_id, student_answer)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            logger.warning(
+                "Background grading failed for %s/%s", session_id, card_id, exc_info=True
+            )
+
+
 async def get_navigation_service(session: AsyncSession) -> NavigationService:
     settings = await _read_settings(session)
     return NavigationService(
         repository=NavigationRepository(session),
         evaluator=_build_navigation_evaluator(settings),
+        evaluation_executor=_build_evaluation_executor(settings),
     )
 
 
+async def get_grading_job_service(session: AsyncSession) -> GradingJobService:
+    return GradingJobService(GradingJobRepository(session))
+
+
+Checkpoint = Callable[[], Awaitable[None]]
+
+
+async def _run_submit_job(
+    job_id: str,
+    submit: Callable[[AsyncSession, AsyncSession, str, Checkpoint], Awaitable[object]],
+) -> None:
+    """Grade and finalize the session of a submit job.
+
+    Runs after the 202 response was sent, so it opens its own DB sessions: one
+    for the answers, committed after every graded answer so the events stream
+    sees progress, and one for the evaluators, which run alongside those writes.
+    """
+    async with (
+        async_session_factory() as session,
+        async_session_factory() as evaluation_session,
+    ):
+        jobs = await get_grading_job_service(session)
+        try:
+            job = await jobs.mark_running(job_id)
+            await session.commit()
+
+            async def checkpoint() -> None:
+                await jobs.heartbeat(job_id)
+                await session.commit()
+
+            await submit(session, evaluation_session, job.session_id, checkpoint)
+            await evaluation_session.commit()
+            await jobs.mark_completed(job_id)
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            await evaluation_session.rollback()
+            logger.warning("Submit job %s failed", job_id, exc_info=True)
+            await jobs.mark_failed(job_id, str(exc) or type(exc).__name__)
+            await session.commit()
+
+
+async def _read_grading_progress(
+    job_id: str,
+    read: Callable[[AsyncSession, str], Awaitable[GradingProgress]],
+) -> tuple[GradingJob, GradingProgress] | None:
+    """Read a job and its session's progress in a fresh DB session."""
+    async with async_session_factory() as session:
+        job = await GradingJobRepository(session).get(job_id)
+        if job is None:
+            return None
+        return job, await read(session, job.session_id)
+
+
+async def run_exam_submit_job(job_id: str) -> None:
+    async def submit(session, evaluation_session, session_id, checkpoint):
+        exam_service = await get_exam_service(session, evaluation_session)
+        return await exam_service.submit_session(session_id, checkpoint=checkpoint)
+
+    await _run_submit_job(job_id, submit)
+
+
+async def read_exam_grading_progress(job_id: str):
+    async def read(session, session_id):
+        return await (await get_exam_service(session)).get_grading_progress(session_id)
+
+    return await _read_grading_progress(job_id, read)
+
+
+async def run_navigation_submit_job(job_id: str) -> None:
+    async def submit(session, _evaluation_session, session_id, checkpoint):
+        service = await get_navigation_service(session)
+        return await service.submit_session(session_id, checkpoint=checkpoint)
+
+    await _run_submit_job(job_id, submit)
+
+
+async def read_navigation_grading_progress(job_id: str):
+    async def read(session, session_id):
+        return await (await get_navigation_service(session)).get_grading_progress(session_id)
+
+    return await _read_grading_progress(job_id, read)
+
+
 async def get_audio_transcription_service(
     session: AsyncSession,
 ) -> AudioTranscriptionService:
@@ -125,5 +391,5 @@ async def get_audio_transcription_service(
     return _build_audio_transcription_service(settings)
 
 
-async def get_card_repository(session: AsyncSession) -> CardRepository:
-    return CardRepository(session)
+async def get_card_repository(session: AsyncSession) -> CatalogCardRepository:
+    return CatalogCardRepository(await load_card_catalog(session))
@@ -0,0 +1,65 @@
+"""FastAPI router exposing the state of the AI evaluation layer."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from evaluation.service.circuit_breaker import CircuitBreaker, CircuitBreakerSnapshot
+
+router = APIRouter(tags=["Evaluation"])
+
+
+class CircuitBreakerOut(BaseModel):
+    state: str
+    consecutive_failures: int
+    calls: int
+    failures: int
+    slow_calls: int
+    rejected_calls: int
+    hedged_calls: int
+    hedge_wins: int
+    p95_latency_seconds: Optional[float] = None
+    seconds_until_probe: Optional[float] = None
+
+
+class EvaluationMetricsOut(BaseModel):
+    openai_chat: CircuitBreakerOut
+
+
+# -- Dependency injection placeholder -------------------------------------
+
+
+def get_openai_chat_circuit_breaker() -> CircuitBreaker:
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
+# -- Endpoints -------------------------------------------------------------
+
+
+@router.get("/evaluation/metrics", response_model=EvaluationMetricsOut)
+async def get_evaluation_metrics(
+    breaker: CircuitBreaker = Depends(get_openai_chat_circuit_breaker),
+) -> EvaluationMetricsOut:
+    """Circuit state and latency of the OpenAI grading calls in this worker."""
+    return EvaluationMetricsOut(openai_chat=_snapshot_to_out(breaker.snapshot()))
+
+
+# -- Helpers ---------------------------------------------------------------
+
+
+def _snapshot_to_out(snapshot: CircuitBreakerSnapshot) -> CircuitBreakerOut:
+    return CircuitBreakerOut(
+        state=snapshot.state.value,
+        consecutive_failures=snapshot.consecutive_failures,
+        calls=snapshot.calls,
+        failures=snapshot.failures,
+        slow_calls=snapshot.slow_calls,
+        rejected_calls=snapshot.rejected_calls,
+        hedged_calls=snapshot.hedged_calls,
+        hedge_wins=snapshot.hedge_wins,
+        p95_latency_seconds=snapshot.p95_latency_seconds,
+        seconds_until_probe=snapshot.seconds_until_probe,
+    )
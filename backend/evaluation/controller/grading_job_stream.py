@@ -0,0 +1,106 @@
+"""Shared pieces of the asynchronous submit endpoints.
+
+The exam and navigation routers both start a submit job and stream its
+progress as Server-Sent Events. Progress is read from the database on every
+poll, so a client that reconnects gets everything graded so far replayed
+and then continues with the live updates. A job whose runner stopped
+reporting progress (crash, restart) ends the stream with an error; submitting
+again resumes it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from evaluation.model.grading_job import GradingJob, GradingJobStatus, GradingProgress
+from evaluation.service.grading_job_service import DEFAULT_STALE_AFTER_SECONDS
+
+DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+
+QuestionT = TypeVar("QuestionT")
+ResultT = TypeVar("ResultT")
+
+# Reads (job, progress) for a job ID in a fresh DB session; None if unknown.
+GradingProgressReader = Callable[
+    [str],
+    Awaitable[Optional[tuple[GradingJob, GradingProgress[Any, Any]]]],
+]
+GradingJobRunner = Callable[[str], Awaitable[None]]
+
+
+class GradingJobOut(BaseModel):
+    job_id: str
+    session_id: str
+    status: str
+    error: Optional[str] = None
+    created_at: str
+    updated_at: str
+
+
+def job_to_out(job: GradingJob) -> GradingJobOut:
+    return GradingJobOut(
+        job_id=job.id,
+        session_id=job.session_id,
+        status=job.status.value,
+        error=job.error,
+        created_at=job.created_at.isoformat(),
+        updated_at=job.updated_at.isoformat(),
+    )
+
+
+def format_sse(event: str, data: BaseModel | dict, event_id: str | None = None) -> str:
+    payload = data.model_dump_json() if isinstance(data, BaseModel) else json.dumps(data)
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {payload}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def grading_events(
+    job_id: str,
+    read_progress: GradingProgressReader,
+    question_key: Callable[[QuestionT], str],
+    question_to_out: Callable[[QuestionT], BaseModel],
+    result_to_out: Callable[[ResultT], BaseModel],
+    poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS,
+    clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+) -> AsyncIterator[str]:
+    """Yield ``question`` events as answers are graded, then ``result`` or ``error``."""
+    stale_after = timedelta(seconds=stale_after_seconds)
+    sent: set[str] = set()
+    while True:
+        snapshot = await read_progress(job_id)
+        if snapshot is None:
+            yield format_sse("error", {"detail": f"Grading job {job_id!r} not found"})
+            return
+        job, progress = snapshot
+
+        for question in progress.questions:
+            key = question_key(question)
+            if key in sent:
+                continue
+            sent.add(key)
+            yield format_sse("question", question_to_out(question), event_id=key)
+
+        if progress.result is not None:
+            yield format_sse("result", result_to_out(progress.result))
+            return
+        if job.status == GradingJobStatus.FAILED:
+            yield format_sse("error", {"detail": job.error or "Grading failed"})
+            return
+        if job.is_stale(clock(), stale_after):
+            yield format_sse(
+                "error",
+                {"detail": "Grading stopped making progress; submit again to resume"},
+            )
+            return
+
+        await asyncio.sleep(poll_interval_seconds)
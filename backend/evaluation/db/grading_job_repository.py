@@ -0,0 +1,75 @@
+"""Async PostgreSQL implementation of GradingJobRepositoryPort."""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from evaluation.db.grading_job_table import GradingJobRow
+from evaluation.model.grading_job import GradingJob, GradingJobKind, GradingJobStatus
+
+
+class GradingJobRepository:
+    """Repository adapter for the ``grading_jobs`` table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, job_id: str) -> GradingJob | None:
+        stmt = select(GradingJobRow).where(GradingJobRow.id == job_id)
+        row = (await self._session.execute(stmt)).scalar_one_or_none()
+        return _to_domain(row) if row is not None else None
+
+    async def get_for_session(self, kind: GradingJobKind, session_id: str) -> GradingJob | None:
+        stmt = select(GradingJobRow).where(
+            GradingJobRow.kind == kind.value,
+            GradingJobRow.session_id == session_id,
+        )
+        row = (await self._session.execute(stmt)).scalar_one_or_none()
+        return _to_domain(row) if row is not None else None
+
+    async def create_if_absent(self, job: GradingJob) -> bool:
+        stmt = (
+            insert(GradingJobRow)
+            .values(
+                id=job.id,
+                kind=job.kind.value,
+                session_id=job.session_id,
+                status=job.status.value,
+                error=job.error,
+                created_at=job.created_at,
+                updated_at=job.updated_at,
+            )
+            .on_conflict_do_nothing(constraint="uq_grading_jobs_kind_session")
+            .returning(GradingJobRow.id)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def save(self, job: GradingJob) -> None:
+        await self._session.merge(_to_row(job))
+
+
+def _to_domain(row: GradingJobRow) -> GradingJob:
+    return GradingJob(
+        id=row.id,
+        kind=GradingJobKind(row.kind),
+        session_id=row.session_id,
+        status=GradingJobStatus(row.status),
+        error=row.error,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+def _to_row(job: GradingJob) -> GradingJobRow:
+    return GradingJobRow(
+        id=job.id,
+        kind=job.kind.value,
+        session_id=job.session_id,
+        status=job.status.value,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
@@ -0,0 +1,28 @@
+"""SQLAlchemy ORM model for asynchronous submit jobs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class GradingJobRow(Base):
+    """Persistent state of one asynchronous exam or navigation submit."""
+
+    __tablename__ = "grading_jobs"
+    __table_args__ = (
+        UniqueConstraint("kind", "session_id", name="uq_grading_jobs_kind_session"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    session_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,13 @@
+from evaluation.model.grading_job import (
+    GradingJob,
+    GradingJobKind,
+    GradingJobStatus,
+    GradingProgress,
+)
+
+__all__ = [
+    "GradingJob",
+    "GradingJobKind",
+    "GradingJobStatus",
+    "GradingProgress",
+]
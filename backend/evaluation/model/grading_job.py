@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
+from typing import Generic, TypeVar
+from uuid import uuid4
+
+QuestionT = TypeVar("QuestionT")
+ResultT = TypeVar("ResultT")
+
+
+class GradingJobKind(StrEnum):
+    """Which kind of session a grading job submits."""
+
+    EXAM = "exam"
+    NAVIGATION = "navigation"
+
+
+class GradingJobStatus(StrEnum):
+    """Lifecycle state for an asynchronous submit."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class GradingJob:
+    """Persistent record of an asynchronous submit; one per session."""
+
+    kind: GradingJobKind
+    session_id: str
+    id: str = field(default_factory=lambda: str(uuid4()))
+    status: GradingJobStatus = GradingJobStatus.PENDING
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (GradingJobStatus.COMPLETED, GradingJobStatus.FAILED)
+
+    def is_stale(self, now: datetime, stale_after: timedelta) -> bool:
+        """True if the job is unfinished but its runner stopped reporting progress."""
+        return not self.is_finished and now - self.updated_at >= stale_after
+
+
+@dataclass(frozen=True)
+class GradingProgress(Generic[QuestionT, ResultT]):
+    """Questions graded so far, plus the full result once the session is evaluated."""
+
+    questions: list[QuestionT]
+    result: ResultT | None = None
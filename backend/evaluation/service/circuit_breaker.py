@@ -0,0 +1,218 @@
+"""Circuit breaker with optional request hedging for the AI provider.
+
+When the provider is down or very slow, every answer would otherwise wait
+for the full client timeout before its evaluator falls back to the
+heuristic. The breaker counts consecutive failures and slow calls; once the
+threshold is hit it opens and rejects calls immediately with
+``CircuitOpenError``, which the evaluators treat like any other provider
+error. After ``open_seconds`` a single probe call is let through
+(half-open); its outcome closes the circuit again or re-opens it.
+
+With hedging enabled, a call still running after the observed p95 latency
+gets a duplicate request; whichever finishes first wins and the other is
+cancelled. This trims the latency tail at the cost of a few extra calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_SLOW_CALL_SECONDS = 15.0
+DEFAULT_OPEN_SECONDS = 30.0
+DEFAULT_LATENCY_WINDOW = 100
+# Hedging starts only once the p95 is based on enough samples.
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+
+T = TypeVar("T")
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the provider while the circuit is open."""
+
+
+@dataclass(frozen=True)
+class CircuitBreakerSnapshot:
+    """Point-in-time view of a breaker, for the metrics endpoint."""
+
+    state: CircuitState
+    consecutive_failures: int
+    calls: int
+    failures: int
+    slow_calls: int
+    rejected_calls: int
+    hedged_calls: int
+    hedge_wins: int
+    p95_latency_seconds: float | None
+    seconds_until_probe: float | None
+
+
+class CircuitBreaker:
+    """Guards calls to one provider; share a single instance per provider."""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        slow_call_seconds: float = DEFAULT_SLOW_CALL_SECONDS,
+        open_seconds: float = DEFAULT_OPEN_SECONDS,
+        hedge: bool = False,
+        latency_window: int = DEFAULT_LATENCY_WINDOW,
+        hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._slow_call_seconds = slow_call_seconds
+        self._open_seconds = open_seconds
+        self._hedge = hedge
+        self._hedge_min_samples = hedge_min_samples
+        self._clock = clock
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        self._calls = 0
+        self._failures = 0
+        self._slow_calls = 0
+        self._rejected_calls = 0
+        self._hedged_calls = 0
+        self._hedge_wins = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run ``operation`` through the breaker.
+
+        ``operation`` is a factory so a hedged duplicate can be started.
+        """
+        is_probe = self._admit()
+        started = self._clock()
+        try:
+            result = await self._run(operation)
+        except asyncio.CancelledError:
+            if is_probe:
+                self._probe_in_flight = False
+            raise
+        except Exception:
+            self._record_failure(is_probe)
+            raise
+
+        elapsed = self._clock() - started
+        self._latencies.append(elapsed)
+        if elapsed >= self._slow_call_seconds:
+            self._slow_calls += 1
+            self._record_failure(is_probe)
+        else:
+            self._record_success()
+        return result
+
+    def snapshot(self) -> CircuitBreakerSnapshot:
+        seconds_until_probe = None
+        if self._state == CircuitState.OPEN:
+            remaining = self._opened_at + self._open_seconds - self._clock()
+            seconds_until_probe = max(0.0, remaining)
+        return CircuitBreakerSnapshot(
+            state=self._state,
+            consecutive_failures=self._consecutive_failures,
+            calls=self._calls,
+            failures=self._failures,
+            slow_calls=self._slow_calls,
+            rejected_calls=self._rejected_calls,
+            hedged_calls=self._hedged_calls,
+            hedge_wins=self._hedge_wins,
+            p95_latency_seconds=self._p95(),
+            seconds_until_probe=seconds_until_probe,
+        )
+
+    def _admit(self) -> bool:
+        """Raise if the call must be rejected; return True for a half-open probe."""
+        if self._state == CircuitState.OPEN:
+            if self._clock() - self._opened_at < self._open_seconds:
+                self._rejected_calls += 1
+                raise CircuitOpenError("AI provider circuit is open")
+            self._state = CircuitState.HALF_OPEN
+            logger.info("AI provider circuit half-open; probing")
+        if self._state == CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                self._rejected_calls += 1
+                raise CircuitOpenError("AI provider circuit is probing")
+            self._probe_in_flight = True
+            self._calls += 1
+            return True
+        self._calls += 1
+        return False
+
+    def _record_success(self) -> None:
+        self._consecutive_failures = 0
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info("AI provider circuit closed")
+        self._state = CircuitState.CLOSED
+        self._probe_in_flight = False
+
+    def _record_failure(self, is_probe: bool) -> None:
+        self._failures += 1
+        self._consecutive_failures += 1
+        if is_probe or self._consecutive_failures >= self._failure_threshold:
+            if self._state != CircuitState.OPEN:
+                logger.warning(
+                    "AI provider circuit opened after %d failing or slow calls",
+                    self._consecutive_failures,
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+        if is_probe:
+            self._probe_in_flight = False
+
+    async def _run(self, operation: Callable[[], Awaitable[T]]) -> T:
+        hedge_after = self._p95() if self._hedge else None
+        if hedge_after is None or len(self._latencies) < self._hedge_min_samples:
+            return await operation()
+
+        primary = asyncio.ensure_future(operation())
+        pending: set[asyncio.Future[T]] = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            if primary in done:
+                return primary.result()
+
+            self._hedged_calls += 1
+            pending.add(asyncio.ensure_future(operation()))
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is not primary:
+                            self._hedge_wins += 1
+                        return task.result()
+                    first_error = first_error or error
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _p95(self) -> float | None:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
@@ -0,0 +1,98 @@
+"""Bounded-concurrency runner shared by the exam and navigation submit flows.
+
+Evaluations of different answers are independent, so they are started
+together and limited by a semaphore. Each call gets its own timeout; a call
+that fails or times out is answered by the fallback instead, so one slow
+answer cannot fail a whole submission. Results keep the input order; callers
+that report progress can also be told about each result as it completes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+from settings.model.app_settings import DEFAULT_EVALUATION_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+RequestT = TypeVar("RequestT")
+ResultT = TypeVar("ResultT")
+
+
+class EvaluationExecutor:
+    """Runs independent evaluations concurrently under a semaphore."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_EVALUATION_CONCURRENCY,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        self._max_concurrency = max(1, max_concurrency)
+        self._timeout_seconds = timeout_seconds
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    async def map(
+        self,
+        requests: Sequence[RequestT],
+        evaluate: Callable[[RequestT], Awaitable[ResultT]],
+        fallback: Callable[[RequestT], Awaitable[ResultT]],
+        on_result: Callable[[int, ResultT], Awaitable[None]] | None = None,
+    ) -> list[ResultT]:
+        """Evaluate every request and return the results in request order.
+
+        ``on_result`` is awaited with (index, result) as soon as each request
+        finishes, in completion order. Errors it raises are not caught.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run_one(index: int, request: RequestT) -> ResultT:
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(evaluate(request), self._timeout_seconds)
+                except Exception:
+                    logger.warning("Evaluation failed; using fallback", exc_info=True)
+                    result = await fallback(request)
+            if on_result is not None:
+                await on_result(index, result)
+            return result
+
+        return list(
+            await asyncio.gather(
+                *(run_one(index, request) for index, request in enumerate(requests))
+            )
+        )
+
+    async def map_batched(
+        self,
+        requests: Sequence[RequestT],
+        evaluate_many: Callable[[list[RequestT]], Awaitable[list[ResultT]]],
+        fallback_many: Callable[[list[RequestT]], Awaitable[list[ResultT]]],
+        batch_size: int,
+        on_result: Callable[[int, ResultT], Awaitable[None]] | None = None,
+    ) -> list[ResultT]:
+        """Like ``map``, but hands the requests to the evaluator in batches.
+
+        ``on_result`` still receives one call per request, with the index
+        into ``requests``, once its batch has finished.
+        """
+        batch_size = max(1, batch_size)
+        batches = [
+            list(requests[start : start + batch_size])
+            for start in range(0, len(requests), batch_size)
+        ]
+
+        on_batch = None
+        if on_result is not None:
+
+            async def on_batch(batch_index: int, batch_results: list[ResultT]) -> None:
+                for offset, result in enumerate(batch_results):
+                    await on_result(batch_index * batch_size + offset, result)
+
+        results = await self.map(batches, evaluate_many, fallback_many, on_batch)
+        return [result for batch_results in results for result in batch_results]
@@ -0,0 +1,61 @@
+"""Process-wide LRU cache for evaluation results with TTL expiry."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+
+class EvaluationMemoryCache(Generic[ValueT]):
+    """Bounded LRU mapping of cache keys to results for one evaluator model.
+
+    Entries expire ``ttl_seconds`` after being stored. Binding a different
+    model clears the cache, since results of the old model are never reused.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, ValueT]] = OrderedDict()
+        self._model: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bind_model(self, model: str) -> bool:
+        """Switch to ``model``; return True (and clear) if it changed."""
+        if model == self._model:
+            return False
+        self._model = model
+        self._entries.clear()
+        return True
+
+    def get(self, key: str) -> ValueT | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: ValueT) -> None:
+        self._entries[key] = (self._clock() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
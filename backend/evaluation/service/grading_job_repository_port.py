@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from evaluation.model.grading_job import GradingJob, GradingJobKind
+
+
+class GradingJobRepositoryPort(Protocol):
+    """Port for persisted asynchronous submit jobs."""
+
+    async def get(self, job_id: str) -> GradingJob | None: ...
+
+    async def get_for_session(self, kind: GradingJobKind, session_id: str) -> GradingJob | None: ...
+
+    async def create_if_absent(self, job: GradingJob) -> bool:
+        """Insert ``job`` unless its session already has one; True if inserted."""
+        ...
+
+    async def save(self, job: GradingJob) -> None: ...
@@ -0,0 +1,101 @@
+"""Lifecycle of asynchronous submit jobs.
+
+A submit job is created once per session and persisted, so a client that
+reconnects, or submits again, is pointed at the existing job instead of
+starting a second grading run. A job that failed, or whose runner stopped
+reporting progress (e.g. the process was restarted), may be started again;
+answers graded by the earlier run are kept and not graded twice.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from evaluation.model.grading_job import GradingJob, GradingJobKind, GradingJobStatus
+from evaluation.service.grading_job_repository_port import GradingJobRepositoryPort
+
+# Runners record progress after every graded answer; a single answer is
+# bounded by the evaluation timeout, so this is far beyond a live runner.
+DEFAULT_STALE_AFTER_SECONDS = 300.0
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class GradingJobService:
+    """Creates, resumes, and records the state of submit jobs."""
+
+    def __init__(
+        self,
+        repository: GradingJobRepositoryPort,
+        stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self._repo = repository
+        self._stale_after = timedelta(seconds=stale_after_seconds)
+        self._clock = clock
+
+    async def start(self, kind: GradingJobKind, session_id: str) -> tuple[GradingJob, bool]:
+        """Return the session's job, creating it if needed.
+
+        The flag is True if the caller has to run the job: it was just
+        created, or the previous run failed or went stale.
+        """
+        now = self._clock()
+        job = GradingJob(kind=kind, session_id=session_id, created_at=now, updated_at=now)
+        if await self._repo.create_if_absent(job):
+            return job, True
+
+        existing = await self._repo.get_for_session(kind, session_id)
+        if existing is None:
+            raise ValueError(f"Grading job for session {session_id!r} not found")
+
+        if existing.status == GradingJobStatus.COMPLETED or not self._is_abandoned(existing, now):
+            return existing, False
+
+        existing.status = GradingJobStatus.PENDING
+        existing.error = None
+        existing.updated_at = now
+        await self._repo.save(existing)
+        return existing, True
+
+    async def get(self, kind: GradingJobKind, session_id: str, job_id: str) -> GradingJob:
+        job = await self._repo.get(job_id)
+        if job is None or job.kind != kind or job.session_id != session_id:
+            raise ValueError(f"Grading job {job_id!r} not found")
+        return job
+
+    async def mark_running(self, job_id: str) -> GradingJob:
+        return await self._update(job_id, GradingJobStatus.RUNNING)
+
+    async def heartbeat(self, job_id: str) -> None:
+        """Record that the runner is still making progress."""
+        await self._update(job_id, GradingJobStatus.RUNNING)
+
+    async def mark_completed(self, job_id: str) -> None:
+        await self._update(job_id, GradingJobStatus.COMPLETED)
+
+    async def mark_failed(self, job_id: str, error: str) -> None:
+        await self._update(job_id, GradingJobStatus.FAILED, error=error)
+
+    def _is_abandoned(self, job: GradingJob, now: datetime) -> bool:
+        if job.status == GradingJobStatus.FAILED:
+            return True
+        return job.is_stale(now, self._stale_after)
+
+    async def _update(
+        self,
+        job_id: str,
+        status: GradingJobStatus,
+        error: str | None = None,
+    ) -> GradingJob:
+        job = await self._repo.get(job_id)
+        if job is None:
+            raise ValueError(f"Grading job {job_id!r} not found")
+        job.status = status
+        job.error = error
+        job.updated_at = self._clock()
+        await self._repo.save(job)
+        return job
@@ -0,0 +1,87 @@
+"""Process-wide pool of long-lived OpenAI clients.
+
+One client per (api_key, timeout, base_url) keeps connections alive across requests.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class OpenAiClientRegistry:
+    """Hands out shared AsyncOpenAI clients keyed by (api_key, timeout, base_url)."""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry_seconds: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        http2: bool | None = None,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self._http2 = _http2_available() if http2 is None else http2
+        self._clients: dict[tuple[str, float, str | None], AsyncOpenAI] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(
+        self,
+        api_key: str,
+        timeout_seconds: float,
+        base_url: str | None = None,
+    ) -> AsyncOpenAI:
+        """``base_url`` None means the official OpenAI endpoint."""
+        key = (api_key, timeout_seconds, base_url)
+        client = self._clients.get(key)
+        if client is None or client.is_closed():
+            client = AsyncOpenAI(
+                api_key=api_key,
+                timeout=timeout_seconds,
+                base_url=base_url,
+                http_client=DefaultAsyncHttpxClient(http2=self._http2, limits=self._limits),
+            )
+            self._clients[key] = client
+        return client
+
+    async def retain(self, api_key: str | None, base_url: str | None = None) -> None:
+        """Close every client not using ``api_key`` at ``base_url`` (None closes all).
+
+        Requests still running on a closed client fall back like any API error.
+        """
+        stale = [
+            key
+            for key in self._clients
+            if api_key is None or (key[0], key[2]) != (api_key, base_url)
+        ]
+        for key in stale:
+            await self._close(key)
+
+    async def aclose(self) -> None:
+        for key in list(self._clients):
+            await self._close(key)
+
+    async def _close(self, key: tuple[str, float, str | None]) -> None:
+        client = self._clients.pop(key)
+        try:
+            await client.close()
+        except Exception:
+            logger.warning("Closing an OpenAI client failed", exc_info=True)
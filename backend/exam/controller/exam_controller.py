@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from evaluation.controller.grading_job_stream import (
+    GradingJobOut,
+    GradingJobRunner,
+    GradingProgressReader,
+    grading_events,
+    job_to_out,
+)
+from evaluation.model.grading_job import GradingJobKind
+from evaluation.service.grading_job_service import GradingJobService
+from exam.model.exam_result import ExamQuestionResult
 from exam.model.exam_session import ExamSessionDetails
 from exam.model.exam_template import ExamTemplate
+from exam.service.cascading_exam_evaluator import GradingCascadeStats
 from exam.service.exam_service import ExamService
 
 router = APIRouter(tags=["Exams"])
@@ -95,6 +108,13 @@ class ExamResultOut(BaseModel):
     questions: list[ExamQuestionResultOut]
 
 
+class GradingCascadeStatsOut(BaseModel):
+    heuristic_answers: int
+    escalated_answers: int
+    blank_answers: int
+    avoided_calls: int
+
+
 class ExamSessionHistoryOut(BaseModel):
     session_id: str
     sheet_number: int
@@ -114,6 +134,31 @@ def get_exam_service() -> ExamService:
     raise NotImplementedError("Must be overridden via app.dependency_overrides")
 
 
+ExamAnswerGrader = Callable[[str, str, str], Awaitable[None]]
+
+
+def get_exam_answer_grader() -> ExamAnswerGrader:
+    """Return a job grading (session_id, card_id, student_answer) in its own DB session."""
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
+def get_grading_cascade_stats() -> GradingCascadeStats:
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
+def get_grading_job_service() -> GradingJobService:
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
+def get_exam_submit_job_runner() -> GradingJobRunner:
+    """Return a job submitting the session of a grading job in its own DB session."""
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
+def get_exam_grading_progress_reader() -> GradingProgressReader:
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
 # -- Endpoints -------------------------------------------------------------
 
 
@@ -180,7 +225,9 @@ async def save_exam_answer(
     session_id: str,
     card_id: str,
     body: SaveAnswerIn,
+    background_tasks: BackgroundTasks,
     exam_service: ExamService = Depends(get_exam_service),
+    grade_answer: ExamAnswerGrader = Depends(get_exam_answer_grader),
 ) -> SaveAnswerOut:
     try:
         answer = await exam_service.save_answer(
@@ -191,6 +238,11 @@ async def save_exam_answer(
     except ValueError as exc:
         raise _error_for_service_exception(exc)
 
+    if exam_service.background_grading_enabled:
+        background_tasks.add_task(
+            grade_answer, answer.session_id, answer.card_id, answer.student_answer
+        )
+
     return SaveAnswerOut(
         session_id=answer.session_id,
         card_id=answer.card_id,
@@ -213,6 +265,80 @@ async def submit_exam_session(
     return _result_to_out(result)
 
 
+@router.post(
+    "/exam-sessions/{session_id}/submit-jobs",
+    response_model=GradingJobOut,
+    status_code=202,
+)
+async def start_exam_submit_job(
+    session_id: str,
+    background_tasks: BackgroundTasks,
+    exam_service: ExamService = Depends(get_exam_service),
+    job_service: GradingJobService = Depends(get_grading_job_service),
+    run_job: GradingJobRunner = Depends(get_exam_submit_job_runner),
+) -> GradingJobOut:
+    """Submit without waiting for grading; follow progress via the events stream.
+
+    Submitting again returns the existing job rather than grading twice.
+    """
+    try:
+        await exam_service.get_session_details(session_id=session_id)
+        job, needs_run = await job_service.start(GradingJobKind.EXAM, session_id)
+    except ValueError as exc:
+        raise _error_for_service_exception(exc)
+
+    if needs_run:
+        background_tasks.add_task(run_job, job.id)
+    return job_to_out(job)
+
+
+@router.get(
+    "/exam-sessions/{session_id}/submit-jobs/{job_id}",
+    response_model=GradingJobOut,
+)
+async def get_exam_submit_job(
+    session_id: str,
+    job_id: str,
+    job_service: GradingJobService = Depends(get_grading_job_service),
+) -> GradingJobOut:
+    try:
+        job = await job_service.get(GradingJobKind.EXAM, session_id, job_id)
+    except ValueError as exc:
+        raise _error_for_service_exception(exc)
+    return job_to_out(job)
+
+
+@router.get(
+    "/exam-sessions/{session_id}/submit-jobs/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_exam_submit_job(
+    session_id: str,
+    job_id: str,
+    job_service: GradingJobService = Depends(get_grading_job_service),
+    read_progress: GradingProgressReader = Depends(get_exam_grading_progress_reader),
+) -> StreamingResponse:
+    """Server-Sent Events: one ``question`` event per graded answer
+    (ExamQuestionResultOut), then ``result`` (ExamResultOut) or ``error``."""
+    try:
+        await job_service.get(GradingJobKind.EXAM, session_id, job_id)
+    except ValueError as exc:
+        raise _error_for_service_exception(exc)
+
+    return StreamingResponse(
+        grading_events(
+            job_id,
+            read_progress,
+            question_key=lambda question: str(question.question_number),
+            question_to_out=_question_result_to_out,
+            result_to_out=_result_to_out,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/exam-sessions/{session_id}/result", response_model=ExamResultOut)
 async def get_exam_result(
     session_id: str,
@@ -226,6 +352,19 @@ async def get_exam_result(
     return _result_to_out(result)
 
 
+@router.get("/exam-evaluation/stats", response_model=GradingCascadeStatsOut)
+async def read_grading_cascade_stats(
+    stats: GradingCascadeStats = Depends(get_grading_cascade_stats),
+) -> GradingCascadeStatsOut:
+    """How many answers the grading cascade settled without the LLM since startup."""
+    return GradingCascadeStatsOut(
+        heuristic_answers=stats.heuristic_answers,
+        escalated_answers=stats.escalated_answers,
+        blank_answers=stats.blank_answers,
+        avoided_calls=stats.avoided_calls,
+    )
+
+
 # -- Helpers ---------------------------------------------------------------
 
 
@@ -294,20 +433,21 @@ def _result_to_out(result) -> ExamResultOut:
         max_score=result.max_score,
         passed=result.passed,
         pass_score_threshold=result.pass_score_threshold,
-        questions=[
-            ExamQuestionResultOut(
-                question_number=question.question_number,
-                card_id=question.card_id,
-                question_text=question.question_text,
-                reference_short_answer=question.reference_short_answer,
-                student_answer=question.student_answer,
-                score=question.score,
-                is_correct=question.is_correct,
-                feedback=question.feedback,
-                errors=question.errors,
-            )
-            for question in result.questions
-        ],
+        questions=[_question_result_to_out(question) for question in result.questions],
+    )
+
+
+def _question_result_to_out(question: ExamQuestionResult) -> ExamQuestionResultOut:
+    return ExamQuestionResultOut(
+        question_number=question.question_number,
+        card_id=question.card_id,
+        question_text=question.question_text,
+        reference_short_answer=question.reference_short_answer,
+        student_answer=question.student_answer,
+        score=question.score,
+        is_correct=question.is_correct,
+        feedback=question.feedback,
+        errors=question.errors,
     )
 
 
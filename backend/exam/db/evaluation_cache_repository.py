@@ -0,0 +1,86 @@
+"""Async PostgreSQL implementation of EvaluationCacheRepositoryPort."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from exam.db.exam_tables import EvaluationCacheRow
+from exam.model.exam_result import ExamEvaluation
+
+
+class EvaluationCacheRepository:
+    """Repository adapter for the ``evaluation_cache`` table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_many(
+        self,
+        keys: Collection[str],
+        *,
+        stored_after: datetime,
+    ) -> dict[str, ExamEvaluation]:
+        if not keys:
+            return {}
+        stmt = select(EvaluationCacheRow).where(
+            EvaluationCacheRow.cache_key.in_(list(keys)),
+            EvaluationCacheRow.created_at > stored_after,
+        )
+        result = await self._session.execute(stmt)
+        return {
+            row.cache_key: ExamEvaluation(
+                score=row.score,
+                is_correct=row.is_correct,
+                feedback=row.feedback,
+                errors=list(row.errors or []),
+            )
+            for row in result.scalars().all()
+        }
+
+    async def put_many(
+        self,
+        model: str,
+        evaluations: dict[str, ExamEvaluation],
+        *,
+        expired_before: datetime,
+    ) -> None:
+        if not evaluations:
+            return
+        await self._session.execute(
+            delete(EvaluationCacheRow).where(EvaluationCacheRow.created_at <= expired_before)
+        )
+        stmt = insert(EvaluationCacheRow).values(
+            [
+                {
+                    "cache_key": key,
+                    "model": model,
+                    "score": evaluation.score,
+                    "is_correct": evaluation.is_correct,
+                    "feedback": evaluation.feedback,
+                    "errors": list(evaluation.errors),
+                }
+                for key, evaluation in evaluations.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EvaluationCacheRow.cache_key],
+            set_={
+                "model": stmt.excluded.model,
+                "score": stmt.excluded.score,
+                "is_correct": stmt.excluded.is_correct,
+                "feedback": stmt.excluded.feedback,
+                "errors": stmt.excluded.errors,
+                "created_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def delete_other_models(self, model: str) -> None:
+        await self._session.execute(
+            delete(EvaluationCacheRow).where(EvaluationCacheRow.model != model)
+        )
@@ -53,6 +53,7 @@ class ExamDbMapper:
             is_correct=row.is_correct,
             feedback=row.feedback,
             errors=list(row.errors or []),
+            graded_answer_hash=row.graded_answer_hash,
         )
 
     @staticmethod
@@ -68,4 +69,5 @@ class ExamDbMapper:
             is_correct=answer.is_correct,
             feedback=answer.feedback,
             errors=answer.errors,
+            graded_answer_hash=answer.graded_answer_hash,
         )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from exam.db.exam_db_mapper import ExamDbMapper
@@ -61,6 +61,34 @@ class ExamRepository:
     async def save_answer(self, answer: ExamAnswer) -> None:
         await self._session.merge(ExamDbMapper.answer_to_row(answer))
 
+    async def save_speculative_grade(self, answer: ExamAnswer) -> bool:
+        """Store a background grade unless the answer or session changed meanwhile.
+
+        Only the evaluation columns are written, and only while the stored
+        answer text is still the graded one and the session is in progress.
+        """
+        stmt = (
+            update(ExamAnswerRow)
+            .where(
+                ExamAnswerRow.id == answer.id,
+                ExamAnswerRow.student_answer == answer.student_answer,
+                exists().where(
+                    ExamSessionRow.id == ExamAnswerRow.session_id,
+                    ExamSessionRow.status == ExamSessionStatus.IN_PROGRESS.value,
+                ),
+            )
+            .values(
+                score=answer.score,
+                is_correct=answer.is_correct,
+                feedback=answer.feedback,
+                errors=answer.errors,
+                graded_answer_hash=answer.graded_answer_hash,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount > 0
+
     async def list_completed_sessions(self) -> list[ExamSession]:
         stmt = (
             select(ExamSessionRow)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -53,3 +53,24 @@ class ExamAnswerRow(Base):
     is_correct: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
     feedback: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     errors: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    graded_answer_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+
+class EvaluationCacheRow(Base):
+    """Cached evaluation keyed by a hash of the graded request and model."""
+
+    __tablename__ = "evaluation_cache"
+    __table_args__ = (
+        Index("ix_evaluation_cache_model", "model"),
+        Index("ix_evaluation_cache_created_at", "created_at"),
+    )
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(String(160), nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    is_correct: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    feedback: Mapped[str] = mapped_column(Text, nullable=False)
+    errors: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
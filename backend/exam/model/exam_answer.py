@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import uuid4
@@ -19,3 +22,15 @@ class ExamAnswer:
     is_correct: bool | None = None
     feedback: str | None = None
     errors: list[str] = field(default_factory=list)
+    # Hash of the answer text and grading context the stored evaluation belongs to.
+    graded_answer_hash: str | None = None
+
+    def has_grade_for(self, grade_hash: str) -> bool:
+        """True when the stored evaluation was made for ``grade_hash``."""
+        return self.score is not None and self.graded_answer_hash == grade_hash
+
+
+def answer_grade_hash(student_answer: str, context: Sequence[object]) -> str:
+    """Hash of an answer text and what graded it (evaluator, model, rubric)."""
+    material = json.dumps([student_answer.strip(), *context], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
@@ -12,6 +12,8 @@ class ExamEvaluation:
     is_correct: bool
     feedback: str
     errors: list[str] = field(default_factory=list)
+    # True when the configured backend failed and a fallback graded instead.
+    from_fallback: bool = False
 
 
 @dataclass(frozen=True)
@@ -1,9 +1,11 @@
 from exam.service.exam_service import ExamService
 from exam.service.heuristic_exam_evaluator import HeuristicExamEvaluator
 from exam.service.openai_exam_evaluator import OpenAiExamEvaluator
+from exam.service.similarity_exam_evaluator import SimilarityExamEvaluator
 
 __all__ = [
     "ExamService",
     "HeuristicExamEvaluator",
     "OpenAiExamEvaluator",
+    "SimilarityExamEvaluator",
 ]
@@ -0,0 +1,131 @@
+"""Result cache in front of any ExamEvaluatorPort.
+
+Identical gradings are looked up by a hash of everything that influences the
+result: question, reference answer, short-answer bullets, the normalized
+student answer, the evaluator model and the max score. Hits are served from
+a process-wide LRU first and from the ``evaluation_cache`` table second.
+Expired rows are purged whenever new results are stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import unicodedata
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from evaluation.service.evaluation_memory_cache import EvaluationMemoryCache
+from exam.model.exam_result import ExamEvaluation
+from exam.service.evaluation_cache_repository_port import EvaluationCacheRepositoryPort
+from exam.service.exam_evaluator_port import (
+    ExamEvaluationRequest,
+    ExamEvaluatorCapabilities,
+    ExamEvaluatorPort,
+)
+
+
+def normalize_answer(text: str) -> str:
+    """Case- and whitespace-insensitive form of a student answer."""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def evaluation_cache_key(request: ExamEvaluationRequest, model: str) -> str:
+    material = json.dumps(
+        [
+            request.question_text,
+            request.reference_answer,
+            request.short_answer,
+            normalize_answer(request.student_answer),
+            model,
+            request.max_score,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class CachingExamEvaluator:
+    """Implements ExamEvaluatorPort by caching the results of another evaluator.
+
+    Results produced by a fallback path are not cached. Deterministic
+    evaluators are cached in memory only, since recomputing them is cheaper
+    than a database round trip.
+    """
+
+    def __init__(
+        self,
+        inner: ExamEvaluatorPort,
+        memory: EvaluationMemoryCache[ExamEvaluation],
+        store: EvaluationCacheRepositoryPort | None,
+        ttl_seconds: float,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._inner = inner
+        self._memory = memory
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._clock = clock
+
+        capabilities = inner.capabilities()
+        self._model = f"{capabilities.provider}:{capabilities.model or '-'}"
+        self._store = None if capabilities.deterministic else store
+        # The store shares the request's DB session, which must not be used
+        # by concurrently running evaluations.
+        self._store_lock = asyncio.Lock()
+
+    async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        return (await self.evaluate_many([request]))[0]
+
+    async def evaluate_many(
+        self,
+        requests: list[ExamEvaluationRequest],
+    ) -> list[ExamEvaluation]:
+        await self._bind_model()
+        keys = [evaluation_cache_key(request, self._model) for request in requests]
+        found: dict[str, ExamEvaluation] = {}
+        for key in keys:
+            cached = self._memory.get(key)
+            if cached is not None:
+                found[key] = cached
+
+        if self._store is not None:
+            lookup = {key for key in keys if key not in found}
+            if lookup:
+                async with self._store_lock:
+                    stored = await self._store.get_many(
+                        lookup, stored_after=self._clock() - self._ttl
+                    )
+                for key, evaluation in stored.items():
+                    self._memory.put(key, evaluation)
+                found.update(stored)
+
+        # Grade each distinct missing request once, even if repeated in the batch.
+        missing: dict[str, ExamEvaluationRequest] = {}
+        for key, request in zip(keys, requests):
+            if key not in found:
+                missing.setdefault(key, request)
+        if missing:
+            fresh = await self._inner.evaluate_many(list(missing.values()))
+            cacheable: dict[str, ExamEvaluation] = {}
+            for key, evaluation in zip(missing, fresh, strict=True):
+                found[key] = evaluation
+                if not evaluation.from_fallback:
+                    self._memory.put(key, evaluation)
+                    cacheable[key] = evaluation
+            if self._store is not None and cacheable:
+                async with self._store_lock:
+                    await self._store.put_many(
+                        self._model, cacheable, expired_before=self._clock() - self._ttl
+                    )
+
+        return [found[key] for key in keys]
+
+    def capabilities(self) -> ExamEvaluatorCapabilities:
+        return self._inner.capabilities()
+
+    async def _bind_model(self) -> None:
+        if not self._memory.bind_model(self._model) or self._store is None:
+            return
+        async with self._store_lock:
+            await self._store.delete_other_models(self._model)
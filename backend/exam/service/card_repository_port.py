@@ -8,8 +8,13 @@ from card.model.card import Card
 class ExamCardRepositoryPort(Protocol):
     """Port for exam-specific card lookup operations."""
 
-    async def list_all(self) -> list[Card]:
+    async def get_by_id(self, card_id: str) -> Card | None:
         ...
 
-    async def get_by_id(self, card_id: str) -> Card | None:
+    async def get_by_exam_sheet(self, sheet_number: int) -> list[Card]:
+        """Return the cards on the given exam sheet, ordered by card ID."""
+        ...
+
+    async def count_by_exam_sheet(self) -> dict[int, int]:
+        """Return the number of cards per exam sheet."""
         ...
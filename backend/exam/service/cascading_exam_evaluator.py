@@ -0,0 +1,122 @@
+"""Heuristic-first exam evaluator that escalates only unclear answers.
+
+Blank answers never need a language model. Beyond that, answers whose
+keyword coverage is below ``low_coverage`` or at least ``high_coverage`` can
+be settled by the heuristic; everything else is sent to the (slow, paid)
+evaluator behind it. With the defaults 0 and 1 only answers covering every
+key point are settled: a correct paraphrase without any rubric keyword
+still reaches the model unless the operator raises ``low_coverage``.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+
+from exam.model.exam_result import ExamEvaluation
+from exam.service.exam_evaluator_port import (
+    ExamEvaluationRequest,
+    ExamEvaluatorCapabilities,
+    ExamEvaluatorPort,
+)
+from exam.service.heuristic_exam_evaluator import HeuristicExamEvaluator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GradingCascadeStats:
+    """Running counts of how answers were routed by the cascade."""
+
+    heuristic_answers: int = 0
+    escalated_answers: int = 0
+    # Included in heuristic_answers; the escalation evaluator skips them too.
+    blank_answers: int = 0
+
+    @property
+    def avoided_calls(self) -> int:
+        """Answers that would have gone to the escalation evaluator otherwise."""
+        return self.heuristic_answers - self.blank_answers
+
+
+class CascadingExamEvaluator:
+    """Grades with the heuristic and escalates answers in the uncertain band.
+
+    A non-blank answer is settled by the heuristic if its coverage is below
+    ``low_coverage`` (clearly wrong) or at least ``high_coverage`` (clearly
+    complete). Answers in between, and answers to questions without
+    reference key points, go to ``escalate_to``.
+    """
+
+    def __init__(
+        self,
+        heuristic: HeuristicExamEvaluator,
+        escalate_to: ExamEvaluatorPort,
+        low_coverage: float,
+        high_coverage: float,
+        stats: GradingCascadeStats | None = None,
+    ) -> None:
+        if not 0.0 <= low_coverage <= high_coverage <= 1.0:
+            raise ValueError("Cascade thresholds must satisfy 0 <= low <= high <= 1")
+        self._heuristic = heuristic
+        self._escalate_to = escalate_to
+        self._low_coverage = low_coverage
+        self._high_coverage = high_coverage
+        self._stats = stats if stats is not None else GradingCascadeStats()
+
+    @property
+    def stats(self) -> GradingCascadeStats:
+        return self._stats
+
+    async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        return (await self.evaluate_many([request]))[0]
+
+    async def evaluate_many(
+        self,
+        requests: list[ExamEvaluationRequest],
+    ) -> list[ExamEvaluation]:
+        results: list[ExamEvaluation | None] = []
+        escalated: list[int] = []
+        blank = 0
+        for index, request in enumerate(requests):
+            if not request.student_answer.strip():
+                blank += 1
+                results.append(self._heuristic.evaluate_sync(request))
+            elif self._is_clear(request):
+                results.append(self._heuristic.evaluate_sync(request))
+            else:
+                results.append(None)
+                escalated.append(index)
+
+        if escalated:
+            evaluations = await self._escalate_to.evaluate_many(
+                [requests[index] for index in escalated]
+            )
+            for index, evaluation in zip(escalated, evaluations, strict=True):
+                results[index] = evaluation
+
+        self._stats.heuristic_answers += len(requests) - len(escalated)
+        self._stats.escalated_answers += len(escalated)
+        self._stats.blank_answers += blank
+        logger.debug(
+            "Grading cascade: %d of %d answers settled by the heuristic",
+            len(requests) - len(escalated),
+            len(requests),
+        )
+        return [result for result in results if result is not None]
+
+    def capabilities(self) -> ExamEvaluatorCapabilities:
+        escalation = self._escalate_to.capabilities()
+        return replace(
+            escalation,
+            notes=(
+                f"Heuristic first; {escalation.provider} for key-point coverage "
+                f"from {self._low_coverage:.0%} up to {self._high_coverage:.0%}"
+            ),
+        )
+
+    def _is_clear(self, request: ExamEvaluationRequest) -> bool:
+        coverage = self._heuristic.coverage(request)
+        if coverage is None:
+            return False
+        return coverage < self._low_coverage or coverage >= self._high_coverage
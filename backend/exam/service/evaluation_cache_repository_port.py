@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime
+from typing import Protocol
+
+from exam.model.exam_result import ExamEvaluation
+
+
+class EvaluationCacheRepositoryPort(Protocol):
+    """Port for persisted exam evaluation results keyed by request hash."""
+
+    async def get_many(
+        self,
+        keys: Collection[str],
+        *,
+        stored_after: datetime,
+    ) -> dict[str, ExamEvaluation]:
+        """Return cached evaluations for ``keys`` stored after ``stored_after``."""
+        ...
+
+    async def put_many(
+        self,
+        model: str,
+        evaluations: dict[str, ExamEvaluation],
+        *,
+        expired_before: datetime,
+    ) -> None:
+        """Insert or refresh cached evaluations for ``model``.
+
+        Rows stored at or before ``expired_before`` are deleted first.
+        """
+        ...
+
+    async def delete_other_models(self, model: str) -> None:
+        """Drop every cached evaluation not produced by ``model``."""
+        ...
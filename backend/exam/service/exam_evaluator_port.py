@@ -33,5 +33,12 @@ class ExamEvaluatorPort(Protocol):
     async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
         ...
 
+    async def evaluate_many(
+        self,
+        requests: list[ExamEvaluationRequest],
+    ) -> list[ExamEvaluation]:
+        """Evaluate several answers at once; results match the request order."""
+        ...
+
     def capabilities(self) -> ExamEvaluatorCapabilities:
         ...
@@ -21,4 +21,8 @@ class ExamRepositoryPort(Protocol):
 
     async def save_answer(self, answer: ExamAnswer) -> None: ...
 
+    async def save_speculative_grade(self, answer: ExamAnswer) -> bool:
+        """Write only the evaluation fields if the answer text is unchanged."""
+        ...
+
     async def list_completed_sessions(self) -> list[ExamSession]: ...
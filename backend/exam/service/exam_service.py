@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 
 from card.model.card import Card
-from exam.model.exam_answer import ExamAnswer
-from exam.model.exam_result import ExamQuestionResult, ExamSessionResult
+from evaluation.model.grading_job import GradingProgress
+from evaluation.service.evaluation_executor import EvaluationExecutor
+from exam.model.exam_answer import ExamAnswer, answer_grade_hash
+from exam.model.exam_result import ExamEvaluation, ExamQuestionResult, ExamSessionResult
 from exam.model.exam_session import (
     ExamSession,
     ExamSessionDetails,
@@ -18,12 +22,14 @@ from exam.model.exam_template import ExamTemplate
 from exam.service.card_repository_port import ExamCardRepositoryPort
 from exam.service.exam_evaluator_port import ExamEvaluationRequest, ExamEvaluatorPort
 from exam.service.exam_repository_port import ExamRepositoryPort
+from exam.service.heuristic_exam_evaluator import HeuristicExamEvaluator
 
 DEFAULT_EXAM_TIME_LIMIT_MINUTES = 90
 DEFAULT_PASS_SCORE_THRESHOLD = 39.0
 DEFAULT_QUESTION_MAX_SCORE = 2.0
 DEFAULT_QUESTION_COUNT = 30
 DEFAULT_MAX_SHEET_NUMBER = 15
+DEFAULT_EVALUATION_BATCH_SIZE = 5
 
 
 class ExamService:
@@ -39,10 +45,17 @@ class ExamService:
         question_max_score: float = DEFAULT_QUESTION_MAX_SCORE,
         question_count: int = DEFAULT_QUESTION_COUNT,
         max_sheet_number: int = DEFAULT_MAX_SHEET_NUMBER,
+        evaluation_executor: EvaluationExecutor | None = None,
+        evaluation_batch_size: int = DEFAULT_EVALUATION_BATCH_SIZE,
+        background_grading: bool = False,
     ) -> None:
         self._exam_repo = exam_repo
         self._card_repo = card_repo
         self._evaluator = evaluator
+        self._fallback_evaluator = HeuristicExamEvaluator()
+        self._evaluation_executor = evaluation_executor or EvaluationExecutor()
+        self._evaluation_batch_size = evaluation_batch_size
+        self._background_grading = background_grading
         self._default_time_limit_minutes = default_time_limit_minutes
         self._pass_score_threshold = pass_score_threshold
         self._question_max_score = question_max_score
@@ -57,22 +70,19 @@ class ExamService:
     def question_max_score(self) -> float:
         return self._question_max_score
 
-    async def list_templates(self) -> list[ExamTemplate]:
-        cards = await self._card_repo.list_all()
-        question_count_by_sheet: dict[int, int] = {
-            number: 0 for number in range(1, self._max_sheet_number + 1)
-        }
+    @property
+    def background_grading_enabled(self) -> bool:
+        """Whether saved answers should be graded speculatively before submit."""
+        return self._background_grading
 
-        for card in cards:
-            for sheet in card.exam_sheets:
-                if 1 <= sheet <= self._max_sheet_number:
-                    question_count_by_sheet[sheet] += 1
+    async def list_templates(self) -> list[ExamTemplate]:
+        question_count_by_sheet = await self._card_repo.count_by_exam_sheet()
 
         return [
             ExamTemplate(
                 sheet_number=sheet_number,
                 display_name=f"Pruefungsbogen {sheet_number}",
-                question_count=question_count_by_sheet[sheet_number],
+                question_count=question_count_by_sheet.get(sheet_number, 0),
                 time_limit_minutes=self._default_time_limit_minutes,
             )
             for sheet_number in range(1, self._max_sheet_number + 1)
@@ -141,12 +151,11 @@ class ExamService:
             raise ValueError(f"Exam session {session_id!r} not found")
 
         answers = await self._exam_repo.list_answers(session.id)
-        cards = await self._card_repo.list_all()
-        cards_by_id = {card.card_id: card for card in cards}
 
         questions: list[ExamSessionQuestion] = []
         for answer in answers:
-            card = cards_by_id.get(answer.card_id)
+            # Served from the catalogue snapshot's id index, no full scan.
+            card = await self._card_repo.get_by_id(answer.card_id)
             if card is None:
                 continue
             questions.append(
@@ -184,7 +193,54 @@ class ExamService:
         await self._exam_repo.save_answer(answer)
         return answer
 
-    async def submit_session(self, session_id: str) -> ExamSessionResult:
+    async def grade_saved_answer(
+        self,
+        session_id: str,
+        card_id: str,
+        student_answer: str,
+    ) -> bool:
+        """Speculatively grade a saved answer so submit can reuse the result.
+
+        Does nothing if the session is no longer in progress, the answer has
+        changed since it was saved, or it already carries a grade by the
+        configured evaluator. Returns True if a grade was stored.
+        """
+        session = await self._exam_repo.get_session(session_id=session_id)
+        if session is None or session.status != ExamSessionStatus.IN_PROGRESS:
+            return False
+
+        answer = await self._exam_repo.get_answer(session_id=session_id, card_id=card_id)
+        if answer is None or answer.student_answer != student_answer:
+            return False
+
+        card = await self._card_repo.get_by_id(card_id)
+        if card is None:
+            return False
+
+        request = self._evaluation_request(card, answer)
+        if answer.has_grade_for(self._grade_hash(request)):
+            return False
+
+        evaluation = await self._evaluator.evaluate(request)
+        if evaluation.from_fallback:
+            # Leave it to submit, which retries the configured evaluator.
+            return False
+
+        self._apply_evaluation(answer, evaluation, request)
+        return await self._exam_repo.save_speculative_grade(answer)
+
+    async def submit_session(
+        self,
+        session_id: str,
+        checkpoint: Callable[[], Awaitable[None]] | None = None,
+    ) -> ExamSessionResult:
+        """Grade every answer and finalize the session.
+
+        With a ``checkpoint``, each answer is saved as soon as it is graded and
+        the checkpoint is awaited right after, so the caller can commit and
+        make the progress visible. The evaluator must then not share the
+        repository's database session, as grading and saving overlap.
+        """
         session = await self._exam_repo.get_session(session_id=session_id)
         if session is None:
             raise ValueError(f"Exam session {session_id!r} not found")
@@ -201,31 +257,41 @@ class ExamService:
 
         answers = await self._exam_repo.list_answers(session.id)
         total_score = 0.0
-
+        graded: list[tuple[ExamAnswer, ExamEvaluationRequest]] = []
         for answer in answers:
             card = await self._card_repo.get_by_id(answer.card_id)
             if card is None:
                 continue
+            request = self._evaluation_request(card, answer)
+            if answer.has_grade_for(self._grade_hash(request)):
+                # Graded in the background after the last save.
+                total_score += answer.score
+                continue
+            graded.append((answer, request))
+
+        save_lock = asyncio.Lock()
+
+        async def save_progress(index: int, evaluation: ExamEvaluation) -> None:
+            answer, request = graded[index]
+            self._apply_evaluation(answer, evaluation, request)
+            async with save_lock:
+                await self._exam_repo.save_answer(answer)
+                await checkpoint()
+
+        evaluations = await self._evaluation_executor.map_batched(
+            [request for _, request in graded],
+            self._evaluator.evaluate_many,
+            self._fallback_evaluator.evaluate_many,
+            batch_size=self._evaluation_batch_size,
+            on_result=save_progress if checkpoint is not None else None,
+        )
 
-            evaluation = await self._evaluator.evaluate(
-                ExamEvaluationRequest(
-                    question_text=card.front.text,
-                    short_answer=card.short_answer,
-                    reference_answer=card.answer.text,
-                    student_answer=answer.student_answer,
-                    max_score=self._question_max_score,
-                )
-            )
-
-            score = max(0.0, min(self._question_max_score, evaluation.score))
-            answer.score = float(round(score))
-            answer.is_correct = evaluation.is_correct
-            answer.feedback = evaluation.feedback
-            answer.errors = evaluation.errors
+        for (answer, request), evaluation in zip(graded, evaluations, strict=True):
+            if checkpoint is None:
+                self._apply_evaluation(answer, evaluation, request)
+                await self._exam_repo.save_answer(answer)
             total_score += answer.score
 
-            await self._exam_repo.save_answer(answer)
-
         max_score = len(answers) * self._question_max_score
         session.status = ExamSessionStatus.EVALUATED
         session.total_score = round(total_score, 2)
@@ -241,22 +307,7 @@ class ExamService:
         if session.status != ExamSessionStatus.EVALUATED:
             raise ValueError("Exam result is not available yet")
 
-        questions: list[ExamQuestionResult] = []
-        for question in details.questions:
-            answer = question.answer
-            questions.append(
-                ExamQuestionResult(
-                    question_number=question.question_number,
-                    card_id=question.card.card_id,
-                    question_text=question.card.front.text,
-                    reference_short_answer=question.card.short_answer,
-                    student_answer=answer.student_answer,
-                    score=answer.score or 0.0,
-                    is_correct=bool(answer.is_correct),
-                    feedback=answer.feedback or "Keine Bewertung vorhanden.",
-                    errors=answer.errors,
-                )
-            )
+        questions = [self._question_result(question) for question in details.questions]
 
         return ExamSessionResult(
             session_id=session.id,
@@ -273,8 +324,82 @@ class ExamService:
             questions=questions,
         )
 
+    async def get_grading_progress(
+        self,
+        session_id: str,
+    ) -> GradingProgress[ExamQuestionResult, ExamSessionResult]:
+        """Return the questions graded so far for a submitted session."""
+        details = await self.get_session_details(session_id=session_id)
+        status = details.session.status
+        if status == ExamSessionStatus.EVALUATED:
+            result = await self.get_result(session_id=session_id)
+            return GradingProgress(questions=result.questions, result=result)
+        if status != ExamSessionStatus.SUBMITTED:
+            return GradingProgress(questions=[])
+        return GradingProgress(
+            questions=[
+                self._question_result(question)
+                for question in details.questions
+                if question.answer.has_grade_for(
+                    self._grade_hash(self._evaluation_request(question.card, question.answer))
+                )
+            ]
+        )
+
+    def _question_result(self, question: ExamSessionQuestion) -> ExamQuestionResult:
+        answer = question.answer
+        return ExamQuestionResult(
+            question_number=question.question_number,
+            card_id=question.card.card_id,
+            question_text=question.card.front.text,
+            reference_short_answer=question.card.short_answer,
+            student_answer=answer.student_answer,
+            score=answer.score or 0.0,
+            is_correct=bool(answer.is_correct),
+            feedback=answer.feedback or "Keine Bewertung vorhanden.",
+            errors=answer.errors,
+        )
+
+    def _evaluation_request(self, card: Card, answer: ExamAnswer) -> ExamEvaluationRequest:
+        return ExamEvaluationRequest(
+            question_text=card.front.text,
+            short_answer=card.short_answer,
+            reference_answer=card.answer.text,
+            student_answer=answer.student_answer,
+            max_score=self._question_max_score,
+        )
+
+    def _grade_hash(self, request: ExamEvaluationRequest) -> str:
+        """Hash a stored grade must match to be reused for ``request``.
+
+        Covers the configured evaluator and model and the card's rubric, so
+        switching the grading backend or editing the card re-grades answers.
+        """
+        capabilities = self._evaluator.capabilities()
+        return answer_grade_hash(
+            request.student_answer,
+            [
+                capabilities.provider,
+                capabilities.model,
+                request.question_text,
+                request.short_answer,
+                request.reference_answer,
+                request.max_score,
+            ],
+        )
+
+    def _apply_evaluation(
+        self,
+        answer: ExamAnswer,
+        evaluation: ExamEvaluation,
+        request: ExamEvaluationRequest,
+    ) -> None:
+        score = max(0.0, min(self._question_max_score, evaluation.score))
+        answer.score = float(round(score))
+        answer.is_correct = evaluation.is_correct
+        answer.feedback = evaluation.feedback
+        answer.errors = evaluation.errors
+        answer.graded_answer_hash = self._grade_hash(request)
+
     async def _get_cards_for_sheet(self, sheet_number: int) -> list[Card]:
-        cards = await self._card_repo.list_all()
-        matches = [card for card in cards if sheet_number in card.exam_sheets]
-        matches.sort(key=lambda card: card.card_id)
-        return matches
+        return await self._card_repo.get_by_exam_sheet(sheet_number)
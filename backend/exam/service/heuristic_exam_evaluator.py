@@ -2,23 +2,25 @@
 
 from __future__ import annotations
 
-import re
-from collections.abc import Iterable
-
 from exam.model.exam_result import ExamEvaluation
 from exam.service.exam_evaluator_port import (
     ExamEvaluatorCapabilities,
     ExamEvaluationRequest,
 )
+from exam.service.rubric_index import SHARED_RUBRIC_INDEX, RubricIndex
 
 
 class HeuristicExamEvaluator:
     """Simple rubric-style keyword matching evaluator.
 
     This fallback keeps the feature operational in local environments without
-    external model credentials.
+    external model credentials. Rubrics are compiled once per card and kept
+    in ``rubrics`` (by default an index shared by all instances).
     """
 
+    def __init__(self, rubrics: RubricIndex | None = None) -> None:
+        self._rubrics = rubrics if rubrics is not None else SHARED_RUBRIC_INDEX
+
     def evaluate_sync(self, request: ExamEvaluationRequest) -> ExamEvaluation:
         student_text = request.student_answer.strip()
         if not student_text:
@@ -29,8 +31,8 @@ class HeuristicExamEvaluator:
                 errors=["Es wurde keine Antwort eingereicht."],
             )
 
-        phrases = _extract_phrases(request.short_answer, request.reference_answer)
-        if not phrases:
+        rubric = self._rubrics.rubric(request.short_answer, request.reference_answer)
+        if not rubric.phrases:
             return ExamEvaluation(
                 score=request.max_score,
                 is_correct=True,
@@ -38,17 +40,9 @@ class HeuristicExamEvaluator:
                 errors=[],
             )
 
-        student_tokens = set(_tokenize(student_text))
-        covered: list[str] = []
-        missing: list[str] = []
+        covered, missing = rubric.split_by_coverage(self._rubrics.answer_terms(student_text))
 
-        for phrase in phrases:
-            if _phrase_is_covered(phrase, student_tokens):
-                covered.append(phrase)
-            else:
-                missing.append(phrase)
-
-        ratio = len(covered) / len(phrases)
+        ratio = len(covered) / len(rubric.phrases)
         raw_score = ratio * request.max_score
         score = float(round(raw_score))
         is_correct = score >= (request.max_score * 0.75)
@@ -67,9 +61,30 @@ class HeuristicExamEvaluator:
             errors=[f"Fehlender Kernpunkt: {point}" for point in missing[:5]],
         )
 
+    def coverage(self, request: ExamEvaluationRequest) -> float | None:
+        """Share of reference key points found in the answer.
+
+        0.0 for a blank answer; None if the reference has no key points, in
+        which case the heuristic cannot judge the answer at all.
+        """
+        student_text = request.student_answer.strip()
+        if not student_text:
+            return 0.0
+        rubric = self._rubrics.rubric(request.short_answer, request.reference_answer)
+        if not rubric.phrases:
+            return None
+        covered, _ = rubric.split_by_coverage(self._rubrics.answer_terms(student_text))
+        return len(covered) / len(rubric.phrases)
+
     async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
         return self.evaluate_sync(request)
 
+    async def evaluate_many(
+        self,
+        requests: list[ExamEvaluationRequest],
+    ) -> list[ExamEvaluation]:
+        return [self.evaluate_sync(request) for request in requests]
+
     def capabilities(self) -> ExamEvaluatorCapabilities:
         return ExamEvaluatorCapabilities(
             provider="heuristic",
@@ -77,28 +92,3 @@ class HeuristicExamEvaluator:
             deterministic=True,
             notes="Keyword-based fallback evaluator",
         )
-
-
-def _extract_phrases(short_answer: list[str], reference_answer: str) -> list[str]:
-    cleaned_short = [part.strip() for part in short_answer if part.strip()]
-    if cleaned_short:
-        return cleaned_short
-
-    sentence_candidates = [
-        sentence.strip()
-        for sentence in re.split(r"[\n\.;]+", reference_answer)
-        if sentence.strip()
-    ]
-    return sentence_candidates[:5]
-
-
-def _tokenize(text: str) -> list[str]:
-    return [token for token in re.split(r"[^a-zA-Z0-9äöüÄÖÜß]+", text.lower()) if token]
-
-
-def _phrase_is_covered(phrase: str, student_tokens: set[str]) -> bool:
-    words = [w for w in _tokenize(phrase) if len(w) >= 4]
-    if not words:
-        return False
-    matched = sum(1 for word in words if word in student_tokens)
-    return matched >= max(1, len(words) // 2)
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 
 from openai import AsyncOpenAI
 
+from evaluation.service.circuit_breaker import CircuitBreaker, CircuitState
 from exam.model.exam_result import ExamEvaluation
 from exam.service.exam_evaluator_port import (
     ExamEvaluatorCapabilities,
@@ -15,6 +17,12 @@ from exam.service.exam_evaluator_port import (
 from exam.service.heuristic_exam_evaluator import HeuristicExamEvaluator
 
 
+_SYSTEM_PROMPT = (
+    "Du bewertest SKS-Pruefungsantworten streng und fair. "
+    "Antworte ausschliesslich als JSON-Objekt."
+)
+
+
 class OpenAiExamEvaluator:
     """Evaluates answers with OpenAI and falls back to deterministic scoring."""
 
@@ -23,8 +31,12 @@ class OpenAiExamEvaluator:
         api_key: str,
         model: str,
         timeout_seconds: float,
+        client: AsyncOpenAI | None = None,
+        base_url: str | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = client or AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
         self._model = model
         self._timeout_seconds = timeout_seconds
         self._fallback = HeuristicExamEvaluator()
@@ -34,51 +46,65 @@ class OpenAiExamEvaluator:
             return self._fallback.evaluate_sync(request)
 
         try:
-            completion = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Du bewertest SKS-Pruefungsantworten streng und fair. "
-                            "Antworte ausschliesslich als JSON-Objekt."
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": _build_user_prompt(request),
-                    },
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
-                timeout=self._timeout_seconds,
-            )
-            raw = completion.choices[0].message.content or "{}"
-            payload = _coerce_json(raw)
-            score = _clamp_score(payload.get("score"), request.max_score)
-            feedback = str(payload.get("feedback") or "Bewertung abgeschlossen.")
-            errors = _normalize_errors(payload.get("errors"))
-            is_correct = bool(payload.get("is_correct"))
-            if "is_correct" not in payload:
-                is_correct = score >= (request.max_score * 0.75)
-
-            return ExamEvaluation(
-                score=score,
-                is_correct=is_correct,
-                feedback=feedback,
-                errors=errors,
-            )
+            payload = await self._complete(_build_user_prompt(request))
+            return _payload_to_evaluation(payload, request)
         except Exception:
-            fallback = self._fallback.evaluate_sync(request)
-            return ExamEvaluation(
-                score=fallback.score,
-                is_correct=fallback.is_correct,
-                feedback=(
-                    "Automatische KI-Bewertung war nicht verfuegbar. "
-                    f"{fallback.feedback}"
-                ),
-                errors=fallback.errors,
-            )
+            return self._fallback_evaluation(request)
+
+    async def evaluate_many(
+        self,
+        requests: list[ExamEvaluationRequest],
+    ) -> list[ExamEvaluation]:
+        """Grade several answers with one completion.
+
+        The answers are numbered in the prompt and the response is split back
+        by number. Answers missing from an unparseable or incomplete response
+        are graded one by one via ``evaluate``, within one more client
+        timeout. If the batch call itself failed (error, timeout, open
+        circuit) the provider is not asked again; the answers are graded by
+        the fallback right away.
+        """
+        results: list[ExamEvaluation | None] = [None] * len(requests)
+        pending: list[int] = []
+        for index, request in enumerate(requests):
+            if request.student_answer.strip():
+                pending.append(index)
+            else:
+                results[index] = self._fallback.evaluate_sync(request)
+
+        batch_failed = False
+        if len(pending) > 1:
+            try:
+                payload = await self._complete(
+                    _build_batch_prompt([(index + 1, requests[index]) for index in pending])
+                )
+            except Exception:
+                payload = {}
+                batch_failed = True
+            items_by_id = _split_batch_results(payload)
+            for index in pending:
+                item = items_by_id.get(index + 1)
+                if item is not None:
+                    results[index] = _payload_to_evaluation(item, requests[index])
+
+        missing = [index for index in pending if results[index] is None]
+        if missing and not batch_failed and self._circuit_breaker.state != CircuitState.OPEN:
+            retries = {
+                index: asyncio.ensure_future(self.evaluate(requests[index]))
+                for index in missing
+            }
+            await asyncio.wait(retries.values(), timeout=self._timeout_seconds)
+            for index, retry in retries.items():
+                if retry.done():
+                    results[index] = retry.result()
+                else:
+                    retry.cancel()
+
+        for index in missing:
+            if results[index] is None:
+                results[index] = self._fallback_evaluation(requests[index])
+
+        return results
 
     def capabilities(self) -> ExamEvaluatorCapabilities:
         return ExamEvaluatorCapabilities(
@@ -88,6 +114,51 @@ class OpenAiExamEvaluator:
             notes="Falls OpenAI nicht verfuegbar ist, wird heuristisch bewertet.",
         )
 
+    async def _complete(self, user_prompt: str) -> dict:
+        completion = await self._circuit_breaker.call(
+            lambda: self._client.chat.completions.create(
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.1,
+                timeout=self._timeout_seconds,
+            )
+        )
+        raw = completion.choices[0].message.content or "{}"
+        return _coerce_json(raw)
+
+    def _fallback_evaluation(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        fallback = self._fallback.evaluate_sync(request)
+        return ExamEvaluation(
+            score=fallback.score,
+            is_correct=fallback.is_correct,
+            feedback=(
+                "Automatische KI-Bewertung war nicht verfuegbar. "
+                f"{fallback.feedback}"
+            ),
+            errors=fallback.errors,
+            from_fallback=True,
+        )
+
+
+def _payload_to_evaluation(payload: dict, request: ExamEvaluationRequest) -> ExamEvaluation:
+    score = _clamp_score(payload.get("score"), request.max_score)
+    feedback = str(payload.get("feedback") or "Bewertung abgeschlossen.")
+    errors = _normalize_errors(payload.get("errors"))
+    is_correct = bool(payload.get("is_correct"))
+    if "is_correct" not in payload:
+        is_correct = score >= (request.max_score * 0.75)
+
+    return ExamEvaluation(
+        score=score,
+        is_correct=is_correct,
+        feedback=feedback,
+        errors=errors,
+    )
+
 
 def _build_user_prompt(request: ExamEvaluationRequest) -> str:
     short_answer_json = json.dumps(request.short_answer, ensure_ascii=False)
@@ -103,6 +174,45 @@ def _build_user_prompt(request: ExamEvaluationRequest) -> str:
     )
 
 
+def _build_batch_prompt(numbered: list[tuple[int, ExamEvaluationRequest]]) -> str:
+    blocks = []
+    for number, request in numbered:
+        short_answer_json = json.dumps(request.short_answer, ensure_ascii=False)
+        blocks.append(
+            f"Antwort {number}:\n"
+            f"Frage: {request.question_text}\n"
+            f"Referenzstichpunkte: {short_answer_json}\n"
+            f"Vollstaendige Referenz: {request.reference_answer}\n"
+            f"Antwort des Prueflings: {request.student_answer}\n"
+            f"Hoechstpunktzahl: {int(request.max_score)}"
+        )
+    return (
+        "Bewerte die folgenden Antworten zu SKS-Pruefungsfragen jeweils einzeln "
+        "mit ganzen Punkten von 0 bis zur Hoechstpunktzahl.\n\n"
+        + "\n\n".join(blocks)
+        + "\n\nGib nur JSON zurueck: "
+        "{\"results\": [{\"id\": number, \"score\": number, \"is_correct\": boolean, "
+        "\"errors\": string[], \"feedback\": string}]} "
+        "mit genau einem Eintrag pro Antwortnummer als id."
+    )
+
+
+def _split_batch_results(payload: dict) -> dict[int, dict]:
+    items = payload.get("results") if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        return {}
+
+    items_by_id: dict[int, dict] = {}
+    for item in items:
+        if not isinstance(item, dict) or "score" not in item:
+            continue
+        try:
+            items_by_id[int(item.get("id"))] = item
+        except (TypeError, ValueError):
+            continue
+    return items_by_id
+
+
 def _coerce_json(raw: str) -> dict:
     try:
         return json.loads(raw)
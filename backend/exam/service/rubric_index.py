@@ -0,0 +1,164 @@
+"""Compiled key-point rubrics for the heuristic exam evaluator.
+
+Reference data is static per card, but the heuristic used to re-extract the
+key points, re-split the reference answer and re-tokenize every phrase on
+each call. The index compiles a card's rubric once into phrases of integer
+term ids and keeps it in a bounded LRU, so grading an answer only tokenizes
+the student text and intersects sets of ids.
+
+Term ids come from one vocabulary shared by all rubrics of the index. It only
+grows with the (finite) catalogue text, so evicted rubrics keep their ids.
+Answer tokens that are not in the vocabulary are resolved through a
+typo-tolerant delete dictionary, so "Steuerbort" still counts for
+"Steuerbord". ``warm`` compiles the whole catalogue up front.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from exam.service.typo_vocabulary import SymSpellVocabulary
+
+DEFAULT_MAX_RUBRICS = 2048
+# Shorter words (articles, "bei", "und", ...) do not count as key terms.
+MIN_TERM_LENGTH = 4
+
+_TOKEN_SPLIT = re.compile(r"[^a-zA-Z0-9äöüÄÖÜß]+")
+_SENTENCE_SPLIT = re.compile(r"[\n\.;]+")
+
+
+@dataclass(frozen=True)
+class CompiledPhrase:
+    """One key point; covered once ``required`` of its terms are present."""
+
+    text: str
+    terms: frozenset[int]
+    term_counts: dict[int, int]
+    required: int
+
+    def is_covered(self, answer_terms: frozenset[int]) -> bool:
+        if not self.terms:
+            return False
+        matched = sum(self.term_counts[term] for term in self.terms & answer_terms)
+        return matched >= self.required
+
+
+@dataclass(frozen=True)
+class CompiledRubric:
+    phrases: tuple[CompiledPhrase, ...]
+
+    def split_by_coverage(
+        self, answer_terms: frozenset[int]
+    ) -> tuple[list[str], list[str]]:
+        covered: list[str] = []
+        missing: list[str] = []
+        for phrase in self.phrases:
+            if phrase.is_covered(answer_terms):
+                covered.append(phrase.text)
+            else:
+                missing.append(phrase.text)
+        return covered, missing
+
+
+class RubricIndex:
+    """LRU of compiled rubrics plus the term vocabulary they share."""
+
+    def __init__(
+        self,
+        max_rubrics: int = DEFAULT_MAX_RUBRICS,
+        typo_tolerant: bool = True,
+    ) -> None:
+        self._max_rubrics = max(1, max_rubrics)
+        self._rubrics: OrderedDict[tuple[tuple[str, ...], str], CompiledRubric] = OrderedDict()
+        self._term_ids: dict[str, int] = {}
+        self._vocabulary = SymSpellVocabulary() if typo_tolerant else None
+
+    def __len__(self) -> int:
+        return len(self._rubrics)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._term_ids)
+
+    def rubric(self, short_answer: Iterable[str], reference_answer: str) -> CompiledRubric:
+        key = (tuple(short_answer), reference_answer)
+        rubric = self._rubrics.get(key)
+        if rubric is not None:
+            self._rubrics.move_to_end(key)
+            return rubric
+
+        rubric = CompiledRubric(
+            phrases=tuple(
+                self._compile_phrase(phrase) for phrase in extract_phrases(*key)
+            )
+        )
+        self._rubrics[key] = rubric
+        while len(self._rubrics) > self._max_rubrics:
+            self._rubrics.popitem(last=False)
+        return rubric
+
+    def warm(self, references: Iterable[tuple[Iterable[str], str]]) -> None:
+        """Compile the rubrics of (short_answer, reference_answer) pairs."""
+        for short_answer, reference_answer in references:
+            self.rubric(short_answer, reference_answer)
+
+    def answer_terms(self, text: str) -> frozenset[int]:
+        """Ids of the answer's tokens; words no rubric uses are dropped.
+
+        A misspelled token maps to every vocabulary term at the smallest
+        tolerated edit distance.
+        """
+        term_ids = self._term_ids
+        terms: set[int] = set()
+        for token in set(tokenize(text)):
+            term_id = term_ids.get(token)
+            if term_id is not None:
+                terms.add(term_id)
+            elif self._vocabulary is not None and len(token) >= MIN_TERM_LENGTH:
+                terms.update(term_ids[term] for term in self._vocabulary.lookup(token))
+        return frozenset(terms)
+
+    def _compile_phrase(self, phrase: str) -> CompiledPhrase:
+        words = [word for word in tokenize(phrase) if len(word) >= MIN_TERM_LENGTH]
+        counts = Counter(self._term_id(word) for word in words)
+        return CompiledPhrase(
+            text=phrase,
+            terms=frozenset(counts),
+            term_counts=dict(counts),
+            required=max(1, len(words) // 2),
+        )
+
+    def _term_id(self, word: str) -> int:
+        term_id = self._term_ids.get(word)
+        if term_id is None:
+            term_id = len(self._term_ids)
+            self._term_ids[word] = term_id
+            if self._vocabulary is not None:
+                self._vocabulary.add(word)
+        return term_id
+
+
+def extract_phrases(short_answer: Iterable[str], reference_answer: str) -> list[str]:
+    """Key points of a card: its short-answer bullets, else reference sentences."""
+    cleaned_short = [part.strip() for part in short_answer if part.strip()]
+    if cleaned_short:
+        return cleaned_short
+
+    sentence_candidates = [
+        sentence.strip()
+        for sentence in _SENTENCE_SPLIT.split(reference_answer)
+        if sentence.strip()
+    ]
+    return sentence_candidates[:5]
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in _TOKEN_SPLIT.split(text.lower()) if token]
+
+
+# Shared by every HeuristicExamEvaluator that is not given its own index;
+# evaluators are built per request, rubrics should outlive them.
+SHARED_RUBRIC_INDEX = RubricIndex()
@@ -0,0 +1,350 @@
+"""Offline exam evaluator based on character n-gram TF-IDF similarity.
+
+Each short-answer bullet of a card becomes a TF-IDF vector over hashed
+character n-grams (3 to 5 characters, within words). N-grams make the
+comparison robust against inflection, compounds and small typos
+("Steuerbordseite", "steuerbort") without any language model. A bullet
+counts as covered in proportion to how far its cosine similarity to the
+answer lies between ``low_similarity`` and ``high_similarity``.
+
+``ReferenceVectorIndex.build`` computes IDF over all bullets of the
+catalogue and stores the L2-normalised bullet vectors as the rows of one
+float32 CSR matrix. A whole exam sheet is scored with a single sparse-dense
+product: the answers form a dense float32 matrix over the catalogue's
+n-gram columns, and every bullet row is multiplied with the row of the
+answer it is compared to. Everything runs in-process, fully offline.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from exam.model.exam_result import ExamEvaluation
+from exam.service.exam_evaluator_port import (
+    ExamEvaluationRequest,
+    ExamEvaluatorCapabilities,
+)
+from exam.service.rubric_index import extract_phrases
+
+NGRAM_SIZES = (3, 4, 5)
+# 2**20 buckets keep hash collisions negligible for a few thousand bullets.
+HASH_BUCKETS = 1 << 20
+# Calibrated on the catalogue: a card's own reference answer scores a median
+# of ~0.5 against its bullets, an unrelated card's answer stays below ~0.06.
+DEFAULT_LOW_SIMILARITY = 0.1
+DEFAULT_HIGH_SIMILARITY = 0.35
+
+_WORD_SPLIT = re.compile(r"[^a-z0-9äöüß]+")
+
+RubricKey = tuple[tuple[str, ...], str]
+
+
+@dataclass(frozen=True)
+class _BulletMatrix:
+    """One immutable build of the index; replaced as a whole on rebuild."""
+
+    # Column of each hash bucket, -1 for buckets no bullet contains.
+    columns: np.ndarray
+    idf: np.ndarray
+    unseen_idf: float
+    # CSR storage of the bullet matrix (one row per bullet).
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    rows: dict[RubricKey, tuple[int, int]]
+
+    def bucket_idf(self, buckets: np.ndarray) -> np.ndarray:
+        columns = self.columns[buckets]
+        known = columns >= 0
+        idf = np.full(len(buckets), self.unseen_idf, dtype=np.float32)
+        idf[known] = self.idf[columns[known]]
+        return idf
+
+
+class ReferenceVectorIndex:
+    """IDF weights and the bullet matrix for a fixed catalogue of key points.
+
+    Only n-grams that occur in some bullet get a matrix column; an answer
+    n-gram outside them cannot add to any catalogue dot product and only
+    counts towards the answer's norm. Cards outside the catalogue are
+    vectorised per call and never added, so the index only changes when
+    ``build`` replaces it.
+    """
+
+    def __init__(self) -> None:
+        self._matrix = _build_matrix({})
+
+    def build(self, references: Iterable[tuple[Iterable[str], str]]) -> None:
+        """Recompute IDF and the bullet matrix from (short_answer, reference) pairs."""
+        phrase_lists: dict[RubricKey, list[str]] = {}
+        for short_answer, reference_answer in references:
+            key = (tuple(short_answer), reference_answer)
+            if key not in phrase_lists:
+                phrase_lists[key] = extract_phrases(*key)
+        # Readers hold on to the previous matrix until they are done with it.
+        self._matrix = _build_matrix(phrase_lists)
+
+    def __len__(self) -> int:
+        return len(self._matrix.rows)
+
+    @property
+    def column_count(self) -> int:
+        return len(self._matrix.idf)
+
+    def similarities(
+        self,
+        answers: list[str],
+        references: list[tuple[Iterable[str], str]],
+    ) -> list[np.ndarray]:
+        """Cosine similarity of each bullet of ``references[i]`` to ``answers[i]``.
+
+        Returns one float32 array per answer with a value per bullet.
+        """
+        matrix = self._matrix
+        keys = [(tuple(short_answer), reference) for short_answer, reference in references]
+        results: list[np.ndarray] = [np.zeros(0, dtype=np.float32)] * len(answers)
+
+        stored = [position for position, key in enumerate(keys) if key in matrix.rows]
+        if stored:
+            row_ranges = [matrix.rows[keys[position]] for position in stored]
+            values = _catalogue_similarities(
+                matrix, [answers[position] for position in stored], row_ranges
+            )
+            offset = 0
+            for position, (start, stop) in zip(stored, row_ranges):
+                results[position] = values[offset : offset + stop - start]
+                offset += stop - start
+
+        for position, key in enumerate(keys):
+            if key not in matrix.rows:
+                results[position] = _transient_similarities(
+                    matrix, answers[position], extract_phrases(*key)
+                )
+        return results
+
+
+class SimilarityExamEvaluator:
+    """Grades answers by TF-IDF cosine similarity to the reference bullets."""
+
+    def __init__(
+        self,
+        index: ReferenceVectorIndex,
+        low_similarity: float = DEFAULT_LOW_SIMILARITY,
+        high_similarity: float = DEFAULT_HIGH_SIMILARITY,
+    ) -> None:
+        if not 0.0 <= low_similarity < high_similarity <= 1.0:
+            raise ValueError("Similarity thresholds must satisfy 0 <= low < high <= 1")
+        self._index = index
+        self._low_similarity = low_similarity
+        self._high_similarity = high_similarity
+
+    def evaluate_sync(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        return self.evaluate_sheet([request])[0]
+
+    def evaluate_sheet(self, requests: list[ExamEvaluationRequest]) -> list[ExamEvaluation]:
+        """Grade all answers of a sheet with one product against the bullet matrix."""
+        results: list[ExamEvaluation | None] = [None] * len(requests)
+        answered: list[int] = []
+        for position, request in enumerate(requests):
+            if request.student_answer.strip():
+                answered.append(position)
+                continue
+            results[position] = ExamEvaluation(
+                score=0.0,
+                is_correct=False,
+                feedback="Keine Antwort abgegeben.",
+                errors=["Es wurde keine Antwort eingereicht."],
+            )
+
+        similarities = self._index.similarities(
+            [requests[position].student_answer.strip() for position in answered],
+            [
+                (requests[position].short_answer, requests[position].reference_answer)
+                for position in answered
+            ],
+        )
+        span = self._high_similarity - self._low_similarity
+        for position, bullet_similarities in zip(answered, similarities):
+            request = requests[position]
+            if not len(bullet_similarities):
+                results[position] = ExamEvaluation(
+                    score=request.max_score,
+                    is_correct=True,
+                    feedback="Antwort eingereicht. Es lagen keine Referenzkriterien vor.",
+                    errors=[],
+                )
+                continue
+            credits = np.clip((bullet_similarities - self._low_similarity) / span, 0.0, 1.0)
+            results[position] = self._grade(request, credits.tolist())
+
+        return [result for result in results if result is not None]
+
+    async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        return self.evaluate_sync(request)
+
+    async def evaluate_many(
+        self,
+        requests: list[ExamEvaluationRequest],
+    ) -> list[ExamEvaluation]:
+        return self.evaluate_sheet(requests)
+
+    def capabilities(self) -> ExamEvaluatorCapabilities:
+        return ExamEvaluatorCapabilities(
+            provider="similarity",
+            model=None,
+            deterministic=True,
+            notes="Offline TF-IDF similarity to the reference key points",
+        )
+
+    def _grade(self, request: ExamEvaluationRequest, credits: list[float]) -> ExamEvaluation:
+        ratio = sum(credits) / len(credits)
+        score = max(0.0, min(request.max_score, float(round(ratio * request.max_score))))
+
+        if ratio >= 0.9:
+            feedback = "Sehr gute Antwort, die wichtigsten Kernpunkte sind enthalten."
+        elif ratio >= 0.55:
+            feedback = "Teilweise korrekt, einige Kernpunkte fehlen noch."
+        else:
+            feedback = "Zu viele Kernpunkte fehlen fuer eine ausreichende Bewertung."
+
+        phrases = extract_phrases(request.short_answer, request.reference_answer)
+        missing = [phrase for phrase, credit in zip(phrases, credits) if credit < 0.5]
+        return ExamEvaluation(
+            score=score,
+            is_correct=score >= request.max_score * 0.75,
+            feedback=feedback,
+            errors=[f"Fehlender Kernpunkt: {point}" for point in missing[:5]],
+        )
+
+
+def hashed_ngrams(text: str) -> list[int]:
+    """Bucket ids of the character n-grams of every word, padded with spaces."""
+    buckets: list[int] = []
+    for word in _WORD_SPLIT.split(text.lower()):
+        if not word:
+            continue
+        padded = f" {word} "
+        for size in NGRAM_SIZES:
+            for start in range(len(padded) - size + 1):
+                gram = padded[start : start + size].encode()
+                buckets.append(zlib.crc32(gram) & (HASH_BUCKETS - 1))
+    return buckets
+
+
+def _build_matrix(phrase_lists: dict[RubricKey, list[str]]) -> _BulletMatrix:
+    phrase_buckets = [
+        np.unique(_bucket_array(phrase))
+        for phrases in phrase_lists.values()
+        for phrase in phrases
+    ]
+    documents = len(phrase_buckets)
+    if phrase_buckets:
+        buckets, frequency = np.unique(np.concatenate(phrase_buckets), return_counts=True)
+    else:
+        buckets = frequency = np.zeros(0, dtype=np.int64)
+
+    columns = np.full(HASH_BUCKETS, -1, dtype=np.int32)
+    columns[buckets] = np.arange(len(buckets), dtype=np.int32)
+    idf = (np.log((1 + documents) / (1 + frequency)) + 1.0).astype(np.float32)
+
+    indices: list[np.ndarray] = [np.zeros(0, dtype=np.int32)]
+    data: list[np.ndarray] = [np.zeros(0, dtype=np.float32)]
+    lengths: list[int] = []
+    rows: dict[RubricKey, tuple[int, int]] = {}
+    for key, phrases in phrase_lists.items():
+        rows[key] = (len(lengths), len(lengths) + len(phrases))
+        for phrase in phrases:
+            phrase_buckets, counts = np.unique(_bucket_array(phrase), return_counts=True)
+            phrase_columns = columns[phrase_buckets]
+            weights = _normalise((1.0 + np.log(counts)) * idf[phrase_columns])
+            order = np.argsort(phrase_columns)
+            indices.append(phrase_columns[order])
+            data.append(weights[order])
+            lengths.append(len(phrase_columns))
+
+    return _BulletMatrix(
+        columns=columns,
+        idf=idf,
+        # N-grams no catalogue bullet contains get the highest possible weight.
+        unseen_idf=math.log(1 + documents) + 1.0,
+        indptr=np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]).astype(np.int64),
+        indices=np.concatenate(indices),
+        data=np.concatenate(data),
+        rows=rows,
+    )
+
+
+def _catalogue_similarities(
+    matrix: _BulletMatrix,
+    answers: list[str],
+    row_ranges: list[tuple[int, int]],
+) -> np.ndarray:
+    """Bullet similarities of catalogue cards, concatenated, in one product."""
+    answer_matrix = np.zeros((len(answers), len(matrix.idf)), dtype=np.float32)
+    for position, answer in enumerate(answers):
+        buckets, weights = _answer_vector(matrix, answer)
+        columns = matrix.columns[buckets]
+        known = columns >= 0
+        answer_matrix[position, columns[known]] = weights[known]
+
+    first_rows = np.array([start for start, _ in row_ranges], dtype=np.int64)
+    last_rows = np.array([stop for _, stop in row_ranges], dtype=np.int64)
+    # A card's bullets are consecutive rows, so its stored entries are too.
+    first_entries = matrix.indptr[first_rows]
+    last_entries = matrix.indptr[last_rows]
+    entries = _concat_ranges(first_entries, last_entries)
+    owner = np.repeat(np.arange(len(answers)), last_entries - first_entries)
+    rows = _concat_ranges(first_rows, last_rows)
+    slot = np.repeat(np.arange(len(rows)), np.diff(matrix.indptr)[rows])
+
+    products = matrix.data[entries] * answer_matrix[owner, matrix.indices[entries]]
+    similarities = np.bincount(slot, weights=products, minlength=len(rows))
+    return similarities.astype(np.float32)
+
+
+def _transient_similarities(
+    matrix: _BulletMatrix,
+    answer: str,
+    phrases: list[str],
+) -> np.ndarray:
+    """Bullet similarities of a card outside the catalogue, in bucket space."""
+    answer_buckets, answer_weights = _answer_vector(matrix, answer)
+    similarities = np.zeros(len(phrases), dtype=np.float32)
+    for position, phrase in enumerate(phrases):
+        buckets, counts = np.unique(_bucket_array(phrase), return_counts=True)
+        weights = _normalise((1.0 + np.log(counts)) * matrix.bucket_idf(buckets))
+        _, in_answer, in_phrase = np.intersect1d(
+            answer_buckets, buckets, assume_unique=True, return_indices=True
+        )
+        similarities[position] = np.dot(answer_weights[in_answer], weights[in_phrase])
+    return similarities
+
+
+def _answer_vector(matrix: _BulletMatrix, text: str) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted hash buckets of ``text`` and their normalised TF-IDF weights."""
+    buckets, counts = np.unique(_bucket_array(text), return_counts=True)
+    return buckets, _normalise((1.0 + np.log(counts)) * matrix.bucket_idf(buckets))
+
+
+def _concat_ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """``concatenate([arange(a, b) for a, b in zip(starts, stops)])``, vectorised."""
+    lengths = stops - starts
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return offsets + np.arange(int(lengths.sum()), dtype=np.int64)
+
+
+def _bucket_array(text: str) -> np.ndarray:
+    return np.asarray(hashed_ngrams(text), dtype=np.int64)
+
+
+def _normalise(weights: np.ndarray) -> np.ndarray:
+    norm = float(np.sqrt(np.dot(weights, weights)))
+    if norm == 0.0:
+        return weights.astype(np.float32)
+    return (weights / norm).astype(np.float32)
@@ -0,0 +1,114 @@
+"""Typo-tolerant lookup of answer tokens in the rubric vocabulary.
+
+Uses the symmetric-delete scheme (SymSpell): every vocabulary term is stored
+under all strings obtained by deleting up to ``max_distance`` characters. A
+misspelled token generates its own deletes; terms sharing one of them are
+candidates, and the candidates are confirmed with a real edit distance.
+Lookups therefore touch a few dozen dictionary keys instead of scanning the
+vocabulary, which keeps them well below a millisecond.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+DEFAULT_MAX_DISTANCE = 2
+
+
+def allowed_distance(token: str) -> int:
+    """Edits tolerated for a token of this length.
+
+    Short words are matched exactly; "Kurs" and "Kurz" are different words.
+    """
+    if len(token) < 5:
+        return 0
+    if len(token) < 9:
+        return 1
+    return 2
+
+
+class SymSpellVocabulary:
+    """Delete dictionary over the terms added so far."""
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE) -> None:
+        self._max_distance = max_distance
+        self._terms: set[str] = set()
+        self._deletes: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._terms
+
+    def add(self, term: str) -> None:
+        if term in self._terms:
+            return
+        self._terms.add(term)
+        for variant in _deletes(term, self._max_distance):
+            self._deletes.setdefault(variant, set()).add(term)
+
+    def lookup(self, token: str) -> list[str]:
+        """Closest terms within the allowed distance of ``token``.
+
+        An exact hit is returned alone; otherwise all terms at the smallest
+        distance found are returned, since the answer may mean any of them.
+        """
+        if token in self._terms:
+            return [token]
+        max_distance = min(self._max_distance, allowed_distance(token))
+        if max_distance == 0:
+            return []
+
+        candidates: set[str] = set()
+        for variant in _deletes(token, max_distance):
+            candidates.update(self._deletes.get(variant, ()))
+
+        best: list[str] = []
+        best_distance = max_distance + 1
+        for candidate in candidates:
+            if abs(len(candidate) - len(token)) > max_distance:
+                continue
+            distance = edit_distance(token, candidate, best_distance)
+            if distance < best_distance:
+                best, best_distance = [candidate], distance
+            elif distance == best_distance:
+                best.append(candidate)
+        return sorted(best) if best_distance <= max_distance else []
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    variants = {word}
+    frontier: Iterable[str] = (word,)
+    for _ in range(max_distance):
+        next_frontier = {
+            candidate[:index] + candidate[index + 1 :]
+            for candidate in frontier
+            for index in range(len(candidate))
+        }
+        next_frontier -= variants
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein (optimal string alignment) distance, capped at ``limit``."""
+    if a == b:
+        return 0
+    previous_previous: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min >= limit:
+            return limit
+        previous_previous, previous = previous, current
+    return min(previous[-1], limit)
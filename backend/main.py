@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -19,21 +20,46 @@ from card.controller.card_controller import (
     get_card_repository as _card_repo_placeholder,
     router as card_router,
 )
+from database import async_session_factory
 from dependencies import (
+    GRADING_CASCADE_STATS,
+    OPENAI_CHAT_CIRCUIT_BREAKER,
+    OPENAI_CLIENTS,
+    SETTINGS_CHANGE_LISTENER,
     get_audio_transcription_service,
     get_card_repository,
     get_db_session,
     get_exam_service,
+    get_grading_job_service,
     get_navigation_service,
     get_settings_service,
     get_study_service,
+    grade_exam_answer_in_background,
+    load_card_catalog,
+    read_exam_grading_progress,
+    read_navigation_grading_progress,
+    run_exam_submit_job,
+    run_navigation_submit_job,
+)
+from evaluation.controller.evaluation_controller import (
+    get_openai_chat_circuit_breaker as _circuit_breaker_placeholder,
+    router as evaluation_router,
 )
 from exam.controller.exam_controller import (
+    get_exam_answer_grader as _exam_grader_placeholder,
+    get_grading_cascade_stats as _cascade_stats_placeholder,
+    get_exam_grading_progress_reader as _exam_progress_placeholder,
     get_exam_service as _exam_svc_placeholder,
+    get_exam_submit_job_runner as _exam_job_runner_placeholder,
+    get_grading_job_service as _exam_jobs_placeholder,
     router as exam_router,
 )
+from exam.service.rubric_index import SHARED_RUBRIC_INDEX
 from navigation.controller.navigation_controller import (
+    get_grading_job_service as _nav_jobs_placeholder,
+    get_navigation_grading_progress_reader as _nav_progress_placeholder,
     get_navigation_service as _nav_svc_placeholder,
+    get_navigation_submit_job_runner as _nav_job_runner_placeholder,
     router as navigation_router,
 )
 from settings.controller.settings_controller import (
@@ -56,6 +82,20 @@ def _get_cors_origins() -> list[str]:
     return origins or ["http://localhost:3000"]
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Warm the process-wide card catalogue so the first request doesn't pay for it.
+    async with async_session_factory() as session:
+        catalog = await load_card_catalog(session)
+    # Compile every card's rubric (and the typo-tolerant vocabulary) once.
+    references = [(card.short_answer, card.answer.text) for card in catalog.cards]
+    SHARED_RUBRIC_INDEX.warm(references)
+    SETTINGS_CHANGE_LISTENER.start()
+    yield
+    await SETTINGS_CHANGE_LISTENER.stop()
+    await OPENAI_CLIENTS.aclose()
+
+
 app = FastAPI(
     title="Easy SKS API",
     version="1.0.0",
@@ -63,6 +103,7 @@ app = FastAPI(
     openapi_url="/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -91,10 +132,42 @@ async def _wired_exam_service(session: AsyncSession = Depends(get_db_session)):
     return await get_exam_service(session)
 
 
+def _wired_exam_answer_grader():
+    return grade_exam_answer_in_background
+
+
+def _wired_grading_cascade_stats():
+    return GRADING_CASCADE_STATS
+
+
+def _wired_openai_chat_circuit_breaker():
+    return OPENAI_CHAT_CIRCUIT_BREAKER
+
+
 async def _wired_navigation_service(session: AsyncSession = Depends(get_db_session)):
     return await get_navigation_service(session)
 
 
+async def _wired_grading_job_service(session: AsyncSession = Depends(get_db_session)):
+    return await get_grading_job_service(session)
+
+
+def _wired_exam_submit_job_runner():
+    return run_exam_submit_job
+
+
+def _wired_exam_grading_progress_reader():
+    return read_exam_grading_progress
+
+
+def _wired_navigation_submit_job_runner():
+    return run_navigation_submit_job
+
+
+def _wired_navigation_grading_progress_reader():
+    return read_navigation_grading_progress
+
+
 async def _wired_audio_transcription_service(
     session: AsyncSession = Depends(get_db_session),
 ):
@@ -108,7 +181,18 @@ async def _wired_settings_service(session: AsyncSession = Depends(get_db_session
 app.dependency_overrides[_study_svc_placeholder] = _wired_study_service
 app.dependency_overrides[_card_repo_placeholder] = _wired_card_repository
 app.dependency_overrides[_exam_svc_placeholder] = _wired_exam_service
+app.dependency_overrides[_exam_grader_placeholder] = _wired_exam_answer_grader
+app.dependency_overrides[_cascade_stats_placeholder] = _wired_grading_cascade_stats
+app.dependency_overrides[_circuit_breaker_placeholder] = _wired_openai_chat_circuit_breaker
+app.dependency_overrides[_exam_jobs_placeholder] = _wired_grading_job_service
+app.dependency_overrides[_exam_job_runner_placeholder] = _wired_exam_submit_job_runner
+app.dependency_overrides[_exam_progress_placeholder] = _wired_exam_grading_progress_reader
 app.dependency_overrides[_nav_svc_placeholder] = _wired_navigation_service
+app.dependency_overrides[_nav_jobs_placeholder] = _wired_grading_job_service
+app.dependency_overrides[_nav_job_runner_placeholder] = _wired_navigation_submit_job_runner
+app.dependency_overrides[_nav_progress_placeholder] = (
+    _wired_navigation_grading_progress_reader
+)
 app.dependency_overrides[_transcription_svc_placeholder] = (
     _wired_audio_transcription_service
 )
@@ -123,6 +207,7 @@ app.include_router(exam_router)
 app.include_router(navigation_router)
 app.include_router(transcription_router)
 app.include_router(settings_router)
+app.include_router(evaluation_router)
 
 
 public_router = APIRouter(tags=["General"])
@@ -0,0 +1,251 @@
+"""Navigation arithmetic used by the SKS chart tasks.
+
+Follows the conventions of the task solutions (angles in degrees, distances
+in nautical miles, speeds in knots, times in minutes):
+
+    MgK + Abl = MwK      magnetic compass course + deviation
+    MwK + Mw  = rwK      + variation = true course
+    rwK + BW  = KdW      + leeway = course through the water
+    KdW + BS  = KüG      + current correction = course over ground
+
+Easterly deviation/variation and leeway to starboard are positive. Every
+function is written with NumPy ufuncs: called with numbers it returns
+numbers, called with arrays it broadcasts them and computes a whole batch
+(e.g. every course chain of the catalogue) in one call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# A number or an array of numbers; arguments broadcast like NumPy ufuncs.
+Float = float | np.ndarray
+
+EARTH_MINUTES_PER_DEGREE = 60.0
+# Fixed-point steps when looking up the compass course for a deviation table.
+_DEVIATION_ITERATIONS = 10
+# Cumulative share of the tidal range after each hour (rule of twelfths).
+_TWELFTHS = (0, 1, 3, 6, 9, 11, 12)
+
+
+def normalize_course(degrees: Float) -> Float:
+    """Course in [0, 360)."""
+    return np.mod(degrees, 360.0)
+
+
+def signed_angle(degrees: Float) -> Float:
+    """Angle in (-180, 180], e.g. the difference between two courses."""
+    angle = np.mod(degrees, 360.0)
+    return np.where(angle > 180.0, angle - 360.0, angle)[()]
+
+
+# -- Course conversions ------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DeviationTable:
+    """Deviation (Abl) by magnetic compass course, interpolated linearly."""
+
+    deviations: Mapping[float, float]
+    _headings: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _values: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.deviations:
+            raise ValueError("Deviation table must not be empty")
+        values = {float(normalize_course(heading)): d for heading, d in self.deviations.items()}
+        headings = tuple(sorted(values))
+        object.__setattr__(self, "_headings", headings)
+        object.__setattr__(self, "_values", tuple(values[heading] for heading in headings))
+
+    def deviation(self, compass_course: Float) -> Float:
+        course = normalize_course(compass_course)
+        return np.interp(course, self._headings, self._values, period=360.0)
+
+    def compass_course(self, magnetic_course: Float) -> Float:
+        """MgK that, plus its own deviation, gives ``magnetic_course`` (MwK)."""
+        compass = magnetic_course
+        for _ in range(_DEVIATION_ITERATIONS):
+            compass = np.subtract(magnetic_course, self.deviation(compass))
+        return normalize_course(compass)
+
+
+def compass_to_true(compass_course: Float, deviation: Float, variation: Float) -> Float:
+    """rwK from MgK, Abl and Mw."""
+    return normalize_course(np.add(np.add(compass_course, deviation), variation))
+
+
+def true_to_compass(
+    true_course: Float,
+    variation: Float,
+    deviation: Float | DeviationTable,
+) -> Float:
+    """MgK to steer for a rwK; a table resolves the course-dependent deviation."""
+    magnetic_course = np.subtract(true_course, variation)
+    if isinstance(deviation, DeviationTable):
+        return deviation.compass_course(magnetic_course)
+    return normalize_course(magnetic_course - deviation)
+
+
+def apply_leeway(true_course: Float, leeway: Float) -> Float:
+    """KdW from rwK and BW."""
+    return normalize_course(np.add(true_course, leeway))
+
+
+# -- Current triangle --------------------------------------------------------
+
+
+def current_triangle(
+    course_through_water: Float,
+    speed_through_water: Float,
+    current_direction: Float,
+    current_speed: Float,
+) -> tuple[Float, Float]:
+    """(KüG, FüG) when steering KdW at FdW through a current StR/StG."""
+    north = _north(course_through_water, speed_through_water) + _north(
+        current_direction, current_speed
+    )
+    east = _east(course_through_water, speed_through_water) + _east(
+        current_direction, current_speed
+    )
+    return _course(north, east), np.hypot(north, east)
+
+
+def course_to_steer(
+    track: Float,
+    speed_through_water: Float,
+    current_direction: Float,
+    current_speed: Float,
+) -> tuple[Float, Float]:
+    """(KdW, FüG) that keep the boat on ``track`` (KaK) against a current.
+
+    Raises ValueError if the current is too strong to hold the track.
+    """
+    # Current component across the track must be cancelled by the boat.
+    relative = np.radians(np.subtract(current_direction, track))
+    cross = np.multiply(current_speed, np.sin(relative))
+    if np.any(np.abs(cross) > speed_through_water):
+        raise ValueError("Current too strong to hold the track")
+    correction = np.degrees(np.arcsin(-cross / speed_through_water))
+    speed_over_ground = np.multiply(
+        speed_through_water, np.cos(np.radians(correction))
+    ) + np.multiply(current_speed, np.cos(relative))
+    if np.any(speed_over_ground <= 0):
+        raise ValueError("Current too strong to make way along the track")
+    return normalize_course(track + correction), speed_over_ground
+
+
+def current_correction(course_through_water: Float, course_over_ground: Float) -> Float:
+    """BS: angle from KdW to KüG."""
+    return signed_angle(np.subtract(course_over_ground, course_through_water))
+
+
+# -- Distance, speed, time ---------------------------------------------------
+
+
+def travel_minutes(distance: Float, speed: Float) -> Float:
+    if np.any(np.less_equal(speed, 0)):
+        raise ValueError("Speed must be positive")
+    return np.divide(distance, speed) * 60.0
+
+
+def distance_nm(speed: Float, minutes: Float) -> Float:
+    return np.multiply(speed, minutes) / 60.0
+
+
+def speed_kn(distance: Float, minutes: Float) -> Float:
+    if np.any(np.less_equal(minutes, 0)):
+        raise ValueError("Time must be positive")
+    return np.divide(distance, minutes) * 60.0
+
+
+# -- Mercator sailing --------------------------------------------------------
+
+
+def rhumb_line(
+    latitude: Float,
+    longitude: Float,
+    to_latitude: Float,
+    to_longitude: Float,
+) -> tuple[Float, Float]:
+    """(course, distance in sm) of the rhumb line between two positions.
+
+    Positions in decimal degrees, north and east positive.
+    """
+    delta_latitude = np.radians(np.subtract(to_latitude, latitude))
+    delta_longitude = np.radians(signed_angle(np.subtract(to_longitude, longitude)))
+    meridional = _meridional_parts(to_latitude) - _meridional_parts(latitude)
+    ratio = _latitude_ratio(delta_latitude, meridional, latitude)
+    course = normalize_course(np.degrees(np.arctan2(delta_longitude, meridional)))
+    distance = np.hypot(delta_latitude, ratio * delta_longitude)
+    return course, np.degrees(distance) * EARTH_MINUTES_PER_DEGREE
+
+
+def rhumb_destination(
+    latitude: Float,
+    longitude: Float,
+    course: Float,
+    distance: Float,
+) -> tuple[Float, Float]:
+    """Position reached after ``distance`` sm on a rhumb line ``course``."""
+    course_rad = np.radians(course)
+    angular_distance = np.radians(np.divide(distance, EARTH_MINUTES_PER_DEGREE))
+    delta_latitude = angular_distance * np.cos(course_rad)
+    to_latitude = np.add(latitude, np.degrees(delta_latitude))
+    meridional = _meridional_parts(to_latitude) - _meridional_parts(latitude)
+    ratio = _latitude_ratio(delta_latitude, meridional, latitude)
+    delta_longitude = angular_distance * np.sin(course_rad) / ratio
+    return to_latitude, signed_angle(np.add(longitude, np.degrees(delta_longitude)))
+
+
+def degrees_minutes(degrees: Float, minutes: Float) -> Float:
+    """Decimal degrees from the chart notation (54°06,2' -> 54.1033)."""
+    sign = np.where(np.less(degrees, 0), -1.0, 1.0)
+    return (sign * (np.abs(degrees) + np.divide(minutes, EARTH_MINUTES_PER_DEGREE)))[()]
+
+
+# -- Tides -------------------------------------------------------------------
+
+
+def twelfths_rule_height(
+    low_water_height: Float,
+    high_water_height: Float,
+    hours_after_low_water: Float,
+    duration_hours: Float = 6.0,
+) -> Float:
+    """Water height on the rising tide by the rule of twelfths.
+
+    For the falling tide pass the hours *before* low water. The rise is
+    scaled to ``duration_hours`` and interpolated within each hour.
+    """
+    if np.any(np.less_equal(duration_hours, 0)):
+        raise ValueError("Tide duration must be positive")
+    step = np.clip(np.divide(hours_after_low_water, duration_hours) * 6.0, 0.0, 6.0)
+    share = np.interp(step, range(len(_TWELFTHS)), _TWELFTHS)
+    return low_water_height + np.subtract(high_water_height, low_water_height) * share / 12.0
+
+
+def _north(course: Float, speed: Float) -> Float:
+    return np.multiply(speed, np.cos(np.radians(course)))
+
+
+def _east(course: Float, speed: Float) -> Float:
+    return np.multiply(speed, np.sin(np.radians(course)))
+
+
+def _course(north: Float, east: Float) -> Float:
+    return normalize_course(np.degrees(np.arctan2(east, north)))
+
+
+def _latitude_ratio(delta_latitude: Float, meridional: Float, latitude: Float) -> Float:
+    """Δφ/Δψ; on (nearly) east-west courses its limit cos φ avoids 0/0."""
+    east_west = np.abs(meridional) <= 1e-12
+    ratio = np.divide(delta_latitude, np.where(east_west, 1.0, meridional))
+    return np.where(east_west, np.cos(np.radians(latitude)), ratio)[()]
+
+
+def _meridional_parts(latitude: Float) -> Float:
+    return np.log(np.tan(np.pi / 4 + np.radians(latitude) / 2))
@@ -5,9 +5,20 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from evaluation.controller.grading_job_stream import (
+    GradingJobOut,
+    GradingJobRunner,
+    GradingProgressReader,
+    grading_events,
+    job_to_out,
+)
+from evaluation.model.grading_job import GradingJobKind
+from evaluation.service.grading_job_service import GradingJobService
+from navigation.model.navigation_result import NavigationQuestionResult
 from navigation.service.navigation_service import NavigationService, NavigationTemplate
 
 router = APIRouter(tags=["Navigation"])
@@ -118,6 +129,19 @@ def get_navigation_service() -> NavigationService:
     raise NotImplementedError("Must be overridden via app.dependency_overrides")
 
 
+def get_grading_job_service() -> GradingJobService:
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
+def get_navigation_submit_job_runner() -> GradingJobRunner:
+    """Return a job submitting the session of a grading job in its own DB session."""
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
+def get_navigation_grading_progress_reader() -> GradingProgressReader:
+    raise NotImplementedError("Must be overridden via app.dependency_overrides")
+
+
 # -- Endpoints -------------------------------------------------------------
 
 
@@ -219,6 +243,80 @@ async def submit_navigation_session(
     return _result_to_out(result)
 
 
+@router.post(
+    "/navigation-sessions/{session_id}/submit-jobs",
+    response_model=GradingJobOut,
+    status_code=202,
+)
+async def start_navigation_submit_job(
+    session_id: str,
+    background_tasks: BackgroundTasks,
+    service: NavigationService = Depends(get_navigation_service),
+    job_service: GradingJobService = Depends(get_grading_job_service),
+    run_job: GradingJobRunner = Depends(get_navigation_submit_job_runner),
+) -> GradingJobOut:
+    """Submit without waiting for grading; follow progress via the events stream.
+
+    Submitting again returns the existing job rather than grading twice.
+    """
+    try:
+        await service.get_session_details(session_id=session_id)
+        job, needs_run = await job_service.start(GradingJobKind.NAVIGATION, session_id)
+    except ValueError as exc:
+        raise _error_for(exc)
+
+    if needs_run:
+        background_tasks.add_task(run_job, job.id)
+    return job_to_out(job)
+
+
+@router.get(
+    "/navigation-sessions/{session_id}/submit-jobs/{job_id}",
+    response_model=GradingJobOut,
+)
+async def get_navigation_submit_job(
+    session_id: str,
+    job_id: str,
+    job_service: GradingJobService = Depends(get_grading_job_service),
+) -> GradingJobOut:
+    try:
+        job = await job_service.get(GradingJobKind.NAVIGATION, session_id, job_id)
+    except ValueError as exc:
+        raise _error_for(exc)
+    return job_to_out(job)
+
+
+@router.get(
+    "/navigation-sessions/{session_id}/submit-jobs/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_navigation_submit_job(
+    session_id: str,
+    job_id: str,
+    job_service: GradingJobService = Depends(get_grading_job_service),
+    read_progress: GradingProgressReader = Depends(get_navigation_grading_progress_reader),
+) -> StreamingResponse:
+    """Server-Sent Events: one ``question`` event per graded task
+    (NavigationQuestionResultOut), then ``result`` (NavigationResultOut) or ``error``."""
+    try:
+        await job_service.get(GradingJobKind.NAVIGATION, session_id, job_id)
+    except ValueError as exc:
+        raise _error_for(exc)
+
+    return StreamingResponse(
+        grading_events(
+            job_id,
+            read_progress,
+            question_key=lambda q: str(q.task_number),
+            question_to_out=_question_result_to_out,
+            result_to_out=_result_to_out,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/navigation-sessions/{session_id}/result",
     response_model=NavigationResultOut,
@@ -298,22 +396,23 @@ def _result_to_out(result) -> NavigationResultOut:
         max_score=result.max_score,
         passed=result.passed,
         pass_score_threshold=result.pass_score_threshold,
-        questions=[
-            NavigationQuestionResultOut(
-                task_number=q.task_number,
-                task_id=q.task_id,
-                context=q.context,
-                sub_questions=q.sub_questions,
-                key_answers=q.key_answers,
-                solution_text=q.solution_text,
-                student_answer=q.student_answer,
-                score=q.score,
-                max_score=q.max_score,
-                is_correct=q.is_correct,
-                feedback=q.feedback,
-            )
-            for q in result.questions
-        ],
+        questions=[_question_result_to_out(q) for q in result.questions],
+    )
+
+
+def _question_result_to_out(q: NavigationQuestionResult) -> NavigationQuestionResultOut:
+    return NavigationQuestionResultOut(
+        task_number=q.task_number,
+        task_id=q.task_id,
+        context=q.context,
+        sub_questions=q.sub_questions,
+        key_answers=q.key_answers,
+        solution_text=q.solution_text,
+        student_answer=q.student_answer,
+        score=q.score,
+        max_score=q.max_score,
+        is_correct=q.is_correct,
+        feedback=q.feedback,
     )
 
 
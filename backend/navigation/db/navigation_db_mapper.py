@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from navigation.db.navigation_tables import NavigationAnswerRow, NavigationSessionRow, NavigationTaskRow
+from navigation.model.key_answer import KeyAnswer, KeyValue, QuantityUnit
 from navigation.model.navigation_answer import NavigationAnswer
 from navigation.model.navigation_session import NavigationSession, NavigationSessionStatus
 from navigation.model.navigation_task import NavigationTask, SubQuestion
+from navigation.service.key_answer_parser import parse_key_answers
 
 
 class NavigationDbMapper:
@@ -25,6 +27,11 @@ class NavigationDbMapper:
             ],
             solution_text=row.solution_text,
             key_answers=row.key_answers or [],
+            parsed_key_answers=(
+                NavigationDbMapper.key_answers_from_json(row.parsed_key_answers)
+                if row.parsed_key_answers is not None
+                else parse_key_answers(row.key_answers or [])
+            ),
         )
 
     @staticmethod
@@ -40,8 +47,47 @@ class NavigationDbMapper:
             ],
             solution_text=task.solution_text,
             key_answers=task.key_answers,
+            parsed_key_answers=NavigationDbMapper.key_answers_to_json(task.parsed_key_answers),
         )
 
+    @staticmethod
+    def key_answers_to_json(key_answers: list[KeyAnswer]) -> list[dict]:
+        return [
+            {
+                "text": key.text,
+                "quantity": key.quantity,
+                "values": [
+                    {
+                        "value": value.value,
+                        "unit": value.unit.value,
+                        "tolerance": value.tolerance,
+                        "quantity": value.quantity,
+                    }
+                    for value in key.values
+                ],
+            }
+            for key in key_answers
+        ]
+
+    @staticmethod
+    def key_answers_from_json(data: list[dict]) -> list[KeyAnswer]:
+        return [
+            KeyAnswer(
+                text=item["text"],
+                quantity=item.get("quantity"),
+                values=tuple(
+                    KeyValue(
+                        value=float(value["value"]),
+                        unit=QuantityUnit(value["unit"]),
+                        tolerance=float(value.get("tolerance", 0.0)),
+                        quantity=value.get("quantity"),
+                    )
+                    for value in item.get("values", [])
+                ),
+            )
+            for item in data
+        ]
+
     @staticmethod
     def session_to_domain(row: NavigationSessionRow) -> NavigationSession:
         return NavigationSession(
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database import Base
@@ -25,6 +25,8 @@ class NavigationTaskRow(Base):
     sub_questions: Mapped[list] = mapped_column(JSON, default=list)
     solution_text: Mapped[str] = mapped_column(Text, default="")
     key_answers: Mapped[list] = mapped_column(JSON, default=list)
+    # key_answers parsed by the seed script; NULL for rows seeded before.
+    parsed_key_answers: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
 
     __table_args__ = (
         UniqueConstraint("sheet_number", "task_number", name="uq_nav_tasks_sheet_task"),
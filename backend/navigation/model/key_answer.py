@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class QuantityUnit(StrEnum):
+    """Canonical unit of a numeric value in a navigation answer.
+
+    Clock times are minutes since midnight, durations minutes, positions
+    arc minutes (latitude north, longitude east).
+    """
+
+    DEGREES = "deg"
+    NAUTICAL_MILES = "sm"
+    KNOTS = "kn"
+    METRES = "m"
+    MINUTES = "min"
+    CLOCK_TIME = "time"
+    LATITUDE = "lat"
+    LONGITUDE = "lon"
+    NONE = ""
+
+
+@dataclass(frozen=True)
+class KeyValue:
+    """One number with its accepted deviation.
+
+    ``quantity`` is the casefolded label it was written under (``"kak"``,
+    ``"d"``), if any.
+    """
+
+    value: float
+    unit: QuantityUnit
+    tolerance: float = 0.0
+    quantity: str | None = None
+
+
+@dataclass(frozen=True)
+class KeyAnswer:
+    """A key answer like ``KaK = 286° [± 1°]`` in structured form.
+
+    ``values`` is empty if the text could not be parsed; such keys are
+    matched textually.
+    """
+
+    text: str
+    quantity: str | None = None
+    values: tuple[KeyValue, ...] = field(default_factory=tuple)
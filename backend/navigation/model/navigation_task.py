@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from navigation.model.key_answer import KeyAnswer
+
 
 @dataclass(frozen=True)
 class SubQuestion:
@@ -23,3 +25,4 @@ class NavigationTask:
     sub_questions: list[SubQuestion] = field(default_factory=list)
     solution_text: str = ""
     key_answers: list[str] = field(default_factory=list)
+    parsed_key_answers: list[KeyAnswer] = field(default_factory=list)
@@ -1,18 +1,44 @@
 """Simple heuristic evaluator for navigation answers.
 
-Checks whether key answers appear (approximately) in the student's response.
-Used as a fallback when no AI evaluator is configured.
+Checks whether the key values appear, within their tolerance, among the
+numbers of the student's response. Key answers are parsed at seed time
+(``NavigationEvaluationRequest.parsed_key_answers``); the student answer is
+scanned once and its numbers grouped by unit, so every key only compares
+against the candidates of its own unit. Numbers the student writes after
+a quantity label (``KaK = 286°``, ``d = 9,7``) only count for key values of
+that quantity, so a distance or a swapped course cannot satisfy a course
+key; unlabelled numbers count for any key of their unit. Courses wrap at
+360°, signed corrections (Abl, Mw, BW, BS) do not. Used as a fallback when
+no AI evaluator is configured.
 """
 
 from __future__ import annotations
 
 import re
 
+from navigation.model.key_answer import KeyAnswer, KeyValue, QuantityUnit
+from navigation.service.key_answer_parser import (
+    ANGLE_OFFSETS,
+    QUANTITY_UNITS,
+    parse_key_answers,
+    scan_labelled_values,
+)
 from navigation.service.navigation_evaluator_port import (
     NavigationEvaluation,
     NavigationEvaluationRequest,
 )
 
+# Absorbs float noise from decimal commas ("0,3" vs 0.30000000000000004).
+_EPSILON = 1e-6
+# Numbers written without a unit may stand for any of these quantities.
+_BARE_NUMBER_UNITS = {
+    QuantityUnit.DEGREES,
+    QuantityUnit.NAUTICAL_MILES,
+    QuantityUnit.KNOTS,
+    QuantityUnit.METRES,
+    QuantityUnit.MINUTES,
+}
+
 
 class HeuristicNavigationEvaluator:
     """Keyword/tolerance-based evaluator for navigation answers."""
@@ -35,12 +61,12 @@ class HeuristicNavigationEvaluator:
                 ),
             )
 
-        matched = 0
+        keys = request.parsed_key_answers or parse_key_answers(request.key_answers)
+        student_values = _group_by_unit(scan_labelled_values(request.student_answer))
         student_normalised = _normalise(request.student_answer)
-        for key in request.key_answers:
-            value = _extract_value(key)
-            if value and value in student_normalised:
-                matched += 1
+        matched = sum(
+            1 for key in keys if _key_is_matched(key, student_values, student_normalised)
+        )
 
         ratio = matched / len(request.key_answers) if request.key_answers else 0.0
         score = round(request.max_score * ratio, 1)
@@ -62,6 +88,63 @@ class HeuristicNavigationEvaluator:
         return {"provider": "heuristic", "deterministic": True}
 
 
+def _group_by_unit(values: list[KeyValue]) -> dict[QuantityUnit, list[KeyValue]]:
+    grouped: dict[QuantityUnit, list[KeyValue]] = {}
+    for value in values:
+        grouped.setdefault(value.unit, []).append(value)
+    return grouped
+
+
+def _key_is_matched(
+    key: KeyAnswer,
+    student_values: dict[QuantityUnit, list[KeyValue]],
+    student_normalised: str,
+) -> bool:
+    if not key.values:
+        value = _extract_value(key.text)
+        return bool(value) and value in student_normalised
+    return all(_value_is_matched(expected, student_values) for expected in key.values)
+
+
+def _value_is_matched(
+    expected: KeyValue,
+    student_values: dict[QuantityUnit, list[KeyValue]],
+) -> bool:
+    candidates = student_values.get(expected.unit, [])
+    if expected.unit in _BARE_NUMBER_UNITS:
+        candidates = candidates + [
+            value
+            for value in student_values.get(QuantityUnit.NONE, [])
+            if value.quantity is None or expected.unit in QUANTITY_UNITS[value.quantity]
+        ]
+    candidates = [
+        value.value
+        for value in candidates
+        if value.quantity is None or expected.quantity in (None, value.quantity)
+    ]
+    limit = expected.tolerance + _EPSILON
+    if _is_course(expected):
+        return any(
+            0 <= value <= 360 and _angle_difference(value, expected.value) <= limit
+            for value in candidates
+        )
+    return any(abs(value - expected.value) <= limit for value in candidates)
+
+
+def _is_course(value: KeyValue) -> bool:
+    """Courses and bearings wrap at 360°; signed corrections do not."""
+    return (
+        value.unit == QuantityUnit.DEGREES
+        and value.quantity not in ANGLE_OFFSETS
+        and value.value >= 0
+    )
+
+
+def _angle_difference(a: float, b: float) -> float:
+    difference = abs(a - b) % 360
+    return min(difference, 360 - difference)
+
+
 def _normalise(text: str) -> str:
     return re.sub(r"\s+", " ", text.lower().strip())
 
@@ -0,0 +1,249 @@
+"""Parsing of navigation key answers and of the numbers in student answers.
+
+Key answers are free text like ``KaK = 286° [± 1°]``,
+``BV = 110° / 1,2 sm [± 20° / ± 0,2 sm]`` or
+``d = 28,7 sm / 5 kn * 60 = 344 min = 5 h 44 min [± 4 min]``. The parser
+turns them into ``KeyAnswer`` values (number, canonical unit, tolerance and
+the quantity label the number belongs to) once, at seed time; the evaluator
+then only has to extract the numbers of the student answer with the same
+scanner and compare.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import replace
+
+from navigation.model.key_answer import KeyAnswer, KeyValue, QuantityUnit
+
+_NUMBER = r"\d+(?:[,.]\d+)?"
+_ARC_MINUTE = r"['‘’′]"
+_LATITUDE = re.compile(rf"(\d{{1,2}})\s*°\s*({_NUMBER})\s*{_ARC_MINUTE}?\s*N\b")
+_LONGITUDE = re.compile(rf"(\d{{1,3}})\s*°\s*({_NUMBER})\s*{_ARC_MINUTE}?\s*[EO]\b")
+_CLOCK_TIME = re.compile(r"(?<![\d,.:])(\d{1,2}):(\d{2})(?![\d:])")
+_HOURS_MINUTES = re.compile(r"(\d+)\s*h\s*(\d+)\s*min\b")
+_MINUTES = re.compile(rf"({_NUMBER})\s*min\b")
+_HOURS = re.compile(rf"({_NUMBER})\s*h\b")
+_WITH_UNIT = re.compile(rf"([+\-–−±]?\s*{_NUMBER})\s*(°|(?:sm|kn|m)\b)")
+_BARE_NUMBER = re.compile(rf"(?<![\w,.])([+\-–−]?\s*{_NUMBER})(?![\w,.]*\d)")
+
+_BRACKET = re.compile(r"\[([^\]]*)\]")
+_QUOTED = re.compile(r"„[^“”]*[“”]|\"[^\"]*\"")
+_DATE = re.compile(r"\b\d{1,2}\.\d{1,2}\.\d{2,4}\b")
+_TOLERANCE = re.compile(rf"±\s*({_NUMBER})\s*(°|sm|kn|min|m|{_ARC_MINUTE})?")
+_QUANTITY = re.compile(r"^\s*([A-Za-zÄÖÜäöü]{1,4})\s*=")
+_TRAILING_LABEL = re.compile(r"\s([A-Za-zÄÖÜäöü]{2,4})\s*$")
+# Units and time zones end a value, they are not labels of the next one.
+_NOT_LABELS = {"sm", "kn", "min", "bz", "mez", "mesz", "utc"}
+
+_COURSE = frozenset({QuantityUnit.DEGREES})
+# Units the values of a quantity label can be in (keys are casefolded). A
+# number written after such a label is read as that quantity.
+QUANTITY_UNITS: dict[str, frozenset[QuantityUnit]] = {
+    **dict.fromkeys(
+        ("mgk", "mwk", "rwk", "kdw", "küg", "kak", "mgp", "mwp", "rwp"),
+        _COURSE,
+    ),
+    **dict.fromkeys(("abl", "mw", "bw", "bs", "str"), _COURSE),
+    "bv": frozenset({QuantityUnit.DEGREES, QuantityUnit.NAUTICAL_MILES}),
+    "d": frozenset({QuantityUnit.NAUTICAL_MILES, QuantityUnit.MINUTES}),
+    **dict.fromkeys(("füg", "fdw", "stg"), frozenset({QuantityUnit.KNOTS})),
+    **dict.fromkeys(("t", "fd"), frozenset({QuantityUnit.MINUTES})),
+    **dict.fromkeys(("eta", "hwz"), frozenset({QuantityUnit.CLOCK_TIME})),
+    **dict.fromkeys(("tf", "ts", "hwh"), frozenset({QuantityUnit.METRES})),
+}
+# Signed corrections in degrees; unlike courses they do not wrap at 360°.
+ANGLE_OFFSETS = frozenset({"abl", "mw", "bw", "bs"})
+_LABEL_ALIASES = {"distanz": "d"}
+# A label followed by an operator is a variable of a formula ("t = d / v").
+_LABEL = re.compile(
+    r"(?<![\wÄÖÜäöü])("
+    + "|".join(sorted([*QUANTITY_UNITS, *_LABEL_ALIASES], key=len, reverse=True))
+    + r")(?![\wÄÖÜäöü])(?!\s*[/*+×·])",
+    re.IGNORECASE,
+)
+
+_UNIT_SYMBOLS = {
+    "°": QuantityUnit.DEGREES,
+    "sm": QuantityUnit.NAUTICAL_MILES,
+    "kn": QuantityUnit.KNOTS,
+    "m": QuantityUnit.METRES,
+}
+# A tolerance written in one unit covers values of these units.
+_TOLERANCE_UNITS = {
+    "°": {QuantityUnit.DEGREES},
+    "sm": {QuantityUnit.NAUTICAL_MILES},
+    "kn": {QuantityUnit.KNOTS},
+    "m": {QuantityUnit.METRES},
+    "min": {QuantityUnit.MINUTES, QuantityUnit.CLOCK_TIME},
+    "'": {QuantityUnit.LATITUDE, QuantityUnit.LONGITUDE},
+}
+
+
+def parse_key_answer(text: str) -> KeyAnswer:
+    tolerances = [
+        tolerance
+        for bracket in _BRACKET.findall(text)
+        for tolerance in _TOLERANCE.findall(bracket)
+    ]
+    body = _DATE.sub(" ", _QUOTED.sub(" ", _BRACKET.sub(" ", text)))
+    quantity_match = _QUANTITY.match(body)
+
+    values = _positions(body) or [
+        _with_fitting_quantity(value)
+        for statement in body.split(";")
+        for label, segment in _result_segments(statement)
+        for value in scan_labelled_values(segment, include_bare=False, quantity=label)
+    ]
+    values = _apply_tolerances(values, tolerances)
+    return KeyAnswer(
+        text=text,
+        quantity=quantity_match.group(1) if quantity_match else None,
+        values=tuple(values),
+    )
+
+
+def parse_key_answers(texts: Iterable[str]) -> list[KeyAnswer]:
+    return [parse_key_answer(text) for text in texts]
+
+
+def scan_values(text: str, include_bare: bool = False) -> list[KeyValue]:
+    """All numbers with a recognisable unit, in canonical units.
+
+    Positions and clock times are taken first and blanked out, so their
+    digits are not read again as plain numbers. ``include_bare`` also
+    returns numbers without a unit (students often omit "°").
+    """
+    values: list[KeyValue] = []
+    remaining = text
+
+    def take(pattern: re.Pattern[str], convert) -> None:
+        nonlocal remaining
+        for match in pattern.finditer(remaining):
+            values.append(convert(match))
+        remaining = pattern.sub(lambda match: " " * len(match.group(0)), remaining)
+
+    take(_LATITUDE, lambda m: KeyValue(_arc_minutes(m), QuantityUnit.LATITUDE))
+    take(_LONGITUDE, lambda m: KeyValue(_arc_minutes(m), QuantityUnit.LONGITUDE))
+    take(_CLOCK_TIME, lambda m: KeyValue(_clock_minutes(m), QuantityUnit.CLOCK_TIME))
+    take(_HOURS_MINUTES, lambda m: KeyValue(_clock_minutes(m), QuantityUnit.MINUTES))
+    take(_MINUTES, lambda m: KeyValue(_number(m.group(1)), QuantityUnit.MINUTES))
+    take(_HOURS, lambda m: KeyValue(_number(m.group(1)) * 60, QuantityUnit.MINUTES))
+    take(_WITH_UNIT, lambda m: KeyValue(_number(m.group(1)), _UNIT_SYMBOLS[m.group(2)]))
+    if include_bare:
+        take(_BARE_NUMBER, lambda m: KeyValue(_number(m.group(1)), QuantityUnit.NONE))
+    return values
+
+
+def scan_labelled_values(
+    text: str,
+    include_bare: bool = True,
+    quantity: str | None = None,
+) -> list[KeyValue]:
+    """``scan_values`` with ``KeyValue.quantity`` set to the label before each value.
+
+    Labels are the casefolded keys of ``QUANTITY_UNITS``; values before the
+    first label get ``quantity``.
+    """
+    boundaries = [
+        (match.start(), _canonical_label(match.group(1))) for match in _LABEL.finditer(text)
+    ]
+    parts = [(0, quantity), *boundaries]
+    ends = [start for start, _ in boundaries] + [len(text)]
+    return [
+        replace(value, quantity=label)
+        for (start, label), end in zip(parts, ends)
+        for value in scan_values(text[start:end], include_bare=include_bare)
+    ]
+
+
+def _positions(body: str) -> list[KeyValue]:
+    return [
+        value
+        for value in scan_values(body)
+        if value.unit in (QuantityUnit.LATITUDE, QuantityUnit.LONGITUDE)
+    ]
+
+
+def _result_segments(body: str) -> list[tuple[str | None, str]]:
+    """(label, text) of the parts of ``body`` that state results.
+
+    In a chain ``a = b = c`` only ``c`` is the result, labelled with the
+    last label before the first ``=``. A segment that ends with a new label
+    (``StR = 137° StG = 0,5 kn``) holds a result too and starts a new chain.
+    """
+    segments = body.split("=")
+    if len(segments) == 1:
+        return [(None, body)]
+    chain_label = _last_label(segments[0])
+    results: list[tuple[str | None, str]] = []
+    for segment in segments[1:-1]:
+        label = _TRAILING_LABEL.search(segment)
+        if label is not None and label.group(1).lower() not in _NOT_LABELS:
+            results.append((chain_label, segment[: label.start()]))
+            chain_label = _last_label(segment[label.start() :])
+    results.append((chain_label, segments[-1]))
+    return results
+
+
+def _last_label(text: str) -> str | None:
+    labels = _LABEL.findall(text)
+    return _canonical_label(labels[-1]) if labels else None
+
+
+def _canonical_label(label: str) -> str:
+    label = label.casefold()
+    return _LABEL_ALIASES.get(label, label)
+
+
+def _with_fitting_quantity(value: KeyValue) -> KeyValue:
+    """Drop a label that cannot describe the value ("1 h vor HWZ ... 105°")."""
+    if value.quantity is None or value.unit in QUANTITY_UNITS[value.quantity]:
+        return value
+    return replace(value, quantity=None)
+
+
+def _apply_tolerances(
+    values: list[KeyValue],
+    tolerances: list[tuple[str, str]],
+) -> list[KeyValue]:
+    if not tolerances:
+        return values
+
+    by_unit: dict[QuantityUnit, float] = {}
+    unitless: float | None = None
+    for amount, symbol in tolerances:
+        symbol = "'" if re.fullmatch(_ARC_MINUTE, symbol or "") else symbol
+        if not symbol:
+            unitless = _number(amount)
+            continue
+        # The last tolerance of a unit belongs to the result, earlier ones
+        # to intermediate values ("5,9 sm [± 0,1 sm] + ... = 11 sm [± 0,2 sm]").
+        for unit in _TOLERANCE_UNITS[symbol]:
+            by_unit[unit] = _number(amount)
+
+    applied = [
+        replace(value, tolerance=by_unit.get(value.unit, unitless or 0.0)) for value in values
+    ]
+    # Values the tolerance says nothing about (e.g. the "1 h" in
+    # "1 h vor HWZ 105° [± 5°]") are context, not results.
+    if by_unit and unitless is None:
+        toleranced = [value for value in applied if value.unit in by_unit]
+        if toleranced:
+            return toleranced
+    return applied
+
+
+def _clock_minutes(match: re.Match[str]) -> float:
+    return float(int(match.group(1)) * 60 + int(match.group(2)))
+
+
+def _arc_minutes(match: re.Match[str]) -> float:
+    return int(match.group(1)) * 60 + _number(match.group(2))
+
+
+def _number(raw: str) -> float:
+    cleaned = re.sub(r"\s+", "", raw).replace(",", ".").replace("±", "")
+    cleaned = cleaned.replace("–", "-").replace("−", "-")
+    return float(cleaned)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Protocol
 
+from navigation.model.key_answer import KeyAnswer
+
 
 @dataclass(frozen=True)
 class NavigationEvaluationRequest:
@@ -14,6 +16,8 @@ class NavigationEvaluationRequest:
     solution_text: str
     student_answer: str
     max_score: float
+    # Structured form of ``key_answers``; parsed on the fly if empty.
+    parsed_key_answers: list[KeyAnswer] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
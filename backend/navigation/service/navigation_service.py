@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from evaluation.model.grading_job import GradingProgress
+from evaluation.service.evaluation_executor import EvaluationExecutor
 from navigation.model.navigation_answer import NavigationAnswer
 from navigation.model.navigation_result import NavigationQuestionResult, NavigationSessionResult
 from navigation.model.navigation_session import (
@@ -14,7 +18,12 @@ from navigation.model.navigation_session import (
     NavigationSessionQuestion,
     NavigationSessionStatus,
 )
-from navigation.service.navigation_evaluator_port import NavigationEvaluationRequest, NavigationEvaluatorPort
+from navigation.service.heuristic_navigation_evaluator import HeuristicNavigationEvaluator
+from navigation.service.navigation_evaluator_port import (
+    NavigationEvaluation,
+    NavigationEvaluationRequest,
+    NavigationEvaluatorPort,
+)
 from navigation.service.navigation_repository_port import NavigationRepositoryPort
 
 DEFAULT_TIME_LIMIT_MINUTES = 90
@@ -43,9 +52,12 @@ class NavigationService:
         evaluator: NavigationEvaluatorPort,
         default_time_limit_minutes: int = DEFAULT_TIME_LIMIT_MINUTES,
         pass_threshold: float = DEFAULT_PASS_THRESHOLD,
+        evaluation_executor: EvaluationExecutor | None = None,
     ) -> None:
         self._repo = repository
         self._evaluator = evaluator
+        self._fallback_evaluator = HeuristicNavigationEvaluator()
+        self._evaluation_executor = evaluation_executor or EvaluationExecutor()
         self._default_time_limit_minutes = default_time_limit_minutes
         self._pass_threshold = pass_threshold
 
@@ -159,7 +171,17 @@ class NavigationService:
         await self._repo.save_answer(answer)
         return answer
 
-    async def submit_session(self, session_id: str) -> NavigationSessionResult:
+    async def submit_session(
+        self,
+        session_id: str,
+        checkpoint: Callable[[], Awaitable[None]] | None = None,
+    ) -> NavigationSessionResult:
+        """Grade every answer and finalize the session.
+
+        With a ``checkpoint``, each answer is saved as soon as it is graded and
+        the checkpoint is awaited right after, so the caller can commit and
+        make the progress visible.
+        """
         session = await self._repo.get_session(session_id=session_id)
         if session is None:
             raise ValueError(f"Navigation session {session_id!r} not found")
@@ -179,28 +201,51 @@ class NavigationService:
         tasks_by_id = {t.task_id: t for t in tasks}
 
         total_score = 0.0
+        graded: list[tuple[NavigationAnswer, NavigationEvaluationRequest]] = []
         for answer in answers:
+            if answer.score is not None:
+                # Answers are frozen once submitted; graded by an earlier run.
+                total_score += answer.score
+                continue
             task = tasks_by_id.get(answer.task_id)
             if task is None:
                 continue
-
-            evaluation = await self._evaluator.evaluate(
-                NavigationEvaluationRequest(
-                    context=task.context,
-                    sub_questions=[sq.text for sq in task.sub_questions],
-                    key_answers=task.key_answers,
-                    solution_text=task.solution_text,
-                    student_answer=answer.student_answer,
-                    max_score=float(task.points),
+            graded.append(
+                (
+                    answer,
+                    NavigationEvaluationRequest(
+                        context=task.context,
+                        sub_questions=[sq.text for sq in task.sub_questions],
+                        key_answers=task.key_answers,
+                        solution_text=task.solution_text,
+                        student_answer=answer.student_answer,
+                        max_score=float(task.points),
+                        parsed_key_answers=task.parsed_key_answers,
+                    ),
                 )
             )
 
-            score = max(0.0, min(float(task.points), evaluation.score))
-            answer.score = round(score, 1)
-            answer.is_correct = evaluation.is_correct
-            answer.feedback = evaluation.feedback
+        save_lock = asyncio.Lock()
+
+        async def save_progress(index: int, evaluation: NavigationEvaluation) -> None:
+            answer, request = graded[index]
+            _apply_evaluation(answer, request, evaluation)
+            async with save_lock:
+                await self._repo.save_answer(answer)
+                await checkpoint()
+
+        evaluations = await self._evaluation_executor.map(
+            [request for _, request in graded],
+            self._evaluator.evaluate,
+            self._fallback_evaluator.evaluate,
+            on_result=save_progress if checkpoint is not None else None,
+        )
+
+        for (answer, request), evaluation in zip(graded, evaluations, strict=True):
+            if checkpoint is None:
+                _apply_evaluation(answer, request, evaluation)
+                await self._repo.save_answer(answer)
             total_score += answer.score
-            await self._repo.save_answer(answer)
 
         session.status = NavigationSessionStatus.EVALUATED
         session.total_score = round(total_score, 1)
@@ -216,23 +261,7 @@ class NavigationService:
         if session.status != NavigationSessionStatus.EVALUATED:
             raise ValueError("Navigation result is not available yet")
 
-        questions: list[NavigationQuestionResult] = []
-        for q in details.questions:
-            questions.append(
-                NavigationQuestionResult(
-                    task_number=q.task_number,
-                    task_id=q.task.task_id,
-                    context=q.task.context,
-                    sub_questions=[sq.text for sq in q.task.sub_questions],
-                    key_answers=q.task.key_answers,
-                    solution_text=q.task.solution_text,
-                    student_answer=q.answer.student_answer,
-                    score=q.answer.score or 0.0,
-                    max_score=float(q.task.points),
-                    is_correct=bool(q.answer.is_correct),
-                    feedback=q.answer.feedback or "Keine Bewertung vorhanden.",
-                )
-            )
+        questions = [_question_result(q) for q in details.questions]
 
         return NavigationSessionResult(
             session_id=session.id,
@@ -248,3 +277,48 @@ class NavigationService:
             pass_score_threshold=self._pass_threshold,
             questions=questions,
         )
+
+    async def get_grading_progress(
+        self,
+        session_id: str,
+    ) -> GradingProgress[NavigationQuestionResult, NavigationSessionResult]:
+        """Return the tasks graded so far for a submitted session."""
+        details = await self.get_session_details(session_id=session_id)
+        status = details.session.status
+        if status == NavigationSessionStatus.EVALUATED:
+            result = await self.get_result(session_id=session_id)
+            return GradingProgress(questions=result.questions, result=result)
+        if status != NavigationSessionStatus.SUBMITTED:
+            return GradingProgress(questions=[])
+        return GradingProgress(
+            questions=[
+                _question_result(q) for q in details.questions if q.answer.score is not None
+            ]
+        )
+
+
+def _apply_evaluation(
+    answer: NavigationAnswer,
+    request: NavigationEvaluationRequest,
+    evaluation: NavigationEvaluation,
+) -> None:
+    score = max(0.0, min(request.max_score, evaluation.score))
+    answer.score = round(score, 1)
+    answer.is_correct = evaluation.is_correct
+    answer.feedback = evaluation.feedback
+
+
+def _question_result(q: NavigationSessionQuestion) -> NavigationQuestionResult:
+    return NavigationQuestionResult(
+        task_number=q.task_number,
+        task_id=q.task.task_id,
+        context=q.task.context,
+        sub_questions=[sq.text for sq in q.task.sub_questions],
+        key_answers=q.task.key_answers,
+        solution_text=q.task.solution_text,
+        student_answer=q.answer.student_answer,
+        score=q.answer.score or 0.0,
+        max_score=float(q.task.points),
+        is_correct=bool(q.answer.is_correct),
+        feedback=q.answer.feedback or "Keine Bewertung vorhanden.",
+    )
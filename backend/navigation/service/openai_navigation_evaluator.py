@@ -7,6 +7,7 @@ import re
 
 from openai import AsyncOpenAI
 
+from evaluation.service.circuit_breaker import CircuitBreaker
 from navigation.service.heuristic_navigation_evaluator import HeuristicNavigationEvaluator
 from navigation.service.navigation_evaluator_port import (
     NavigationEvaluation,
@@ -22,8 +23,12 @@ class OpenAiNavigationEvaluator:
         api_key: str,
         model: str,
         timeout_seconds: float,
+        client: AsyncOpenAI | None = None,
+        base_url: str | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = client or AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
         self._model = model
         self._timeout_seconds = timeout_seconds
         self._fallback = HeuristicNavigationEvaluator()
@@ -35,15 +40,17 @@ class OpenAiNavigationEvaluator:
             )
 
         try:
-            completion = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user", "content": _build_user_prompt(request)},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
-                timeout=self._timeout_seconds,
+            completion = await self._circuit_breaker.call(
+                lambda: self._client.chat.completions.create(
+                    model=self._model,
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": _build_user_prompt(request)},
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.1,
+                    timeout=self._timeout_seconds,
+                )
             )
             raw = completion.choices[0].message.content or "{}"
             payload = _coerce_json(raw)
@@ -43,6 +43,22 @@ class SchedulingDbMapper:
             last_review=info.last_review,
         )
 
+    @staticmethod
+    def info_to_mapping(info: CardSchedulingInfo) -> dict:
+        """Column/value mapping for bulk Core statements (no ORM identity)."""
+        return {
+            "card_id": info.card_id,
+            "state": int(info.state),
+            "stability": info.stability,
+            "difficulty": info.difficulty,
+            "elapsed_days": info.elapsed_days,
+            "scheduled_days": info.scheduled_days,
+            "reps": info.reps,
+            "lapses": info.lapses,
+            "due": info.due,
+            "last_review": info.last_review,
+        }
+
     @staticmethod
     def log_to_domain(row: ReviewLogRow) -> ReviewLog:
         return ReviewLog(
@@ -52,6 +68,16 @@ class SchedulingDbMapper:
             review_duration_ms=row.review_duration_ms,
         )
 
+    @staticmethod
+    def log_to_mapping(log: ReviewLog) -> dict:
+        """Column/value mapping for bulk Core statements (no ORM identity)."""
+        return {
+            "card_id": log.card_id,
+            "rating": int(log.rating),
+            "reviewed_at": log.reviewed_at,
+            "review_duration_ms": log.review_duration_ms,
+        }
+
     @staticmethod
     def log_to_row(log: ReviewLog) -> ReviewLogRow:
         return ReviewLogRow(
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from scheduling.db.scheduling_db_mapper import SchedulingDbMapper
@@ -53,12 +54,49 @@ class SchedulingRepository:
         row = SchedulingDbMapper.info_to_row(info)
         await self._session.merge(row)
 
+    async def insert_many(self, infos: list[CardSchedulingInfo]) -> None:
+        """Insert new scheduling rows in one statement, skipping existing card IDs."""
+        if not infos:
+            return
+        stmt = insert(CardSchedulingInfoRow).values(
+            [SchedulingDbMapper.info_to_mapping(info) for info in infos]
+        ).on_conflict_do_nothing(index_elements=[CardSchedulingInfoRow.card_id])
+        await self._session.execute(stmt)
+
+    async def save_many(self, infos: list[CardSchedulingInfo]) -> None:
+        """Upsert scheduling rows in one statement."""
+        if not infos:
+            return
+        stmt = insert(CardSchedulingInfoRow).values(
+            [SchedulingDbMapper.info_to_mapping(info) for info in infos]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CardSchedulingInfoRow.card_id],
+            set_={
+                column.key: stmt.excluded[column.key]
+                for column in CardSchedulingInfoRow.__table__.columns
+                if not column.primary_key
+            },
+        )
+        await self._session.execute(stmt)
+
     async def save_review_log(self, log: ReviewLog) -> None:
         row = SchedulingDbMapper.log_to_row(log)
         self._session.add(row)
 
+    async def save_review_logs(self, logs: list[ReviewLog]) -> None:
+        """Insert review logs in one statement."""
+        if not logs:
+            return
+        await self._session.execute(
+            insert(ReviewLogRow).values(
+                [SchedulingDbMapper.log_to_mapping(log) for log in logs]
+            )
+        )
+
     async def list_review_logs(self) -> list[ReviewLog]:
         stmt = select(ReviewLogRow).order_by(ReviewLogRow.reviewed_at.desc())
         result = await self._session.execute(stmt)
         rows = result.scalars().all()
         return [SchedulingDbMapper.log_to_domain(row) for row in rows]
+
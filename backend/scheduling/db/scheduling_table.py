@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Float, Index, Integer, SmallInteger, String
+from sqlalchemy import DateTime, Float, Index, Integer, SmallInteger, String, column
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database import Base
@@ -16,7 +16,13 @@ class CardSchedulingInfoRow(Base):
 
     __tablename__ = "card_scheduling_info"
     __table_args__ = (
-        Index("ix_card_scheduling_info_due", "due"),
+        # Matches the study queue order so LIMITed queue reads are index-ordered.
+        Index(
+            "ix_card_scheduling_info_queue_order",
+            "due",
+            column("last_review").asc().nullsfirst(),
+            "card_id",
+        ),
     )
 
     card_id: Mapped[str] = mapped_column(String(36), primary_key=True)
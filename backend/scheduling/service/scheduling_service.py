@@ -7,6 +7,8 @@ with our own domain objects.
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 from fsrs import FSRS
 
 from scheduling.mapper.fsrs_mapper import FsrsMapper
@@ -25,13 +27,18 @@ class SchedulingService:
         self,
         card_info: CardSchedulingInfo,
         rating: Rating,
+        reviewed_at: datetime | None = None,
     ) -> tuple[CardSchedulingInfo, ReviewLog]:
-        """Review a card and return its updated scheduling info and review log."""
+        """Review a card and return its updated scheduling info and review log.
+
+        ``reviewed_at`` defaults to now; pass it to replay a review recorded earlier.
+        """
         fsrs_card = FsrsMapper.to_fsrs_card(card_info)
         fsrs_rating = FsrsMapper.to_fsrs_rating(rating)
+        now = reviewed_at.astimezone(timezone.utc) if reviewed_at else None
 
         updated_fsrs_card, fsrs_review_log = self._fsrs.review_card(
-            fsrs_card, fsrs_rating
+            fsrs_card, fsrs_rating, now
         )
 
         updated_info = FsrsMapper.to_card_scheduling_info(
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Local stand-in for the OpenAI chat-completions and transcription endpoints.
+
+Lets the AI grading and transcription paths run without a real key, e.g. to
+benchmark ``submit_session`` concurrency, the evaluation cache or the circuit
+breaker offline. Every response is a canned grade, delayed by a seeded
+latency distribution and optionally replaced by an API error.
+
+Usage:
+    python -m scripts.mock_openai_server --port 8100
+    python -m scripts.mock_openai_server --latency uniform:100:800 --error-rate 0.05
+    python -m scripts.mock_openai_server --latency lognormal:300:0.6 --seed 7
+
+Then set the OpenAI base URL in the settings to ``http://localhost:8100/v1``
+(any non-empty API key works).
+
+Latency specs (milliseconds):
+    fixed:MS                  every call takes MS
+    uniform:MIN:MAX           uniformly distributed between MIN and MAX
+    lognormal:MEDIAN:SIGMA    log-normal with the given median, long tail
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+_BATCH_ANSWER_PATTERN = re.compile(
+    r"Antwort (\d+):.*?Hoechstpunktzahl: (\d+(?:\.\d+)?)", flags=re.DOTALL
+)
+_MAX_SCORE_PATTERN = re.compile(r"von 0 bis (\d+(?:\.\d+)?)")
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Response delay in milliseconds, parsed from a ``kind:arg:arg`` spec."""
+
+    kind: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyDistribution:
+        kind, _, rest = spec.partition(":")
+        try:
+            params = tuple(float(part) for part in rest.split(":")) if rest else ()
+        except ValueError:
+            raise ValueError(f"Invalid latency spec: {spec}") from None
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2}.get(kind)
+        if expected is None or len(params) != expected or any(p < 0 for p in params):
+            raise ValueError(f"Invalid latency spec: {spec}")
+        return cls(kind=kind, params=params)
+
+    def sample_ms(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            low, high = sorted(self.params)
+            return rng.uniform(low, high)
+        median, sigma = self.params
+        if median == 0:
+            return 0.0
+        return rng.lognormvariate(math.log(median), sigma)
+
+
+@dataclass
+class MockConfig:
+    latency: LatencyDistribution = field(
+        default_factory=lambda: LatencyDistribution("fixed", (0.0,))
+    )
+    error_rate: float = 0.0
+    error_status: int = 500
+    # Fraction of each answer's maximum score handed out by the canned grade.
+    score_ratio: float = 1.0
+    feedback: str = "Simulierte Bewertung."
+    transcript: str = "Simulierte Transkription."
+    seed: int | None = None
+
+
+@dataclass
+class MockStats:
+    requests: int = 0
+    errors: int = 0
+    total_latency_ms: float = 0.0
+
+
+def create_app(config: MockConfig | None = None) -> FastAPI:
+    config = config or MockConfig()
+    rng = random.Random(config.seed)
+    stats = MockStats()
+    app = FastAPI(title="OpenAI mock")
+    app.state.stats = stats
+
+    async def simulate() -> JSONResponse | None:
+        """Apply latency and error injection; return an error response or None."""
+        stats.requests += 1
+        delay_ms = config.latency.sample_ms(rng)
+        fail = rng.random() < config.error_rate
+        stats.total_latency_ms += delay_ms
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        if not fail:
+            return None
+        stats.errors += 1
+        return JSONResponse(
+            status_code=config.error_status,
+            content={
+                "error": {
+                    "message": "Simulated upstream error",
+                    "type": "server_error",
+                    "code": None,
+                }
+            },
+        )
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        error = await simulate()
+        if error is not None:
+            return error
+        prompt = _last_user_message(body.get("messages") or [])
+        content = json.dumps(_grade(prompt, config), ensure_ascii=False)
+        return {
+            "id": f"chatcmpl-mock-{uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model") or "mock",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    @app.post("/v1/audio/transcriptions")
+    async def audio_transcriptions():
+        error = await simulate()
+        if error is not None:
+            return error
+        return {"text": config.transcript}
+
+    @app.get("/mock/stats")
+    async def read_stats():
+        return {
+            "requests": stats.requests,
+            "errors": stats.errors,
+            "mean_latency_ms": (
+                stats.total_latency_ms / stats.requests if stats.requests else None
+            ),
+        }
+
+    return app
+
+
+def _last_user_message(messages: list[dict]) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return str(message.get("content") or "")
+    return ""
+
+
+def _grade(prompt: str, config: MockConfig) -> dict:
+    """Canned grade in the shape the evaluators ask for (single or batch)."""
+    batch = _BATCH_ANSWER_PATTERN.findall(prompt)
+    if batch:
+        return {
+            "results": [
+                {"id": int(number), **_single_grade(float(max_score), config)}
+                for number, max_score in batch
+            ]
+        }
+    match = _MAX_SCORE_PATTERN.search(prompt)
+    return _single_grade(float(match.group(1)) if match else 1.0, config)
+
+
+def _single_grade(max_score: float, config: MockConfig) -> dict:
+    score = round(max_score * config.score_ratio * 2) / 2
+    return {
+        "score": score,
+        "is_correct": score >= max_score * 0.75,
+        "errors": [],
+        "feedback": config.feedback,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", default="fixed:0", help="e.g. uniform:100:800")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--score-ratio", type=float, default=1.0)
+    parser.add_argument("--feedback", default=MockConfig.feedback)
+    parser.add_argument("--transcript", default=MockConfig.transcript)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        latency = LatencyDistribution.parse(args.latency)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    import uvicorn
+
+    config = MockConfig(
+        latency=latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        score_ratio=args.score_ratio,
+        feedback=args.feedback,
+        transcript=args.transcript,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,9 +21,12 @@ from sqlalchemy import select, func
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from card.db.card_catalog_repository import CardCatalogRepository  # noqa: E402
 from card.db.card_table import CardRow  # noqa: E402
 from database import async_session_factory  # noqa: E402
+from navigation.db.navigation_db_mapper import NavigationDbMapper  # noqa: E402
 from navigation.db.navigation_tables import NavigationTaskRow  # noqa: E402
+from navigation.service.key_answer_parser import parse_key_answers  # noqa: E402
 from scheduling.db.scheduling_table import CardSchedulingInfoRow  # noqa: E402
 
 SCRIPTS_DIR = Path(__file__).resolve().parent
@@ -123,6 +126,10 @@ async def _seed_navigation(session, *, reset: bool) -> tuple[int, int]:
             sol = task["solution"]
             solution_text = sol.get("solution_markdown", sol["full_text"])
             key_answers = sol["key_answers"]
+            # Parsed once here so grading does not re-parse the key answers.
+            parsed_key_answers = NavigationDbMapper.key_answers_to_json(
+                parse_key_answers(key_answers)
+            )
 
             if not reset:
                 existing = await session.get(NavigationTaskRow, task_id)
@@ -132,6 +139,7 @@ async def _seed_navigation(session, *, reset: bool) -> tuple[int, int]:
                     existing.sub_questions = sub_questions
                     existing.solution_text = solution_text
                     existing.key_answers = key_answers
+                    existing.parsed_key_answers = parsed_key_answers
                     updated += 1
                     continue
 
@@ -145,6 +153,7 @@ async def _seed_navigation(session, *, reset: bool) -> tuple[int, int]:
                     sub_questions=sub_questions,
                     solution_text=solution_text,
                     key_answers=key_answers,
+                    parsed_key_answers=parsed_key_answers,
                 )
             )
             inserted += 1
@@ -163,6 +172,8 @@ async def run(*, if_empty: bool, reset: bool) -> None:
         print("Seeding cards...")
         c_ins, c_skip = await _seed_cards(session, reset=reset)
         print(f"  cards: {c_ins} inserted, {c_skip} skipped")
+        if c_ins or reset:
+            await CardCatalogRepository(session).bump_version()
 
         print("Seeding navigation tasks...")
         n_ins, n_upd = await _seed_navigation(session, reset=reset)
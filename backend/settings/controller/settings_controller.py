@@ -2,41 +2,61 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
 
 from settings.model.app_settings import AppSettings
 from settings.service.settings_service import SettingsService
 
 router = APIRouter(tags=["Settings"])
 
+MAX_EVALUATION_CONCURRENCY = 16
+
 
 class SettingsOut(BaseModel):
     ai_enabled: bool
     openai_api_key_set: bool
+    openai_base_url: str | None
     openai_chat_model: str
     openai_transcription_model: str
+    evaluation_concurrency: int
+    exam_background_grading: bool
+    grading_cascade_low_coverage: float
+    grading_cascade_high_coverage: float
 
 
 class SettingsIn(BaseModel):
     """Request body for `PUT /settings`.
 
     `openai_api_key` semantics: omit to leave unchanged; pass `null` or `""`
-    to clear the stored key; pass a string to replace it.
+    to clear the stored key; pass a string to replace it. `openai_base_url`
+    works the same way; cleared means the official OpenAI endpoint.
     """
 
     ai_enabled: bool | None = None
     openai_api_key: str | None = None
+    openai_base_url: str | None = None
     openai_chat_model: str | None = None
     openai_transcription_model: str | None = None
+    evaluation_concurrency: int | None = Field(
+        default=None, ge=1, le=MAX_EVALUATION_CONCURRENCY
+    )
+    exam_background_grading: bool | None = None
+    grading_cascade_low_coverage: float | None = Field(default=None, ge=0.0, le=1.0)
+    grading_cascade_high_coverage: float | None = Field(default=None, ge=0.0, le=1.0)
 
 
 def _to_out(settings: AppSettings) -> SettingsOut:
     return SettingsOut(
         ai_enabled=settings.ai_enabled,
         openai_api_key_set=bool(settings.openai_api_key),
+        openai_base_url=settings.openai_base_url,
         openai_chat_model=settings.openai_chat_model,
         openai_transcription_model=settings.openai_transcription_model,
+        evaluation_concurrency=settings.evaluation_concurrency,
+        exam_background_grading=settings.exam_background_grading,
+        grading_cascade_low_coverage=settings.grading_cascade_low_coverage,
+        grading_cascade_high_coverage=settings.grading_cascade_high_coverage,
     )
 
 
@@ -70,11 +90,22 @@ async def update_settings(
         api_key_arg = None
         clear_key = False
 
-    updated = await service.update(
-        ai_enabled=body.ai_enabled,
-        openai_api_key=api_key_arg,
-        clear_openai_api_key=clear_key,
-        openai_chat_model=body.openai_chat_model,
-        openai_transcription_model=body.openai_transcription_model,
-    )
+    clear_base_url = "openai_base_url" in fields_provided and not body.openai_base_url
+
+    try:
+        updated = await service.update(
+            ai_enabled=body.ai_enabled,
+            openai_api_key=api_key_arg,
+            clear_openai_api_key=clear_key,
+            openai_base_url=body.openai_base_url or None,
+            clear_openai_base_url=clear_base_url,
+            openai_chat_model=body.openai_chat_model,
+            openai_transcription_model=body.openai_transcription_model,
+            evaluation_concurrency=body.evaluation_concurrency,
+            exam_background_grading=body.exam_background_grading,
+            grading_cascade_low_coverage=body.grading_cascade_low_coverage,
+            grading_cascade_high_coverage=body.grading_cascade_high_coverage,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     return _to_out(updated)
@@ -0,0 +1,87 @@
+"""Postgres LISTEN adapter that invalidates the settings cache of this worker.
+
+``SettingsRepository.notify_changed`` issues a NOTIFY inside the updating
+transaction; Postgres delivers it to every listening connection once that
+transaction commits, including the one of the worker that made the change.
+The listener holds one dedicated connection and reconnects if it drops,
+invalidating the cache on every reconnect since notifications may have
+been missed in between.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from settings.db.settings_repository import SETTINGS_CHANGED_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECONNECT_DELAY_SECONDS = 5.0
+
+
+class SettingsChangeListener:
+    """Calls ``on_change`` whenever another transaction changed app_settings."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        on_change: Callable[[], None],
+        reconnect_delay_seconds: float = DEFAULT_RECONNECT_DELAY_SECONDS,
+    ) -> None:
+        self._engine = engine
+        self._on_change = on_change
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="settings-change-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen_until_disconnected()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Settings change listener failed; reconnecting", exc_info=True)
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _listen_until_disconnected(self) -> None:
+        disconnected = asyncio.Event()
+
+        def on_notification(*_args) -> None:
+            self._on_change()
+
+        def on_termination(*_args) -> None:
+            disconnected.set()
+
+        async with self._engine.connect() as connection:
+            raw = await connection.get_raw_connection()
+            driver_connection = raw.driver_connection
+            await driver_connection.add_listener(SETTINGS_CHANGED_CHANNEL, on_notification)
+            driver_connection.add_termination_listener(on_termination)
+            # Changes committed before LISTEN took effect were not announced.
+            self._on_change()
+            try:
+                await disconnected.wait()
+            finally:
+                if not driver_connection.is_closed():
+                    await driver_connection.remove_listener(
+                        SETTINGS_CHANGED_CHANNEL, on_notification
+                    )
+                driver_connection.remove_termination_listener(on_termination)
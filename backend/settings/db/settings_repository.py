@@ -2,24 +2,47 @@
 
 from __future__ import annotations
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from settings.db.settings_table import SETTINGS_ROW_ID, AppSettingsRow
 from settings.model.app_settings import (
     DEFAULT_CHAT_MODEL,
+    DEFAULT_EVALUATION_CONCURRENCY,
+    DEFAULT_GRADING_CASCADE_HIGH_COVERAGE,
+    DEFAULT_GRADING_CASCADE_LOW_COVERAGE,
     DEFAULT_TRANSCRIPTION_MODEL,
     AppSettings,
 )
 
 
+# Postgres NOTIFY channel announcing committed settings changes.
+SETTINGS_CHANGED_CHANNEL = "app_settings_changed"
+
+
 def _row_to_domain(row: AppSettingsRow) -> AppSettings:
     return AppSettings(
         ai_enabled=row.ai_enabled,
         openai_api_key=row.openai_api_key or None,
+        openai_base_url=row.openai_base_url or None,
         openai_chat_model=row.openai_chat_model or DEFAULT_CHAT_MODEL,
         openai_transcription_model=(
             row.openai_transcription_model or DEFAULT_TRANSCRIPTION_MODEL
         ),
+        evaluation_concurrency=(
+            row.evaluation_concurrency or DEFAULT_EVALUATION_CONCURRENCY
+        ),
+        exam_background_grading=bool(row.exam_background_grading),
+        grading_cascade_low_coverage=(
+            DEFAULT_GRADING_CASCADE_LOW_COVERAGE
+            if row.grading_cascade_low_coverage is None
+            else row.grading_cascade_low_coverage
+        ),
+        grading_cascade_high_coverage=(
+            DEFAULT_GRADING_CASCADE_HIGH_COVERAGE
+            if row.grading_cascade_high_coverage is None
+            else row.grading_cascade_high_coverage
+        ),
     )
 
 
@@ -43,7 +66,16 @@ class SettingsRepository:
 
         row.ai_enabled = settings.ai_enabled
         row.openai_api_key = settings.openai_api_key
+        row.openai_base_url = settings.openai_base_url
         row.openai_chat_model = settings.openai_chat_model
         row.openai_transcription_model = settings.openai_transcription_model
+        row.evaluation_concurrency = settings.evaluation_concurrency
+        row.exam_background_grading = settings.exam_background_grading
+        row.grading_cascade_low_coverage = settings.grading_cascade_low_coverage
+        row.grading_cascade_high_coverage = settings.grading_cascade_high_coverage
         await self._session.flush()
         return _row_to_domain(row)
+
+    async def notify_changed(self) -> None:
+        """Queue a NOTIFY; Postgres delivers it only if the transaction commits."""
+        await self._session.execute(select(func.pg_notify(SETTINGS_CHANGED_CHANNEL, "")))
@@ -5,12 +5,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, Float, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database import Base
 from settings.model.app_settings import (
     DEFAULT_CHAT_MODEL,
+    DEFAULT_EVALUATION_CONCURRENCY,
+    DEFAULT_GRADING_CASCADE_HIGH_COVERAGE,
+    DEFAULT_GRADING_CASCADE_LOW_COVERAGE,
     DEFAULT_TRANSCRIPTION_MODEL,
 )
 
@@ -25,12 +28,25 @@ class AppSettingsRow(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, default=SETTINGS_ROW_ID)
     ai_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     openai_api_key: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    openai_base_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     openai_chat_model: Mapped[str] = mapped_column(
         String(128), nullable=False, default=DEFAULT_CHAT_MODEL
     )
     openai_transcription_model: Mapped[str] = mapped_column(
         String(128), nullable=False, default=DEFAULT_TRANSCRIPTION_MODEL
     )
+    evaluation_concurrency: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=DEFAULT_EVALUATION_CONCURRENCY
+    )
+    exam_background_grading: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False
+    )
+    grading_cascade_low_coverage: Mapped[float] = mapped_column(
+        Float, nullable=False, default=DEFAULT_GRADING_CASCADE_LOW_COVERAGE
+    )
+    grading_cascade_high_coverage: Mapped[float] = mapped_column(
+        Float, nullable=False, default=DEFAULT_GRADING_CASCADE_HIGH_COVERAGE
+    )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -4,6 +4,9 @@ from dataclasses import dataclass
 
 DEFAULT_CHAT_MODEL = "gpt-4o-mini"
 DEFAULT_TRANSCRIPTION_MODEL = "gpt-4o-mini-transcribe"
+DEFAULT_EVALUATION_CONCURRENCY = 4
+DEFAULT_GRADING_CASCADE_LOW_COVERAGE = 0.0
+DEFAULT_GRADING_CASCADE_HIGH_COVERAGE = 1.0
 
 
 @dataclass
@@ -12,8 +15,20 @@ class AppSettings:
 
     ai_enabled: bool = False
     openai_api_key: str | None = None
+    # OpenAI-compatible endpoint to use instead of api.openai.com, e.g. the
+    # local stand-in from ``scripts/mock_openai_server.py``.
+    openai_base_url: str | None = None
     openai_chat_model: str = DEFAULT_CHAT_MODEL
     openai_transcription_model: str = DEFAULT_TRANSCRIPTION_MODEL
+    # Max. answers graded in parallel when an exam or navigation sheet is submitted.
+    evaluation_concurrency: int = DEFAULT_EVALUATION_CONCURRENCY
+    # Grade exam answers in the background as they are saved (opt-in).
+    exam_background_grading: bool = False
+    # With AI enabled, answers whose key-point coverage (0..1) is below the low
+    # or at least the high threshold are graded by the heuristic alone. The
+    # defaults settle only answers that cover every key point.
+    grading_cascade_low_coverage: float = DEFAULT_GRADING_CASCADE_LOW_COVERAGE
+    grading_cascade_high_coverage: float = DEFAULT_GRADING_CASCADE_HIGH_COVERAGE
 
     @property
     def ai_ready(self) -> bool:
@@ -0,0 +1,70 @@
+"""In-process cache of the single app_settings row.
+
+Settings are read by almost every request but change only when someone
+saves the settings page. The cache keeps the last loaded value and a
+version number; ``invalidate`` bumps the version and drops the value. It is
+called locally by ``SettingsService.update`` and, for changes made by other
+workers, by the Postgres LISTEN/NOTIFY listener. A load that started before
+an invalidation is not stored, so it cannot bring back a superseded value.
+Entries also expire after ``max_age_seconds`` in case a notification is
+lost (e.g. while the listener reconnects).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+
+from settings.model.app_settings import AppSettings
+
+DEFAULT_SETTINGS_MAX_AGE_SECONDS = 60.0
+
+
+class SettingsCache:
+    """Versioned holder for the current AppSettings."""
+
+    def __init__(
+        self,
+        max_age_seconds: float = DEFAULT_SETTINGS_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._settings: AppSettings | None = None
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    async def get(self, load: Callable[[], Awaitable[AppSettings]]) -> AppSettings:
+        """Return the cached settings, calling ``load`` if there are none."""
+        cached = self._fresh()
+        if cached is not None:
+            return replace(cached)
+
+        async with self._lock:
+            cached = self._fresh()
+            if cached is not None:
+                return replace(cached)
+            version = self._version
+            settings = await load()
+            if version == self._version:
+                self._settings = settings
+                self._loaded_at = self._clock()
+            return replace(settings)
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._settings = None
+
+    def _fresh(self) -> AppSettings | None:
+        if self._settings is None:
+            return None
+        if self._clock() - self._loaded_at >= self._max_age_seconds:
+            return None
+        return self._settings
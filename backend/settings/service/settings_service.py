@@ -2,14 +2,22 @@ from __future__ import annotations
 
 from settings.db.settings_repository import SettingsRepository
 from settings.model.app_settings import AppSettings
+from settings.service.settings_cache import SettingsCache
 
 
 class SettingsService:
-    def __init__(self, repository: SettingsRepository) -> None:
+    def __init__(
+        self,
+        repository: SettingsRepository,
+        cache: SettingsCache | None = None,
+    ) -> None:
         self._repo = repository
+        self._cache = cache
 
     async def get(self) -> AppSettings:
-        return await self._repo.get()
+        if self._cache is None:
+            return await self._repo.get()
+        return await self._cache.get(self._repo.get)
 
     async def update(
         self,
@@ -17,9 +25,16 @@ class SettingsService:
         ai_enabled: bool | None = None,
         openai_api_key: str | None = None,
         clear_openai_api_key: bool = False,
+        openai_base_url: str | None = None,
+        clear_openai_base_url: bool = False,
         openai_chat_model: str | None = None,
         openai_transcription_model: str | None = None,
+        evaluation_concurrency: int | None = None,
+        exam_background_grading: bool | None = None,
+        grading_cascade_low_coverage: float | None = None,
+        grading_cascade_high_coverage: float | None = None,
     ) -> AppSettings:
+        # Always from the database: the update must start from the stored row.
         current = await self._repo.get()
 
         if clear_openai_api_key:
@@ -29,9 +44,17 @@ class SettingsService:
         else:
             new_key = current.openai_api_key
 
+        if clear_openai_base_url:
+            new_base_url: str | None = None
+        elif openai_base_url is not None:
+            new_base_url = openai_base_url.strip() or None
+        else:
+            new_base_url = current.openai_base_url
+
         updated = AppSettings(
             ai_enabled=current.ai_enabled if ai_enabled is None else ai_enabled,
             openai_api_key=new_key,
+            openai_base_url=new_base_url,
             openai_chat_model=(
                 current.openai_chat_model
                 if openai_chat_model is None
@@ -45,5 +68,34 @@ class SettingsService:
                     or current.openai_transcription_model
                 )
             ),
+            evaluation_concurrency=(
+                current.evaluation_concurrency
+                if evaluation_concurrency is None
+                else max(1, evaluation_concurrency)
+            ),
+            exam_background_grading=(
+                current.exam_background_grading
+                if exam_background_grading is None
+                else exam_background_grading
+            ),
+            grading_cascade_low_coverage=(
+                current.grading_cascade_low_coverage
+                if grading_cascade_low_coverage is None
+                else grading_cascade_low_coverage
+            ),
+            grading_cascade_high_coverage=(
+                current.grading_cascade_high_coverage
+                if grading_cascade_high_coverage is None
+                else grading_cascade_high_coverage
+            ),
         )
-        return await self._repo.upsert(updated)
+        if updated.grading_cascade_low_coverage > updated.grading_cascade_high_coverage:
+            raise ValueError(
+                "grading_cascade_low_coverage must not exceed grading_cascade_high_coverage"
+            )
+        saved = await self._repo.upsert(updated)
+        # Other workers drop their copy once this transaction commits.
+        await self._repo.notify_changed()
+        if self._cache is not None:
+            self._cache.invalidate()
+        return saved
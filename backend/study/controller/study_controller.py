@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from scheduling.model.card_state import CardState
 from scheduling.model.rating import Rating
+from study.model.buffered_review import BufferedReview
 from study.model.sks_topic import SksTopic
 from study.model.study_card import StudyCard
 from study.service.study_service import StudyService
 
 router = APIRouter(tags=["Study"])
 
+# Buffered timestamps slightly ahead of the server clock count as "now".
+_MAX_CLIENT_CLOCK_SKEW = timedelta(minutes=5)
+
 
 # -- Response / Request schemas --------------------------------------------
 
@@ -64,6 +69,30 @@ class ReviewIn(BaseModel):
     rating: int  # 1=Again, 2=Hard, 3=Good, 4=Easy
 
 
+class ReviewNextIn(BaseModel):
+    card_id: str
+    rating: int  # 1=Again, 2=Hard, 3=Good, 4=Easy
+    topic: Optional[str] = None
+    after_card_id: Optional[str] = None  # cursor: last queued card already held
+    limit: int = Field(default=5, ge=1, le=50)
+
+
+class ReviewNextOut(BaseModel):
+    reviewed: StudyCardOut
+    next_cards: list[StudyCardOut]
+    next_cursor: Optional[str] = None
+
+
+class BufferedReviewIn(BaseModel):
+    card_id: str
+    rating: int  # 1=Again, 2=Hard, 3=Good, 4=Easy
+    reviewed_at: Optional[datetime] = None  # defaults to the time of the sync
+
+
+class ReviewBatchIn(BaseModel):
+    reviews: list[BufferedReviewIn] = Field(..., min_length=1, max_length=500)
+
+
 class EvaluateAnswerIn(BaseModel):
     card_id: str
     user_answer: str
@@ -220,6 +249,77 @@ async def review_card(
     return _study_card_to_out(result)
 
 
+@router.post("/study/review-next", response_model=ReviewNextOut)
+async def review_and_get_next(
+    body: ReviewNextIn,
+    study_service: StudyService = Depends(get_study_service),
+) -> ReviewNextOut:
+    try:
+        rating = Rating(body.rating)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid rating: {body.rating}")
+
+    sks_topic: SksTopic | None = None
+    if body.topic is not None:
+        try:
+            sks_topic = SksTopic(body.topic)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Unknown topic: {body.topic}")
+
+    try:
+        result = await study_service.review_and_get_next(
+            card_id=body.card_id,
+            rating=rating,
+            topic=sks_topic,
+            after_card_id=body.after_card_id,
+            limit=body.limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+    next_cursor = (
+        result.next_cards[-1].card.card_id if result.next_cards else body.after_card_id
+    )
+    return ReviewNextOut(
+        reviewed=_study_card_to_out(result.reviewed),
+        next_cards=[_study_card_to_out(sc) for sc in result.next_cards],
+        next_cursor=next_cursor,
+    )
+
+
+@router.post("/study/reviews", response_model=list[StudyCardOut])
+async def review_cards(
+    body: ReviewBatchIn,
+    study_service: StudyService = Depends(get_study_service),
+) -> list[StudyCardOut]:
+    now = datetime.now(timezone.utc)
+    reviews: list[BufferedReview] = []
+    for item in body.reviews:
+        try:
+            rating = Rating(item.rating)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid rating: {item.rating}")
+        reviewed_at = item.reviewed_at or now
+        if reviewed_at.tzinfo is None:
+            reviewed_at = reviewed_at.replace(tzinfo=timezone.utc)
+        if reviewed_at > now + _MAX_CLIENT_CLOCK_SKEW:
+            raise HTTPException(
+                status_code=400,
+                detail=f"reviewed_at lies in the future: {reviewed_at.isoformat()}",
+            )
+        reviewed_at = min(reviewed_at, now)
+        reviews.append(
+            BufferedReview(card_id=item.card_id, rating=rating, reviewed_at=reviewed_at)
+        )
+
+    try:
+        results = await study_service.review_cards(reviews)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+    return [_study_card_to_out(sc) for sc in results]
+
+
 @router.post("/study/evaluate-answer", response_model=EvaluateAnswerOut)
 async def evaluate_answer(
     body: EvaluateAnswerIn,
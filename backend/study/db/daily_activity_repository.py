@@ -0,0 +1,93 @@
+"""Async PostgreSQL implementation of DailyActivityRepositoryPort."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from study.db.daily_activity_table import DailyActivityRow
+from study.model.daily_activity import DailyActivity
+
+# A day inserted before later ones (e.g. a late buffered sync) extends the run
+# of consecutive days after it. Relative to the inserted day, rows of that run
+# share ``activity_date - row_number()``, so only they are renumbered.
+_RENUMBER_FOLLOWING_STREAK = text(
+    """
+    WITH inserted AS (
+        SELECT activity_date, streak_days
+        FROM daily_activity
+        WHERE activity_date = CAST(:activity_date AS date)
+    ),
+    run AS (
+        SELECT activity_date,
+               activity_date - (row_number() OVER (ORDER BY activity_date))::int AS island
+        FROM daily_activity
+        WHERE activity_date >= CAST(:activity_date AS date)
+    )
+    UPDATE daily_activity AS d
+    SET streak_days = inserted.streak_days + (d.activity_date - inserted.activity_date)
+    FROM run, inserted
+    WHERE run.activity_date = d.activity_date
+      AND run.island = inserted.activity_date - 1
+      AND d.activity_date > inserted.activity_date
+    """
+)
+
+
+def _row_to_domain(row: DailyActivityRow) -> DailyActivity:
+    return DailyActivity(
+        activity_date=row.activity_date,
+        review_count=row.review_count,
+        streak_days=row.streak_days,
+    )
+
+
+class DailyActivityRepository:
+    """Implements DailyActivityRepositoryPort using async SQLAlchemy."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def record_reviews(self, activity_date: date, review_count: int = 1) -> None:
+        previous_streak = (
+            select(DailyActivityRow.streak_days)
+            .where(DailyActivityRow.activity_date == activity_date - timedelta(days=1))
+            .scalar_subquery()
+        )
+        stmt = (
+            insert(DailyActivityRow)
+            .values(
+                activity_date=activity_date,
+                review_count=review_count,
+                streak_days=func.coalesce(previous_streak, 0) + 1,
+            )
+            .on_conflict_do_update(
+                index_elements=[DailyActivityRow.activity_date],
+                set_={"review_count": DailyActivityRow.review_count + review_count},
+            )
+        )
+        await self._session.execute(stmt)
+        await self._session.execute(
+            _RENUMBER_FOLLOWING_STREAK, {"activity_date": activity_date}
+        )
+
+    async def get(self, activity_date: date) -> DailyActivity | None:
+        row = await self._session.get(DailyActivityRow, activity_date)
+        if row is None:
+            return None
+        return _row_to_domain(row)
+
+    async def get_latest(self) -> DailyActivity | None:
+        stmt = (
+            select(DailyActivityRow)
+            .order_by(DailyActivityRow.activity_date.desc())
+            .limit(1)
+        )
+        result = await self._session.execute(stmt)
+        row = result.scalar_one_or_none()
+        if row is None:
+            return None
+        return _row_to_domain(row)
@@ -0,0 +1,20 @@
+"""SQLAlchemy ORM model for the ``daily_activity`` rollup table."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Date, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class DailyActivityRow(Base):
+    """Number of reviews and running streak for one calendar day."""
+
+    __tablename__ = "daily_activity"
+
+    activity_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    streak_days: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
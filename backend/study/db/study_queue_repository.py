@@ -0,0 +1,178 @@
+"""Async PostgreSQL implementation of StudyQueueRepositoryPort.
+
+Joins ``cards`` and ``card_scheduling_info`` so a whole queue is read in a
+single round trip instead of one card lookup per scheduling row.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    and_,
+    case,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from card.db.card_db_mapper import CardDbMapper
+from card.db.card_table import CardRow
+from card.model.card import Card
+from scheduling.db.scheduling_db_mapper import SchedulingDbMapper
+from scheduling.db.scheduling_table import CardSchedulingInfoRow
+from study.model.queue_position import QueuePosition
+from study.model.sks_topic import SksTopic
+from study.model.study_card import StudyCard
+from study.model.study_queue_counts import StudyQueueCounts
+
+
+def _primary_topic():
+    """SQL expression for the first SksTopic contained in ``cards.tags``."""
+    return case(
+        *[(CardRow.tags.contains([topic.value]), topic.value) for topic in SksTopic],
+        else_=None,
+    )
+
+
+def _queue_key_after(position: QueuePosition):
+    """Keyset predicate for rows strictly after ``position`` in queue order.
+
+    ``last_review`` sorts NULLS FIRST, so NULL is compared as ``-infinity``.
+    The redundant ``due >=`` bound lets the planner start the index range scan
+    at the cursor instead of filtering from the head of the queue.
+    """
+    never = literal_column("'-infinity'::timestamptz")
+    return and_(
+        CardSchedulingInfoRow.due >= literal(position.due, DateTime(timezone=True)),
+        tuple_(
+            CardSchedulingInfoRow.due,
+            func.coalesce(CardSchedulingInfoRow.last_review, never),
+            CardSchedulingInfoRow.card_id,
+        )
+        > tuple_(
+            literal(position.due, DateTime(timezone=True)),
+            literal(position.last_review, DateTime(timezone=True))
+            if position.last_review is not None
+            else never,
+            literal(position.card_id),
+        ),
+    )
+
+
+def _is_unscheduled():
+    return ~exists().where(CardSchedulingInfoRow.card_id == CardRow.card_id)
+
+
+class StudyQueueRepository:
+    """Implements StudyQueueRepositoryPort using async SQLAlchemy."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_scheduled_cards(
+        self,
+        *,
+        topic: SksTopic | None = None,
+        due_before: datetime | None = None,
+        card_ids: Collection[str] | None = None,
+        exclude_card_ids: Collection[str] = (),
+        after: QueuePosition | None = None,
+        limit: int | None = None,
+    ) -> list[StudyCard]:
+        stmt = (
+            select(CardRow, CardSchedulingInfoRow)
+            .join(CardSchedulingInfoRow, CardSchedulingInfoRow.card_id == CardRow.card_id)
+            .order_by(
+                CardSchedulingInfoRow.due.asc(),
+                CardSchedulingInfoRow.last_review.asc().nullsfirst(),
+                CardSchedulingInfoRow.card_id.asc(),
+            )
+        )
+        if due_before is not None:
+            stmt = stmt.where(CardSchedulingInfoRow.due <= due_before)
+        if topic is not None:
+            stmt = stmt.where(CardRow.tags.contains([topic.value]))
+        if card_ids is not None:
+            stmt = stmt.where(CardSchedulingInfoRow.card_id.in_(list(card_ids)))
+        if exclude_card_ids:
+            stmt = stmt.where(CardSchedulingInfoRow.card_id.not_in(list(exclude_card_ids)))
+        if after is not None:
+            stmt = stmt.where(_queue_key_after(after))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self._session.execute(stmt)
+        return [
+            StudyCard(
+                card=CardDbMapper.to_domain(card_row),
+                scheduling_info=SchedulingDbMapper.info_to_domain(info_row),
+            )
+            for card_row, info_row in result.all()
+        ]
+
+    async def list_unscheduled_cards(
+        self,
+        *,
+        topic: SksTopic | None = None,
+        limit: int,
+    ) -> list[Card]:
+        stmt = (
+            select(CardRow)
+            .where(_is_unscheduled())
+            .order_by(CardRow.card_id.asc())
+            .limit(limit)
+        )
+        if topic is not None:
+            stmt = stmt.where(CardRow.tags.contains([topic.value]))
+
+        result = await self._session.execute(stmt)
+        return [CardDbMapper.to_domain(row) for row in result.scalars().all()]
+
+    async def get_queue_counts(
+        self,
+        *,
+        due_before: datetime,
+        new_card_limit: int,
+    ) -> StudyQueueCounts:
+        due_cards = (
+            select(_primary_topic().label("topic"))
+            .select_from(CardSchedulingInfoRow)
+            .join(CardRow, CardRow.card_id == CardSchedulingInfoRow.card_id)
+            .where(CardSchedulingInfoRow.due <= due_before)
+            .subquery()
+        )
+        due_stmt = select(due_cards.c.topic, func.count()).group_by(due_cards.c.topic)
+        due_by_topic = {
+            row_topic: count
+            for row_topic, count in (await self._session.execute(due_stmt)).all()
+        }
+
+        scheduled_stmt = (
+            select(func.count())
+            .select_from(CardSchedulingInfoRow)
+            .join(CardRow, CardRow.card_id == CardSchedulingInfoRow.card_id)
+        )
+        scheduled_cards = await self._session.scalar(scheduled_stmt) or 0
+
+        new_card_topics: list[str | None] = []
+        if new_card_limit > 0:
+            new_stmt = (
+                select(_primary_topic())
+                .where(_is_unscheduled())
+                .order_by(CardRow.card_id.asc())
+                .limit(new_card_limit)
+            )
+            new_card_topics = list((await self._session.execute(new_stmt)).scalars().all())
+
+        return StudyQueueCounts(
+            due_by_topic=due_by_topic,
+            scheduled_cards=scheduled_cards,
+            new_card_topics=new_card_topics,
+        )
@@ -1,10 +1,18 @@
+from study.model.buffered_review import BufferedReview
 from study.model.answer_evaluation import StudyAnswerEvaluation, StudyAnswerVerdict
+from study.model.queue_position import QueuePosition
+from study.model.review_with_next_cards import ReviewWithNextCards
 from study.model.sks_topic import SksTopic
 from study.model.study_card import StudyCard
+from study.model.study_queue_counts import StudyQueueCounts
 
 __all__ = [
+    "BufferedReview",
     "StudyAnswerEvaluation",
     "StudyAnswerVerdict",
+    "QueuePosition",
+    "ReviewWithNextCards",
     "SksTopic",
     "StudyCard",
+    "StudyQueueCounts",
 ]
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from scheduling.model.rating import Rating
+
+
+@dataclass(frozen=True)
+class BufferedReview:
+    """A rating recorded on the client and synced later as part of a batch."""
+
+    card_id: str
+    rating: Rating
+    reviewed_at: datetime
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class DailyActivity:
+    """Rolled-up review activity for one calendar day.
+
+    ``streak_days`` is the number of consecutive active days ending on
+    ``activity_date`` and is maintained when the day is first recorded.
+    """
+
+    activity_date: date
+    review_count: int
+    streak_days: int
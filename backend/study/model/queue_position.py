@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from scheduling.model.card_scheduling_info import CardSchedulingInfo
+
+
+@dataclass(frozen=True)
+class QueuePosition:
+    """Keyset position in the study queue order (due, last_review NULLS FIRST, card_id)."""
+
+    due: datetime
+    last_review: datetime | None
+    card_id: str
+
+    @classmethod
+    def of(cls, info: CardSchedulingInfo) -> QueuePosition:
+        return cls(due=info.due, last_review=info.last_review, card_id=info.card_id)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from study.model.study_card import StudyCard
+
+
+@dataclass(frozen=True)
+class ReviewWithNextCards:
+    """Outcome of a review together with the following page of the due queue."""
+
+    reviewed: StudyCard
+    next_cards: list[StudyCard]
@@ -0,0 +1,47 @@
+"""Aggregate read model backing the dashboard summary."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from study.model.sks_topic import SksTopic
+
+
+@dataclass(frozen=True)
+class StudyQueueCounts:
+    """Queue counts read with COUNT/GROUP BY queries instead of whole queues.
+
+    Cards are attributed to their primary topic: the first ``SksTopic`` (in
+    declaration order) contained in their tags, or ``None`` if untagged.
+    """
+
+    due_by_topic: dict[str | None, int] = field(default_factory=dict)
+    scheduled_cards: int = 0
+    new_card_topics: list[str | None] = field(default_factory=list)
+
+    @property
+    def due_scheduled(self) -> int:
+        return sum(self.due_by_topic.values())
+
+    def due_now(self, new_card_limit: int) -> int:
+        return self.due_scheduled + len(self._introduced_topics(new_card_limit))
+
+    def due_now_by_topic(self, new_card_limit: int) -> dict[str, int]:
+        counts: dict[str, int] = {topic.value: 0 for topic in SksTopic}
+        for topic, count in self.due_by_topic.items():
+            if topic is not None:
+                counts[topic] += count
+        for topic in self._introduced_topics(new_card_limit):
+            if topic is not None:
+                counts[topic] += 1
+        return counts
+
+    def available_cards(self, new_card_limit: int) -> int:
+        due_now = self.due_now(new_card_limit)
+        if due_now >= new_card_limit:
+            return due_now
+        return min(new_card_limit, self.scheduled_cards + len(self.new_card_topics))
+
+    def _introduced_topics(self, new_card_limit: int) -> list[str | None]:
+        slots = max(0, new_card_limit - self.due_scheduled)
+        return self.new_card_topics[:slots]
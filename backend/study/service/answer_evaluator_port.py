@@ -35,3 +35,10 @@ class StudyAnswerEvaluatorPort(Protocol):
         request: StudyAnswerEvaluationRequest,
     ) -> StudyAnswerEvaluationPayload:
         ...
+
+    async def evaluate_many(
+        self,
+        requests: list[StudyAnswerEvaluationRequest],
+    ) -> list[StudyAnswerEvaluationPayload]:
+        """Evaluate several answers at once; results match the request order."""
+        ...
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Protocol
+
+from study.model.daily_activity import DailyActivity
+
+
+class DailyActivityRepositoryPort(Protocol):
+    """Port for the per-day review activity rollup."""
+
+    async def record_reviews(self, activity_date: date, review_count: int = 1) -> None:
+        """Count reviews on the given day, starting or extending a streak.
+
+        Days may arrive out of order; the streaks of later days are updated.
+        """
+        ...
+
+    async def get(self, activity_date: date) -> DailyActivity | None: ...
+
+    async def get_latest(self) -> DailyActivity | None: ...
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from exam.model.exam_result import ExamEvaluation
 from exam.service.exam_evaluator_port import ExamEvaluationRequest, ExamEvaluatorPort
 from study.service.answer_evaluator_port import (
     StudyAnswerEvaluationPayload,
@@ -19,32 +20,52 @@ class ExamBackedStudyAnswerEvaluator:
         self,
         request: StudyAnswerEvaluationRequest,
     ) -> StudyAnswerEvaluationPayload:
-        exam_evaluation = await self._exam_evaluator.evaluate(
-            ExamEvaluationRequest(
-                question_text=request.question_text,
-                short_answer=request.short_answer,
-                reference_answer=request.reference_answer,
-                student_answer=request.user_answer,
-                max_score=request.max_points,
-            )
-        )
+        exam_evaluation = await self._exam_evaluator.evaluate(_to_exam_request(request))
+        return _to_payload(request, exam_evaluation)
 
-        awarded = max(0.0, min(request.max_points, exam_evaluation.score))
-        suggestion = _build_improved_suggestion(
-            short_answer=request.short_answer,
-            reference_answer=request.reference_answer,
-            existing_feedback=exam_evaluation.feedback,
-        )
-        mistakes = list(exam_evaluation.errors)
-
-        return StudyAnswerEvaluationPayload(
-            awarded_points=awarded,
-            max_points=request.max_points,
-            reasoning_summary=exam_evaluation.feedback,
-            mistakes=mistakes,
-            missing_points=mistakes,
-            improved_answer_suggestion=suggestion,
+    async def evaluate_many(
+        self,
+        requests: list[StudyAnswerEvaluationRequest],
+    ) -> list[StudyAnswerEvaluationPayload]:
+        exam_evaluations = await self._exam_evaluator.evaluate_many(
+            [_to_exam_request(request) for request in requests]
         )
+        return [
+            _to_payload(request, exam_evaluation)
+            for request, exam_evaluation in zip(requests, exam_evaluations, strict=True)
+        ]
+
+
+def _to_exam_request(request: StudyAnswerEvaluationRequest) -> ExamEvaluationRequest:
+    return ExamEvaluationRequest(
+        question_text=request.question_text,
+        short_answer=request.short_answer,
+        reference_answer=request.reference_answer,
+        student_answer=request.user_answer,
+        max_score=request.max_points,
+    )
+
+
+def _to_payload(
+    request: StudyAnswerEvaluationRequest,
+    exam_evaluation: ExamEvaluation,
+) -> StudyAnswerEvaluationPayload:
+    awarded = max(0.0, min(request.max_points, exam_evaluation.score))
+    suggestion = _build_improved_suggestion(
+        short_answer=request.short_answer,
+        reference_answer=request.reference_answer,
+        existing_feedback=exam_evaluation.feedback,
+    )
+    mistakes = list(exam_evaluation.errors)
+
+    return StudyAnswerEvaluationPayload(
+        awarded_points=awarded,
+        max_points=request.max_points,
+        reasoning_summary=exam_evaluation.feedback,
+        mistakes=mistakes,
+        missing_points=mistakes,
+        improved_answer_suggestion=suggestion,
+    )
 
 
 def _build_improved_suggestion(
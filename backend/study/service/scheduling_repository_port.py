@@ -18,6 +18,13 @@ class SchedulingRepositoryPort(Protocol):
 
     async def save(self, info: CardSchedulingInfo) -> None: ...
 
+    async def insert_many(self, infos: list[CardSchedulingInfo]) -> None: ...
+
+    async def save_many(self, infos: list[CardSchedulingInfo]) -> None: ...
+
     async def save_review_log(self, log: ReviewLog) -> None: ...
 
+    async def save_review_logs(self, logs: list[ReviewLog]) -> None: ...
+
     async def list_review_logs(self) -> list[ReviewLog]: ...
+
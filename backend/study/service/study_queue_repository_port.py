@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime
+from typing import Protocol
+
+from card.model.card import Card
+from study.model.queue_position import QueuePosition
+from study.model.sks_topic import SksTopic
+from study.model.study_card import StudyCard
+from study.model.study_queue_counts import StudyQueueCounts
+
+
+class StudyQueueRepositoryPort(Protocol):
+    """Port for set-based study queue reads spanning cards and scheduling."""
+
+    async def list_scheduled_cards(
+        self,
+        *,
+        topic: SksTopic | None = None,
+        due_before: datetime | None = None,
+        card_ids: Collection[str] | None = None,
+        exclude_card_ids: Collection[str] = (),
+        after: QueuePosition | None = None,
+        limit: int | None = None,
+    ) -> list[StudyCard]:
+        """Return scheduled cards in queue order (due, last_review NULLS FIRST, card_id).
+
+        ``card_ids`` restricts the result to the given cards. ``after`` skips
+        every card up to and including that position in the queue order.
+        """
+        ...
+
+    async def list_unscheduled_cards(
+        self,
+        *,
+        topic: SksTopic | None = None,
+        limit: int,
+    ) -> list[Card]:
+        """Return up to ``limit`` cards without a scheduling row, ordered by card_id."""
+        ...
+
+    async def get_queue_counts(
+        self,
+        *,
+        due_before: datetime,
+        new_card_limit: int,
+    ) -> StudyQueueCounts:
+        """Return due/scheduled counts and the topics of the next new cards."""
+        ...
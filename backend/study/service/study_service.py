@@ -6,15 +6,19 @@ scheduling domain imports from the other.
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta, timezone
+from collections import Counter
+from datetime import date, datetime, timezone, tzinfo
 
 from scheduling.model.card_scheduling_info import CardSchedulingInfo
 from scheduling.model.rating import Rating
 from scheduling.model.review_log import ReviewLog
 from scheduling.service.scheduling_service import SchedulingService
 
+from study.model.buffered_review import BufferedReview
 from study.model.dashboard_summary import DashboardSummary
 from study.model.answer_evaluation import StudyAnswerEvaluation, StudyAnswerVerdict
+from study.model.queue_position import QueuePosition
+from study.model.review_with_next_cards import ReviewWithNextCards
 from study.model.sks_topic import SksTopic
 from study.model.study_card import StudyCard
 from study.service.answer_evaluator_port import (
@@ -22,7 +26,9 @@ from study.service.answer_evaluator_port import (
     StudyAnswerEvaluatorPort,
 )
 from study.service.card_repository_port import CardRepositoryPort
+from study.service.daily_activity_repository_port import DailyActivityRepositoryPort
 from study.service.scheduling_repository_port import SchedulingRepositoryPort
+from study.service.study_queue_repository_port import StudyQueueRepositoryPort
 
 DEFAULT_NEW_CARD_LIMIT_PER_QUEUE = 20
 
@@ -34,15 +40,21 @@ class StudyService:
         self,
         card_repo: CardRepositoryPort,
         scheduling_repo: SchedulingRepositoryPort,
+        queue_repo: StudyQueueRepositoryPort,
+        activity_repo: DailyActivityRepositoryPort,
         scheduling_service: SchedulingService,
         answer_evaluator: StudyAnswerEvaluatorPort | None = None,
         new_card_limit_per_queue: int = DEFAULT_NEW_CARD_LIMIT_PER_QUEUE,
+        activity_timezone: tzinfo = timezone.utc,
     ) -> None:
         self._card_repo = card_repo
         self._scheduling_repo = scheduling_repo
+        self._queue_repo = queue_repo
+        self._activity_repo = activity_repo
         self._scheduling_service = scheduling_service
         self._answer_evaluator = answer_evaluator
         self._new_card_limit_per_queue = max(0, new_card_limit_per_queue)
+        self._activity_timezone = activity_timezone
 
     async def get_due_cards(self, topic: SksTopic | None = None) -> list[StudyCard]:
         return await self._build_due_queue(topic=topic, persist_new_cards=True)
@@ -53,18 +65,12 @@ class StudyService:
         persist_new_cards: bool,
     ) -> list[StudyCard]:
         now = datetime.now(timezone.utc)
-        due_infos = await self._scheduling_repo.get_due(before=now)
-
-        study_cards: list[StudyCard] = []
-        for info in due_infos:
-            card = await self._card_repo.get_by_id(info.card_id)
-            if card is None:
-                continue
-            if topic is not None and topic.value not in card.tags:
-                continue
-            study_cards.append(StudyCard(card=card, scheduling_info=info))
-
-        new_card_slots = max(0, self._new_card_limit_per_queue - len(study_cards))
+        study_cards = await self._queue_repo.list_scheduled_cards(
+            topic=topic,
+            due_before=now,
+        )
+
+        new_card_slots = self._new_card_slots(len(study_cards))
         if new_card_slots == 0:
             return study_cards
 
@@ -92,33 +98,14 @@ class StudyService:
         if len(due_first) >= self._new_card_limit_per_queue:
             return due_first
 
-        queue = list(due_first)
-        seen_card_ids = {sc.card.card_id for sc in queue}
-        remaining = self._new_card_limit_per_queue - len(queue)
-
-        all_infos = await self._scheduling_repo.list_all()
-        all_infos_sorted = sorted(
-            all_infos,
-            key=lambda i: (
-                i.due,
-                i.last_review or datetime.min.replace(tzinfo=timezone.utc),
-                i.card_id,
-            ),
+        remaining = self._new_card_limit_per_queue - len(due_first)
+        scheduled = await self._queue_repo.list_scheduled_cards(
+            topic=topic,
+            exclude_card_ids={sc.card.card_id for sc in due_first},
+            limit=remaining,
         )
-
-        for info in all_infos_sorted:
-            if remaining <= 0:
-                break
-            if info.card_id in seen_card_ids:
-                continue
-            card = await self._card_repo.get_by_id(info.card_id)
-            if card is None:
-                continue
-            if topic is not None and topic.value not in card.tags:
-                continue
-            queue.append(StudyCard(card=card, scheduling_info=info))
-            seen_card_ids.add(info.card_id)
-            remaining -= 1
+        queue = due_first + scheduled
+        remaining -= len(scheduled)
 
         if remaining <= 0:
             return queue
@@ -139,26 +126,18 @@ class StudyService:
         if limit <= 0:
             return []
 
-        candidates = (
-            await self._card_repo.get_by_tags([topic.value])
-            if topic is not None
-            else await self._card_repo.list_all()
+        candidates = await self._queue_repo.list_unscheduled_cards(
+            topic=topic,
+            limit=limit,
         )
-
-        introduced: list[StudyCard] = []
-        for card in candidates:
-            if len(introduced) >= limit:
-                break
-
-            existing = await self._scheduling_repo.get_by_card_id(card.card_id)
-            if existing is not None:
-                continue
-
-            info = CardSchedulingInfo(card_id=card.card_id)
-            if persist:
-                await self._scheduling_repo.save(info)
-            introduced.append(StudyCard(card=card, scheduling_info=info))
-
+        introduced = [
+            StudyCard(card=card, scheduling_info=CardSchedulingInfo(card_id=card.card_id))
+            for card in candidates
+        ]
+        if persist:
+            await self._scheduling_repo.insert_many(
+                [study_card.scheduling_info for study_card in introduced]
+            )
         return introduced
 
     async def review_card(self, card_id: str, rating: Rating) -> StudyCard:
@@ -175,9 +154,110 @@ class StudyService:
         )
         await self._scheduling_repo.save(updated_info)
         await self._scheduling_repo.save_review_log(review_log)
+        await self._activity_repo.record_reviews(self._activity_date(review_log.reviewed_at))
 
         return StudyCard(card=card, scheduling_info=updated_info)
 
+    async def review_and_get_next(
+        self,
+        card_id: str,
+        rating: Rating,
+        *,
+        topic: SksTopic | None = None,
+        after_card_id: str | None = None,
+        limit: int,
+    ) -> ReviewWithNextCards:
+        """Review a card and return the next ``limit`` cards of the due queue.
+
+        ``after_card_id`` is the cursor: the last queued card the client
+        already holds. Only cards behind it in queue order are returned, so
+        a client keeping a lookahead buffer never receives duplicates.
+        Without a cursor the page starts at the head of the queue.
+        """
+        after: QueuePosition | None = None
+        if after_card_id is not None:
+            # Resolve before reviewing: the cursor may be the reviewed card.
+            cursor_info = await self._scheduling_repo.get_by_card_id(after_card_id)
+            if cursor_info is None:
+                raise ValueError(f"No scheduling info found for card {after_card_id!r}")
+            after = QueuePosition.of(cursor_info)
+
+        reviewed = await self.review_card(card_id, rating)
+
+        now = datetime.now(timezone.utc)
+        next_cards = await self._queue_repo.list_scheduled_cards(
+            topic=topic,
+            due_before=now,
+            exclude_card_ids={card_id},
+            after=after,
+            limit=limit,
+        )
+        if len(next_cards) < limit:
+            # New cards only fill the budget the whole due queue leaves, not
+            # just the part behind the cursor.
+            due_cards = await self._queue_repo.list_scheduled_cards(
+                topic=topic,
+                due_before=now,
+            )
+            next_cards += await self._introduce_new_cards(
+                topic=topic,
+                limit=min(limit - len(next_cards), self._new_card_slots(len(due_cards))),
+                persist=True,
+            )
+        return ReviewWithNextCards(reviewed=reviewed, next_cards=next_cards)
+
+    def _new_card_slots(self, due_count: int) -> int:
+        """New cards a queue with ``due_count`` due cards may still introduce."""
+        return max(0, self._new_card_limit_per_queue - due_count)
+
+    async def review_cards(self, reviews: list[BufferedReview]) -> list[StudyCard]:
+        """Replay buffered reviews in order and persist the outcome in bulk.
+
+        Returns the final state of every reviewed card in first-seen order.
+        Nothing is written if any card is unknown or unscheduled. A review
+        dated before the card's last review (client clock skew, a replayed
+        buffer) is counted at the time of that last review.
+        """
+        card_ids = list(dict.fromkeys(review.card_id for review in reviews))
+        current = {
+            sc.card.card_id: sc
+            for sc in await self._queue_repo.list_scheduled_cards(card_ids=card_ids)
+        }
+        missing = [card_id for card_id in card_ids if card_id not in current]
+        if missing:
+            raise ValueError(f"No scheduling info found for card {missing[0]!r}")
+
+        review_logs: list[ReviewLog] = []
+        for review in reviews:
+            study_card = current[review.card_id]
+            reviewed_at = review.reviewed_at
+            last_review = study_card.scheduling_info.last_review
+            if last_review is not None and reviewed_at < last_review:
+                reviewed_at = last_review
+            updated_info, review_log = self._scheduling_service.review_card(
+                study_card.scheduling_info,
+                review.rating,
+                reviewed_at=reviewed_at,
+            )
+            current[review.card_id] = StudyCard(
+                card=study_card.card,
+                scheduling_info=updated_info,
+            )
+            review_logs.append(review_log)
+
+        await self._scheduling_repo.save_many(
+            [current[card_id].scheduling_info for card_id in card_ids]
+        )
+        await self._scheduling_repo.save_review_logs(review_logs)
+
+        reviews_per_day = Counter(self._activity_date(log.reviewed_at) for log in review_logs)
+        for activity_date in sorted(reviews_per_day):
+            await self._activity_repo.record_reviews(
+                activity_date, review_count=reviews_per_day[activity_date]
+            )
+
+        return [current[card_id] for card_id in card_ids]
+
     async def evaluate_answer(
         self,
         card_id: str,
@@ -221,19 +301,14 @@ class StudyService:
         )
 
     async def get_dashboard_summary(self) -> DashboardSummary:
-        due_cards = await self._build_due_queue(topic=None, persist_new_cards=False)
-        practice_cards = await self._build_practice_queue(
-            topic=None, persist_new_cards=False
+        now = datetime.now(timezone.utc)
+        limit = self._new_card_limit_per_queue
+        counts = await self._queue_repo.get_queue_counts(
+            due_before=now,
+            new_card_limit=limit,
         )
-        review_logs = await self._scheduling_repo.list_review_logs()
-
-        due_by_topic: dict[str, int] = {topic.value: 0 for topic in SksTopic}
-        for study_card in due_cards:
-            for topic in SksTopic:
-                if topic.value in study_card.card.tags:
-                    due_by_topic[topic.value] += 1
-                    break
 
+        due_by_topic = counts.due_now_by_topic(limit)
         recommended_topic = None
         max_due_count = 0
         for topic, count in due_by_topic.items():
@@ -241,38 +316,20 @@ class StudyService:
                 max_due_count = count
                 recommended_topic = topic
 
-        today_utc = datetime.now(timezone.utc).date()
-        reviewed_today = sum(
-            1 for log in review_logs if log.reviewed_at.astimezone(timezone.utc).date() == today_utc
-        )
-        streak_days = _calculate_streak_days(review_logs)
+        today = await self._activity_repo.get(self._activity_date(now))
+        latest = await self._activity_repo.get_latest()
 
         return DashboardSummary(
-            due_now=len(due_cards),
-            reviewed_today=reviewed_today,
-            streak_days=streak_days,
+            due_now=counts.due_now(limit),
+            reviewed_today=today.review_count if today else 0,
+            streak_days=latest.streak_days if latest else 0,
             due_by_topic=due_by_topic,
             recommended_topic=recommended_topic,
-            available_cards=len(practice_cards),
+            available_cards=counts.available_cards(limit),
         )
 
-
-def _calculate_streak_days(review_logs: list[ReviewLog]) -> int:
-    if not review_logs:
-        return 0
-
-    activity_days: set[date] = {
-        log.reviewed_at.astimezone(timezone.utc).date()
-        for log in review_logs
-    }
-    cursor = max(activity_days)
-    streak = 0
-
-    while cursor in activity_days:
-        streak += 1
-        cursor -= timedelta(days=1)
-
-    return streak
+    def _activity_date(self, moment: datetime) -> date:
+        return moment.astimezone(self._activity_timezone).date()
 
 
 def _verdict_for_ratio(
@@ -0,0 +1,42 @@
+from card.model.card import Card
+from card.model.card_catalog import CardCatalog
+
+
+def _catalog() -> CardCatalog:
+    return CardCatalog(
+        version=3,
+        cards=(
+            Card(card_id="a", tags=["navigation"], exam_sheets=[1, 2]),
+            Card(card_id="b", tags=["wetterkunde", "navigation"], exam_sheets=[2]),
+            Card(card_id="c", tags=["seemannschaft_i"]),
+        ),
+    )
+
+
+class TestCardCatalogLookups:
+    def test_get_by_id(self):
+        catalog = _catalog()
+        assert catalog.get_by_id("b").card_id == "b"
+        assert catalog.get_by_id("missing") is None
+
+    def test_get_by_tags_returns_each_card_once_in_catalogue_order(self):
+        catalog = _catalog()
+        cards = catalog.get_by_tags(["seemannschaft_i", "navigation", "wetterkunde"])
+        assert [card.card_id for card in cards] == ["a", "b", "c"]
+
+    def test_get_by_unknown_tag_is_empty(self):
+        assert _catalog().get_by_tags(["unknown"]) == []
+
+    def test_get_by_exam_sheet(self):
+        catalog = _catalog()
+        assert [card.card_id for card in catalog.get_by_exam_sheet(2)] == ["a", "b"]
+        assert catalog.get_by_exam_sheet(9) == []
+
+    def test_list_all_returns_a_copy(self):
+        catalog = _catalog()
+        cards = catalog.list_all()
+        cards.clear()
+        assert len(catalog.list_all()) == 3
+
+    def test_count_by_exam_sheet(self):
+        assert _catalog().count_by_exam_sheet() == {1: 1, 2: 2}
@@ -0,0 +1,105 @@
+import pytest
+
+from card.model.card import Card
+from card.model.card_catalog import CardCatalog
+from card.service.card_catalog_cache import CardCatalogCache
+
+
+class FakeCatalogSource:
+    """In-memory fake implementing CardCatalogSourcePort for testing."""
+
+    def __init__(self, version: int = 1) -> None:
+        self.version = version
+        self.version_reads = 0
+        self.loads = 0
+
+    async def get_version(self) -> int:
+        self.version_reads += 1
+        return self.version
+
+    async def load(self) -> CardCatalog:
+        self.loads += 1
+        return CardCatalog(version=self.version, cards=(Card(card_id=f"v{self.version}"),))
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCardCatalogCache:
+    @pytest.mark.asyncio
+    async def test_loads_once_and_serves_snapshot_within_interval(self):
+        source = FakeCatalogSource()
+        clock = FakeClock()
+        cache = CardCatalogCache(check_interval_seconds=30, clock=clock)
+
+        first = await cache.get(source)
+        clock.now = 10
+        second = await cache.get(source)
+
+        assert first is second
+        assert source.loads == 1
+        assert source.version_reads == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_does_not_reload(self):
+        source = FakeCatalogSource()
+        clock = FakeClock()
+        cache = CardCatalogCache(check_interval_seconds=30, clock=clock)
+
+        first = await cache.get(source)
+        clock.now = 31
+        second = await cache.get(source)
+
+        assert first is second
+        assert source.loads == 1
+        assert source.version_reads == 2
+
+    @pytest.mark.asyncio
+    async def test_version_bump_reloads_after_interval(self):
+        source = FakeCatalogSource()
+        clock = FakeClock()
+        cache = CardCatalogCache(check_interval_seconds=30, clock=clock)
+
+        await cache.get(source)
+        source.version = 2
+        clock.now = 31
+        catalog = await cache.get(source)
+
+        assert catalog.version == 2
+        assert catalog.get_by_id("v2") is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self):
+        source = FakeCatalogSource()
+        cache = CardCatalogCache(check_interval_seconds=30, clock=FakeClock())
+
+        await cache.get(source)
+        cache.invalidate()
+        await cache.get(source)
+
+        assert source.loads == 2
+
+    @pytest.mark.asyncio
+    async def test_on_reload_sees_every_loaded_catalogue(self):
+        source = FakeCatalogSource()
+        clock = FakeClock()
+        reloaded: list[int] = []
+        cache = CardCatalogCache(
+            check_interval_seconds=30,
+            clock=clock,
+            on_reload=lambda catalog: reloaded.append(catalog.version),
+        )
+
+        await cache.get(source)
+        clock.now = 31
+        await cache.get(source)
+        source.version = 2
+        clock.now = 62
+        await cache.get(source)
+
+        assert reloaded == [1, 2]
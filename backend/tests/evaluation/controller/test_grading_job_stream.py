@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import BaseModel
+
+from evaluation.controller.grading_job_stream import grading_events
+from evaluation.model.grading_job import (
+    GradingJob,
+    GradingJobKind,
+    GradingJobStatus,
+    GradingProgress,
+)
+
+_STARTED = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class QuestionOut(BaseModel):
+    number: int
+
+
+class ResultOut(BaseModel):
+    total: int
+
+
+def _job(status: GradingJobStatus) -> GradingJob:
+    return GradingJob(
+        kind=GradingJobKind.EXAM,
+        session_id="s1",
+        status=status,
+        created_at=_STARTED,
+        updated_at=_STARTED,
+    )
+
+
+def _reader(snapshots: list):
+    async def read_progress(job_id: str):
+        return snapshots.pop(0) if len(snapshots) > 1 else snapshots[0]
+
+    return read_progress
+
+
+async def _collect(read_progress, now: datetime) -> list[str]:
+    return [
+        event
+        async for event in grading_events(
+            "job",
+            read_progress,
+            question_key=str,
+            question_to_out=lambda number: QuestionOut(number=number),
+            result_to_out=lambda total: ResultOut(total=total),
+            poll_interval_seconds=0,
+            stale_after_seconds=60,
+            clock=lambda: now,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streams_questions_then_result():
+    running = _job(GradingJobStatus.RUNNING)
+    events = await _collect(
+        _reader(
+            [
+                (running, GradingProgress(questions=[1])),
+                (running, GradingProgress(questions=[1, 2], result=4)),
+            ]
+        ),
+        now=_STARTED,
+    )
+
+    assert [event.split("\n")[0] for event in events] == [
+        "event: question",
+        "event: question",
+        "event: result",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stale_running_job_ends_stream_with_error():
+    events = await _collect(
+        _reader([(_job(GradingJobStatus.RUNNING), GradingProgress(questions=[1]))]),
+        now=_STARTED + timedelta(minutes=5),
+    )
+
+    assert [event.split("\n")[0] for event in events] == ["event: question", "event: error"]
+    assert "submit again" in events[-1]
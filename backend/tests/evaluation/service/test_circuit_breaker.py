@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+
+from evaluation.service.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+async def _fail() -> str:
+    raise RuntimeError("provider down")
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=2, slow_call_seconds=5, open_seconds=30, clock=clock)
+
+
+async def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures_and_rejects_fast(
+        self, breaker: CircuitBreaker
+    ):
+        await _trip(breaker)
+        calls = 0
+
+        async def counted() -> str:
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(counted)
+
+        assert breaker.state == CircuitState.OPEN
+        assert calls == 0
+        assert breaker.snapshot().rejected_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_success_resets_the_failure_count(self, breaker: CircuitBreaker):
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        await breaker.call(_ok)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_count_as_failures(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ):
+        async def slow() -> str:
+            clock.now += 6
+            return "late"
+
+        assert await breaker.call(slow) == "late"
+        await breaker.call(slow)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.snapshot().slow_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_on_success(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ):
+        await _trip(breaker)
+        clock.now += 30
+
+        assert await breaker.call(_ok) == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_failure_reopens(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ):
+        await _trip(breaker)
+        clock.now += 30
+
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.snapshot().seconds_until_probe == 30
+
+    @pytest.mark.asyncio
+    async def test_only_one_probe_at_a_time(self, breaker: CircuitBreaker, clock: FakeClock):
+        await _trip(breaker)
+        clock.now += 30
+        release = asyncio.Event()
+
+        async def blocked() -> str:
+            await release.wait()
+            return "ok"
+
+        probe = asyncio.create_task(breaker.call(blocked))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok)
+        release.set()
+
+        assert await probe == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+
+class TestHedging:
+    @pytest.mark.asyncio
+    async def test_slow_call_gets_a_duplicate_that_can_win(self):
+        breaker = CircuitBreaker(hedge=True, hedge_min_samples=3)
+        for _ in range(3):
+            await breaker.call(_ok)
+
+        attempts = 0
+
+        async def first_attempt_hangs() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(10)
+                return "primary"
+            return "hedge"
+
+        assert await breaker.call(first_attempt_hangs) == "hedge"
+        snapshot = breaker.snapshot()
+        assert snapshot.hedged_calls == 1
+        assert snapshot.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedging_without_enough_samples(self):
+        breaker = CircuitBreaker(hedge=True, hedge_min_samples=3)
+        await breaker.call(_ok)
+
+        async def slowish() -> str:
+            await asyncio.sleep(0.01)
+            return "primary"
+
+        assert await breaker.call(slowish) == "primary"
+        assert breaker.snapshot().hedged_calls == 0
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from evaluation.service.evaluation_executor import EvaluationExecutor
+
+
+async def _fallback(request: int) -> str:
+    return f"fallback-{request}"
+
+
+class TestEvaluationExecutor:
+    @pytest.mark.asyncio
+    async def test_returns_results_in_request_order(self):
+        async def evaluate(request: int) -> str:
+            await asyncio.sleep(0.01 * (5 - request))
+            return f"result-{request}"
+
+        results = await EvaluationExecutor(max_concurrency=5).map(
+            [1, 2, 3, 4], evaluate, _fallback
+        )
+
+        assert results == ["result-1", "result-2", "result-3", "result-4"]
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_evaluations(self):
+        running = 0
+        peak = 0
+
+        async def evaluate(request: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return request
+
+        await EvaluationExecutor(max_concurrency=2).map(list(range(6)), evaluate, _fallback)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_uses_fallback_on_timeout(self):
+        async def evaluate(request: int) -> str:
+            if request == 2:
+                await asyncio.sleep(1)
+            return f"result-{request}"
+
+        results = await EvaluationExecutor(max_concurrency=3, timeout_seconds=0.05).map(
+            [1, 2, 3], evaluate, _fallback
+        )
+
+        assert results == ["result-1", "fallback-2", "result-3"]
+
+    @pytest.mark.asyncio
+    async def test_uses_fallback_on_error(self):
+        async def evaluate(request: int) -> str:
+            raise RuntimeError("provider down")
+
+        results = await EvaluationExecutor().map([7], evaluate, _fallback)
+
+        assert results == ["fallback-7"]
+
+    def test_concurrency_is_at_least_one(self):
+        assert EvaluationExecutor(max_concurrency=0).max_concurrency == 1
+
+    @pytest.mark.asyncio
+    async def test_map_batched_flattens_batches_in_order(self):
+        batches: list[list[int]] = []
+
+        async def evaluate_many(requests: list[int]) -> list[int]:
+            batches.append(requests)
+            return [request * 10 for request in requests]
+
+        async def fallback_many(requests: list[int]) -> list[int]:
+            return [-request for request in requests]
+
+        results = await EvaluationExecutor().map_batched(
+            [1, 2, 3, 4, 5], evaluate_many, fallback_many, batch_size=2
+        )
+
+        assert results == [10, 20, 30, 40, 50]
+        assert sorted(batches) == [[1, 2], [3, 4], [5]]
+
+    @pytest.mark.asyncio
+    async def test_reports_results_as_they_complete(self):
+        completed: list[tuple[int, str]] = []
+
+        async def evaluate(request: int) -> str:
+            await asyncio.sleep(0.01 * (3 - request))
+            return f"result-{request}"
+
+        async def on_result(index: int, result: str) -> None:
+            completed.append((index, result))
+
+        await EvaluationExecutor(max_concurrency=3).map(
+            [1, 2, 3], evaluate, _fallback, on_result
+        )
+
+        assert completed == [(2, "result-3"), (1, "result-2"), (0, "result-1")]
+
+    @pytest.mark.asyncio
+    async def test_map_batched_reports_request_indices(self):
+        completed: list[tuple[int, int]] = []
+
+        async def evaluate_many(requests: list[int]) -> list[int]:
+            return [request * 10 for request in requests]
+
+        async def on_result(index: int, result: int) -> None:
+            completed.append((index, result))
+
+        await EvaluationExecutor().map_batched(
+            [1, 2, 3, 4, 5], evaluate_many, evaluate_many, batch_size=2, on_result=on_result
+        )
+
+        assert sorted(completed) == [(0, 10), (1, 20), (2, 30), (3, 40), (4, 50)]
@@ -0,0 +1,45 @@
+from evaluation.service.evaluation_memory_cache import EvaluationMemoryCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestEvaluationMemoryCache:
+    def test_evicts_least_recently_used_entry(self):
+        cache: EvaluationMemoryCache[int] = EvaluationMemoryCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache: EvaluationMemoryCache[int] = EvaluationMemoryCache(
+            max_entries=10, ttl_seconds=60, clock=clock
+        )
+        cache.put("a", 1)
+
+        clock.now = 59
+        assert cache.get("a") == 1
+        clock.now = 60
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_binding_another_model_clears_entries(self):
+        cache: EvaluationMemoryCache[int] = EvaluationMemoryCache(max_entries=10, ttl_seconds=60)
+        assert cache.bind_model("openai:a") is True
+        cache.put("a", 1)
+
+        assert cache.bind_model("openai:a") is False
+        assert cache.get("a") == 1
+        assert cache.bind_model("openai:b") is True
+        assert cache.get("a") is None
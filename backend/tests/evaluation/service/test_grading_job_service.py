@@ -0,0 +1,119 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from evaluation.model.grading_job import GradingJob, GradingJobKind, GradingJobStatus
+from evaluation.service.grading_job_service import GradingJobService
+
+
+class InMemoryGradingJobRepository:
+    def __init__(self) -> None:
+        self.jobs: dict[str, GradingJob] = {}
+
+    async def get(self, job_id: str) -> GradingJob | None:
+        job = self.jobs.get(job_id)
+        return replace(job) if job is not None else None
+
+    async def get_for_session(self, kind: GradingJobKind, session_id: str) -> GradingJob | None:
+        for job in self.jobs.values():
+            if job.kind == kind and job.session_id == session_id:
+                return replace(job)
+        return None
+
+    async def create_if_absent(self, job: GradingJob) -> bool:
+        if await self.get_for_session(job.kind, job.session_id) is not None:
+            return False
+        self.jobs[job.id] = replace(job)
+        return True
+
+    async def save(self, job: GradingJob) -> None:
+        self.jobs[job.id] = replace(job)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def service(clock: FakeClock) -> GradingJobService:
+    return GradingJobService(InMemoryGradingJobRepository(), stale_after_seconds=60, clock=clock)
+
+
+class TestGradingJobService:
+    @pytest.mark.asyncio
+    async def test_first_start_creates_a_job_to_run(self, service: GradingJobService):
+        job, needs_run = await service.start(GradingJobKind.EXAM, "s1")
+
+        assert needs_run is True
+        assert job.status == GradingJobStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_second_start_returns_the_running_job(self, service: GradingJobService):
+        job, _ = await service.start(GradingJobKind.EXAM, "s1")
+        await service.mark_running(job.id)
+
+        again, needs_run = await service.start(GradingJobKind.EXAM, "s1")
+
+        assert again.id == job.id
+        assert again.status == GradingJobStatus.RUNNING
+        assert needs_run is False
+
+    @pytest.mark.asyncio
+    async def test_completed_job_is_never_rerun(
+        self, service: GradingJobService, clock: FakeClock
+    ):
+        job, _ = await service.start(GradingJobKind.EXAM, "s1")
+        await service.mark_completed(job.id)
+        clock.now += timedelta(hours=1)
+
+        _, needs_run = await service.start(GradingJobKind.EXAM, "s1")
+
+        assert needs_run is False
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_restarted(self, service: GradingJobService):
+        job, _ = await service.start(GradingJobKind.EXAM, "s1")
+        await service.mark_failed(job.id, "boom")
+
+        again, needs_run = await service.start(GradingJobKind.EXAM, "s1")
+
+        assert again.id == job.id
+        assert again.status == GradingJobStatus.PENDING
+        assert again.error is None
+        assert needs_run is True
+
+    @pytest.mark.asyncio
+    async def test_stale_running_job_is_restarted(
+        self, service: GradingJobService, clock: FakeClock
+    ):
+        job, _ = await service.start(GradingJobKind.EXAM, "s1")
+        await service.mark_running(job.id)
+        clock.now += timedelta(seconds=30)
+        await service.heartbeat(job.id)
+        clock.now += timedelta(seconds=59)
+
+        assert (await service.start(GradingJobKind.EXAM, "s1"))[1] is False
+
+        clock.now += timedelta(seconds=1)
+        assert (await service.start(GradingJobKind.EXAM, "s1"))[1] is True
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_per_kind_and_session(self, service: GradingJobService):
+        exam_job, _ = await service.start(GradingJobKind.EXAM, "s1")
+        navigation_job, _ = await service.start(GradingJobKind.NAVIGATION, "s1")
+
+        assert exam_job.id != navigation_job.id
+        with pytest.raises(ValueError, match="not found"):
+            await service.get(GradingJobKind.NAVIGATION, "s1", exam_job.id)
+        with pytest.raises(ValueError, match="not found"):
+            await service.get(GradingJobKind.EXAM, "s2", exam_job.id)
@@ -0,0 +1,64 @@
+import pytest
+
+from evaluation.service.openai_client_registry import OpenAiClientRegistry
+
+
+@pytest.fixture
+def registry() -> OpenAiClientRegistry:
+    return OpenAiClientRegistry(http2=False)
+
+
+class TestOpenAiClientRegistry:
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_key_and_timeout(self, registry: OpenAiClientRegistry):
+        first = registry.get("sk-a", 25.0)
+
+        assert registry.get("sk-a", 25.0) is first
+        assert registry.get("sk-a", 30.0) is not first
+        assert len(registry) == 2
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retain_closes_clients_of_other_keys(self, registry: OpenAiClientRegistry):
+        old = registry.get("sk-old", 25.0)
+        current = registry.get("sk-new", 25.0)
+
+        await registry.retain("sk-new")
+
+        assert old.is_closed()
+        assert not current.is_closed()
+        assert registry.get("sk-new", 25.0) is current
+        assert len(registry) == 1
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retain_none_closes_everything(self, registry: OpenAiClientRegistry):
+        client = registry.get("sk-a", 25.0)
+
+        await registry.retain(None)
+
+        assert client.is_closed()
+        assert len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self, registry: OpenAiClientRegistry):
+        client = registry.get("sk-a", 25.0)
+        await registry.aclose()
+
+        assert client.is_closed()
+        assert registry.get("sk-a", 25.0) is not client
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_base_url_gets_its_own_client(self, registry: OpenAiClientRegistry):
+        official = registry.get("sk-a", 25.0)
+        local = registry.get("sk-a", 25.0, "http://localhost:8100/v1")
+
+        assert local is not official
+        assert str(local.base_url).startswith("http://localhost:8100/v1")
+
+        await registry.retain("sk-a", "http://localhost:8100/v1")
+
+        assert official.is_closed()
+        assert not local.is_closed()
+        await registry.aclose()
@@ -0,0 +1,181 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from evaluation.service.evaluation_memory_cache import EvaluationMemoryCache
+from exam.model.exam_result import ExamEvaluation
+from exam.service.caching_exam_evaluator import CachingExamEvaluator, evaluation_cache_key
+from exam.service.exam_evaluator_port import ExamEvaluationRequest, ExamEvaluatorCapabilities
+
+
+class CountingEvaluator:
+    """Fake ExamEvaluatorPort that records which answers it graded."""
+
+    def __init__(self, model: str = "gpt-test", deterministic: bool = False) -> None:
+        self.model = model
+        self.deterministic = deterministic
+        self.graded: list[str] = []
+        self.fail = False
+
+    async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        return (await self.evaluate_many([request]))[0]
+
+    async def evaluate_many(self, requests: list[ExamEvaluationRequest]) -> list[ExamEvaluation]:
+        self.graded.extend(request.student_answer for request in requests)
+        return [
+            ExamEvaluation(score=2.0, is_correct=True, feedback="ok", from_fallback=self.fail)
+            for _ in requests
+        ]
+
+    def capabilities(self) -> ExamEvaluatorCapabilities:
+        return ExamEvaluatorCapabilities(
+            provider="fake", model=self.model, deterministic=self.deterministic
+        )
+
+
+class InMemoryEvaluationCacheRepository:
+    def __init__(self, clock=lambda: datetime.now(timezone.utc)) -> None:
+        self.rows: dict[str, tuple[str, ExamEvaluation, datetime]] = {}
+        self._clock = clock
+
+    async def get_many(self, keys, *, stored_after: datetime) -> dict[str, ExamEvaluation]:
+        return {
+            key: self.rows[key][1]
+            for key in keys
+            if key in self.rows and self.rows[key][2] > stored_after
+        }
+
+    async def put_many(
+        self,
+        model: str,
+        evaluations: dict[str, ExamEvaluation],
+        *,
+        expired_before: datetime,
+    ) -> None:
+        self.rows = {key: row for key, row in self.rows.items() if row[2] > expired_before}
+        for key, evaluation in evaluations.items():
+            self.rows[key] = (model, evaluation, self._clock())
+
+    async def delete_other_models(self, model: str) -> None:
+        self.rows = {key: row for key, row in self.rows.items() if row[0] == model}
+
+
+def _request(student_answer: str) -> ExamEvaluationRequest:
+    return ExamEvaluationRequest(
+        question_text="Frage",
+        short_answer=["Kernpunkt"],
+        reference_answer="Referenz",
+        student_answer=student_answer,
+        max_score=2.0,
+    )
+
+
+def _memory() -> EvaluationMemoryCache[ExamEvaluation]:
+    return EvaluationMemoryCache(max_entries=100, ttl_seconds=3600)
+
+
+def _caching(inner, memory=None, store=None, **kwargs) -> CachingExamEvaluator:
+    return CachingExamEvaluator(
+        inner=inner,
+        memory=memory or _memory(),
+        store=store,
+        ttl_seconds=3600,
+        **kwargs,
+    )
+
+
+class TestCacheKey:
+    def test_ignores_case_and_whitespace_of_the_answer(self):
+        assert evaluation_cache_key(_request("Gelbe  Tonne"), "m") == evaluation_cache_key(
+            _request(" gelbe tonne\n"), "m"
+        )
+
+    def test_depends_on_model_and_max_score(self):
+        request = _request("Antwort")
+        assert evaluation_cache_key(request, "a") != evaluation_cache_key(request, "b")
+        assert evaluation_cache_key(request, "a") != evaluation_cache_key(
+            replace(request, max_score=4.0), "a"
+        )
+
+
+class TestCachingExamEvaluator:
+    @pytest.mark.asyncio
+    async def test_repeated_answer_is_graded_once(self):
+        inner = CountingEvaluator()
+        evaluator = _caching(inner)
+
+        await evaluator.evaluate(_request("Sondertonne"))
+        result = await evaluator.evaluate(_request("  SONDERTONNE "))
+
+        assert result.score == 2.0
+        assert inner.graded == ["Sondertonne"]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_within_a_batch_are_graded_once(self):
+        inner = CountingEvaluator()
+        results = await _caching(inner).evaluate_many(
+            [_request("a"), _request("A"), _request("b")]
+        )
+
+        assert len(results) == 3
+        assert inner.graded == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_persisted_results_survive_a_cold_memory_cache(self):
+        store = InMemoryEvaluationCacheRepository()
+        await _caching(CountingEvaluator(), store=store).evaluate(_request("a"))
+
+        inner = CountingEvaluator()
+        await _caching(inner, store=store).evaluate(_request("a"))
+
+        assert inner.graded == []
+
+    @pytest.mark.asyncio
+    async def test_fallback_results_are_not_cached(self):
+        inner = CountingEvaluator()
+        inner.fail = True
+        store = InMemoryEvaluationCacheRepository()
+        evaluator = _caching(inner, store=store)
+
+        await evaluator.evaluate(_request("a"))
+        await evaluator.evaluate(_request("a"))
+
+        assert inner.graded == ["a", "a"]
+        assert store.rows == {}
+
+    @pytest.mark.asyncio
+    async def test_model_change_invalidates_cached_results(self):
+        memory = _memory()
+        store = InMemoryEvaluationCacheRepository()
+        await _caching(CountingEvaluator("gpt-old"), memory, store).evaluate(_request("a"))
+
+        inner = CountingEvaluator("gpt-new")
+        await _caching(inner, memory, store).evaluate(_request("a"))
+
+        assert inner.graded == ["a"]
+        assert {model for model, _, _ in store.rows.values()} == {"fake:gpt-new"}
+
+    @pytest.mark.asyncio
+    async def test_expired_rows_are_purged_on_write(self):
+        now = [datetime(2026, 1, 1, tzinfo=timezone.utc)]
+        store = InMemoryEvaluationCacheRepository(clock=lambda: now[0])
+        await _caching(CountingEvaluator(), store=store, clock=lambda: now[0]).evaluate(
+            _request("a")
+        )
+
+        now[0] += timedelta(hours=2)
+        inner = CountingEvaluator()
+        await _caching(inner, store=store, clock=lambda: now[0]).evaluate(_request("b"))
+
+        assert inner.graded == ["b"]
+        assert len(store.rows) == 1
+
+    @pytest.mark.asyncio
+    async def test_deterministic_evaluators_are_not_persisted(self):
+        store = InMemoryEvaluationCacheRepository()
+        await _caching(CountingEvaluator(deterministic=True), store=store).evaluate(
+            _request("a")
+        )
+
+        assert store.rows == {}
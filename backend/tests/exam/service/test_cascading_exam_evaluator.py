@@ -0,0 +1,134 @@
+import pytest
+
+from exam.model.exam_result import ExamEvaluation
+from exam.service.cascading_exam_evaluator import CascadingExamEvaluator, GradingCascadeStats
+from exam.service.exam_evaluator_port import ExamEvaluationRequest, ExamEvaluatorCapabilities
+from exam.service.heuristic_exam_evaluator import HeuristicExamEvaluator
+
+
+class RecordingLlmEvaluator:
+    def __init__(self) -> None:
+        self.graded: list[str] = []
+
+    async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        return (await self.evaluate_many([request]))[0]
+
+    async def evaluate_many(self, requests: list[ExamEvaluationRequest]) -> list[ExamEvaluation]:
+        self.graded.extend(request.student_answer for request in requests)
+        return [ExamEvaluation(score=1.0, is_correct=False, feedback="llm") for _ in requests]
+
+    def capabilities(self) -> ExamEvaluatorCapabilities:
+        return ExamEvaluatorCapabilities(provider="openai", model="gpt-test")
+
+
+def _request(student_answer: str, short_answer: list[str] | None = None) -> ExamEvaluationRequest:
+    return ExamEvaluationRequest(
+        question_text="Was zeigt ein Fahrzeug bei Nacht?",
+        short_answer=["Topplicht weiss", "Seitenlichter"] if short_answer is None else short_answer,
+        reference_answer="",
+        student_answer=student_answer,
+        max_score=2.0,
+    )
+
+
+@pytest.fixture
+def llm() -> RecordingLlmEvaluator:
+    return RecordingLlmEvaluator()
+
+
+def _cascade(llm, low: float = 0.0, high: float = 1.0, stats=None) -> CascadingExamEvaluator:
+    return CascadingExamEvaluator(
+        heuristic=HeuristicExamEvaluator(),
+        escalate_to=llm,
+        low_coverage=low,
+        high_coverage=high,
+        stats=stats,
+    )
+
+
+class TestCascadingExamEvaluator:
+    @pytest.mark.asyncio
+    async def test_defaults_settle_only_blank_and_complete_answers(
+        self, llm: RecordingLlmEvaluator
+    ):
+        cascade = _cascade(llm)
+
+        results = await cascade.evaluate_many(
+            [
+                _request(""),
+                _request("Topplicht weiss und Seitenlichter"),
+                _request("nur das Topplicht"),
+                _request("Hecklicht"),
+            ]
+        )
+
+        assert llm.graded == ["nur das Topplicht", "Hecklicht"]
+        assert [result.score for result in results] == [0.0, 2.0, 1.0, 1.0]
+        assert cascade.stats.blank_answers == 1
+        assert cascade.stats.avoided_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_opted_in_thresholds_settle_clear_answers(self, llm: RecordingLlmEvaluator):
+        cascade = _cascade(llm, low=0.1, high=0.9)
+
+        results = await cascade.evaluate_many(
+            [_request("Topplicht weiss und Seitenlichter"), _request("Hecklicht")]
+        )
+
+        assert llm.graded == []
+        assert [result.score for result in results] == [2.0, 0.0]
+        assert cascade.stats.avoided_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_answers_are_escalated_in_order(self, llm: RecordingLlmEvaluator):
+        cascade = _cascade(llm, low=0.1, high=0.9)
+
+        results = await cascade.evaluate_many(
+            [_request("nur das Topplicht"), _request(""), _request("Seitenlichter")]
+        )
+
+        assert llm.graded == ["nur das Topplicht", "Seitenlichter"]
+        assert [result.feedback for result in results][0::2] == ["llm", "llm"]
+        assert results[1].score == 0.0
+        assert cascade.stats.escalated_answers == 2
+        assert cascade.stats.heuristic_answers == 1
+        assert cascade.stats.avoided_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_wider_thresholds_settle_more_answers(self, llm: RecordingLlmEvaluator):
+        cascade = _cascade(llm, low=0.75, high=0.75)
+
+        await cascade.evaluate_many([_request("nur das Topplicht")])
+
+        assert llm.graded == []
+
+    @pytest.mark.asyncio
+    async def test_high_threshold_is_inclusive(self, llm: RecordingLlmEvaluator):
+        cascade = _cascade(llm, high=0.5)
+
+        await cascade.evaluate_many([_request("nur das Topplicht")])
+
+        assert llm.graded == []
+        assert cascade.stats.avoided_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_questions_without_key_points_are_escalated(self, llm: RecordingLlmEvaluator):
+        cascade = _cascade(llm)
+
+        await cascade.evaluate(_request("irgendwas", short_answer=[]))
+
+        assert llm.graded == ["irgendwas"]
+
+    @pytest.mark.asyncio
+    async def test_shared_stats_accumulate_across_instances(self, llm: RecordingLlmEvaluator):
+        stats = GradingCascadeStats()
+
+        await _cascade(llm, low=0.1, stats=stats).evaluate(_request("Hecklicht"))
+        await _cascade(llm, low=0.1, stats=stats).evaluate(_request(""))
+
+        assert stats.avoided_calls == 1
+        assert stats.blank_answers == 1
+
+    def test_rejects_inverted_thresholds(self, llm: RecordingLlmEvaluator):
+        with pytest.raises(ValueError):
+            _cascade(llm, low=0.8, high=0.2)
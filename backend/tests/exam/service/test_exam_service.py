@@ -0,0 +1,254 @@
+from dataclasses import replace
+
+import pytest
+
+from card.model.card import Card
+from exam.model.exam_answer import ExamAnswer
+from exam.model.exam_result import ExamEvaluation
+from exam.model.exam_session import ExamSession, ExamSessionStatus
+from exam.service.exam_evaluator_port import ExamEvaluationRequest, ExamEvaluatorCapabilities
+from exam.service.exam_service import ExamService
+
+QUESTION_COUNT = 2
+
+
+class InMemoryExamRepository:
+    def __init__(self) -> None:
+        self.sessions: dict[str, ExamSession] = {}
+        self.answers: dict[tuple[str, str], ExamAnswer] = {}
+
+    async def create_session(self, session: ExamSession, answers: list[ExamAnswer]) -> None:
+        self.sessions[session.id] = session
+        for answer in answers:
+            self.answers[(answer.session_id, answer.card_id)] = answer
+
+    async def get_session(self, session_id: str) -> ExamSession | None:
+        session = self.sessions.get(session_id)
+        return replace(session) if session is not None else None
+
+    async def save_session(self, session: ExamSession) -> None:
+        self.sessions[session.id] = replace(session)
+
+    async def list_answers(self, session_id: str) -> list[ExamAnswer]:
+        answers = [replace(a) for (sid, _), a in self.answers.items() if sid == session_id]
+        return sorted(answers, key=lambda a: a.question_number)
+
+    async def get_answer(self, session_id: str, card_id: str) -> ExamAnswer | None:
+        answer = self.answers.get((session_id, card_id))
+        return replace(answer) if answer is not None else None
+
+    async def save_answer(self, answer: ExamAnswer) -> None:
+        self.answers[(answer.session_id, answer.card_id)] = replace(answer)
+
+    async def save_speculative_grade(self, answer: ExamAnswer) -> bool:
+        stored = self.answers.get((answer.session_id, answer.card_id))
+        session = self.sessions.get(answer.session_id)
+        if (
+            stored is None
+            or stored.student_answer != answer.student_answer
+            or session is None
+            or session.status != ExamSessionStatus.IN_PROGRESS
+        ):
+            return False
+        self.answers[(answer.session_id, answer.card_id)] = replace(
+            stored,
+            score=answer.score,
+            is_correct=answer.is_correct,
+            feedback=answer.feedback,
+            errors=answer.errors,
+            graded_answer_hash=answer.graded_answer_hash,
+        )
+        return True
+
+    async def list_completed_sessions(self) -> list[ExamSession]:
+        return []
+
+
+class InMemoryCardRepository:
+    def __init__(self, cards: list[Card]) -> None:
+        self._cards = {card.card_id: card for card in cards}
+
+    async def list_all(self) -> list[Card]:
+        return list(self._cards.values())
+
+    async def get_by_id(self, card_id: str) -> Card | None:
+        return self._cards.get(card_id)
+
+    async def get_by_exam_sheet(self, sheet_number: int) -> list[Card]:
+        return [card for card in self._cards.values() if sheet_number in card.exam_sheets]
+
+    async def count_by_exam_sheet(self) -> dict[int, int]:
+        return {1: len(self._cards)}
+
+
+class CountingEvaluator:
+    def __init__(self) -> None:
+        self.graded: list[str] = []
+        self.fail = False
+        self.model = "fake"
+
+    async def evaluate(self, request: ExamEvaluationRequest) -> ExamEvaluation:
+        return (await self.evaluate_many([request]))[0]
+
+    async def evaluate_many(self, requests: list[ExamEvaluationRequest]) -> list[ExamEvaluation]:
+        self.graded.extend(request.student_answer for request in requests)
+        return [
+            ExamEvaluation(score=2.0, is_correct=True, feedback="ok", from_fallback=self.fail)
+            for _ in requests
+        ]
+
+    def capabilities(self) -> ExamEvaluatorCapabilities:
+        return ExamEvaluatorCapabilities(provider="fake", model=self.model, deterministic=False)
+
+
+@pytest.fixture
+def exam_repo() -> InMemoryExamRepository:
+    return InMemoryExamRepository()
+
+
+@pytest.fixture
+def evaluator() -> CountingEvaluator:
+    return CountingEvaluator()
+
+
+@pytest.fixture
+def service(exam_repo: InMemoryExamRepository, evaluator: CountingEvaluator) -> ExamService:
+    cards = [
+        Card(card_id=f"c{index}", short_answer=["Kernpunkt"], exam_sheets=[1])
+        for index in range(QUESTION_COUNT)
+    ]
+    return ExamService(
+        exam_repo=exam_repo,
+        card_repo=InMemoryCardRepository(cards),
+        evaluator=evaluator,
+        question_count=QUESTION_COUNT,
+        background_grading=True,
+    )
+
+
+class TestBackgroundGrading:
+    @pytest.mark.asyncio
+    async def test_submit_reuses_grade_of_unchanged_answer(
+        self, service: ExamService, evaluator: CountingEvaluator
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "Antwort eins")
+        await service.save_answer(session_id, "c1", "Antwort zwei")
+
+        assert await service.grade_saved_answer(session_id, "c0", "Antwort eins") is True
+        result = await service.submit_session(session_id)
+
+        assert evaluator.graded == ["Antwort eins", "Antwort zwei"]
+        assert result.total_score == 4.0
+
+    @pytest.mark.asyncio
+    async def test_answer_changed_after_grading_is_regraded_on_submit(
+        self, service: ExamService, evaluator: CountingEvaluator
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "alt")
+        await service.grade_saved_answer(session_id, "c0", "alt")
+        await service.save_answer(session_id, "c0", "neu")
+
+        await service.submit_session(session_id)
+
+        assert evaluator.graded.count("neu") == 1
+
+    @pytest.mark.asyncio
+    async def test_grade_of_another_model_is_regraded_on_submit(
+        self, service: ExamService, evaluator: CountingEvaluator
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "Antwort")
+        await service.grade_saved_answer(session_id, "c0", "Antwort")
+        evaluator.model = "other"
+
+        await service.submit_session(session_id)
+
+        assert evaluator.graded.count("Antwort") == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_grading_job_is_skipped(
+        self, service: ExamService, evaluator: CountingEvaluator
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "neu")
+
+        assert await service.grade_saved_answer(session_id, "c0", "alt") is False
+        assert evaluator.graded == []
+
+    @pytest.mark.asyncio
+    async def test_fallback_grade_is_not_stored(
+        self,
+        service: ExamService,
+        evaluator: CountingEvaluator,
+        exam_repo: InMemoryExamRepository,
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "Antwort")
+        evaluator.fail = True
+
+        assert await service.grade_saved_answer(session_id, "c0", "Antwort") is False
+        assert exam_repo.answers[(session_id, "c0")].score is None
+
+    @pytest.mark.asyncio
+    async def test_submitted_session_is_not_graded_speculatively(
+        self, service: ExamService, evaluator: CountingEvaluator
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "Antwort")
+        await service.submit_session(session_id)
+        evaluator.graded.clear()
+
+        assert await service.grade_saved_answer(session_id, "c0", "Antwort") is False
+        assert evaluator.graded == []
+
+
+class TestSubmitWithCheckpoint:
+    @pytest.mark.asyncio
+    async def test_saves_each_answer_before_its_checkpoint(
+        self, service: ExamService, exam_repo: InMemoryExamRepository
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "Antwort eins")
+        await service.save_answer(session_id, "c1", "Antwort zwei")
+        graded_at_checkpoint: list[int] = []
+
+        async def checkpoint() -> None:
+            graded_at_checkpoint.append(
+                sum(answer.score is not None for answer in exam_repo.answers.values())
+            )
+
+        result = await service.submit_session(session_id, checkpoint=checkpoint)
+
+        assert graded_at_checkpoint == [1, 2]
+        assert result.total_score == 4.0
+
+    @pytest.mark.asyncio
+    async def test_progress_lists_graded_questions_then_the_result(
+        self, service: ExamService, exam_repo: InMemoryExamRepository
+    ):
+        details = await service.start_session(sheet_number=1)
+        session_id = details.session.id
+        await service.save_answer(session_id, "c0", "Antwort")
+        assert (await service.get_grading_progress(session_id)).questions == []
+
+        snapshots = []
+
+        async def checkpoint() -> None:
+            snapshots.append(await service.get_grading_progress(session_id))
+
+        await service.submit_session(session_id, checkpoint=checkpoint)
+        final = await service.get_grading_progress(session_id)
+
+        assert [len(snapshot.questions) for snapshot in snapshots] == [1, 2]
+        assert all(snapshot.result is None for snapshot in snapshots)
+        assert final.result is not None
+        assert len(final.questions) == QUESTION_COUNT
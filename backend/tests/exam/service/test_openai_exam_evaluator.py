@@ -0,0 +1,131 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from exam.service.exam_evaluator_port import ExamEvaluationRequest
+from exam.service.openai_exam_evaluator import OpenAiExamEvaluator
+
+
+class FakeCompletions:
+    """Returns canned chat completion contents in call order."""
+
+    def __init__(self, contents: list[str | Exception], delay: float = 0.0) -> None:
+        self._contents = list(contents)
+        self._delay = delay
+        self.calls: list[dict] = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = self._contents.pop(0)
+        if isinstance(content, Exception):
+            raise content
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+def _evaluator(
+    contents: list[str | Exception],
+    timeout_seconds: float = 5,
+    delay: float = 0.0,
+) -> tuple[OpenAiExamEvaluator, FakeCompletions]:
+    completions = FakeCompletions(contents, delay=delay)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    evaluator = OpenAiExamEvaluator(
+        api_key="test", model="test-model", timeout_seconds=timeout_seconds, client=client
+    )
+    return evaluator, completions
+
+
+def _request(student_answer: str) -> ExamEvaluationRequest:
+    return ExamEvaluationRequest(
+        question_text="Was bedeutet ein gelbes Blitzfeuer?",
+        short_answer=["Sondertonne"],
+        reference_answer="Eine Sondertonne.",
+        student_answer=student_answer,
+        max_score=2.0,
+    )
+
+
+def _result(number: int, score: float) -> dict:
+    return {"id": number, "score": score, "is_correct": score == 2, "errors": [], "feedback": "ok"}
+
+
+class TestEvaluateMany:
+    @pytest.mark.asyncio
+    async def test_grades_all_answers_with_one_completion(self):
+        evaluator, completions = _evaluator(
+            [json.dumps({"results": [_result(2, 1), _result(1, 2)]})]
+        )
+
+        results = await evaluator.evaluate_many([_request("a"), _request("b")])
+
+        assert [result.score for result in results] == [2.0, 1.0]
+        assert len(completions.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_answers_are_not_sent(self):
+        evaluator, completions = _evaluator(
+            [json.dumps({"results": [_result(1, 2), _result(3, 2)]})]
+        )
+
+        results = await evaluator.evaluate_many([_request("a"), _request(" "), _request("c")])
+
+        assert [result.score for result in results] == [2.0, 0.0, 2.0]
+        assert "Antwort 2:" not in completions.calls[0]["messages"][1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_missing_items_are_graded_individually(self):
+        evaluator, completions = _evaluator(
+            [
+                json.dumps({"results": [_result(1, 2)]}),
+                json.dumps({"score": 1, "is_correct": False, "feedback": "teilweise"}),
+            ]
+        )
+
+        results = await evaluator.evaluate_many([_request("a"), _request("b")])
+
+        assert [result.score for result in results] == [2.0, 1.0]
+        assert len(completions.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back_to_single_calls(self):
+        evaluator, completions = _evaluator(
+            [
+                "not json",
+                json.dumps({"score": 2}),
+                json.dumps({"score": 0}),
+            ]
+        )
+
+        results = await evaluator.evaluate_many([_request("a"), _request("b")])
+
+        assert sorted(result.score for result in results) == [0.0, 2.0]
+        assert len(completions.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_not_retried_per_answer(self):
+        evaluator, completions = _evaluator([TimeoutError("batch timed out")])
+
+        results = await evaluator.evaluate_many([_request("a"), _request("b")])
+
+        assert len(completions.calls) == 1
+        assert all(result.from_fallback for result in results)
+
+    @pytest.mark.asyncio
+    async def test_slow_retries_fall_back_after_one_timeout(self):
+        evaluator, completions = _evaluator(
+            [json.dumps({"results": [_result(1, 2)]}), json.dumps({"score": 2})],
+            timeout_seconds=0.05,
+            delay=0.2,
+        )
+
+        results = await evaluator.evaluate_many([_request("a"), _request("b")])
+
+        assert results[0].score == 2.0
+        assert results[1].from_fallback
+        assert len(completions.calls) == 2
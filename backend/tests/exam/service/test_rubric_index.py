@@ -0,0 +1,65 @@
+from exam.service.rubric_index import RubricIndex
+
+
+class TestRubricIndex:
+    def test_compiles_each_card_once(self):
+        index = RubricIndex()
+
+        first = index.rubric(["Fahrzeug manoevrierbehindert"], "")
+
+        assert index.rubric(["Fahrzeug manoevrierbehindert"], "") is first
+        assert len(index) == 1
+
+    def test_falls_back_to_reference_sentences(self):
+        index = RubricIndex()
+
+        rubric = index.rubric(["  "], "Rotes Licht backbord. Gruenes Licht steuerbord.")
+
+        assert [phrase.text for phrase in rubric.phrases] == [
+            "Rotes Licht backbord",
+            "Gruenes Licht steuerbord",
+        ]
+
+    def test_phrase_needs_half_of_its_terms(self):
+        index = RubricIndex()
+        rubric = index.rubric(["Rotes Licht backbord", "Gruenes Licht steuerbord"], "")
+
+        covered, missing = rubric.split_by_coverage(index.answer_terms("rotes Signal an backbord"))
+
+        assert covered == ["Rotes Licht backbord"]
+        assert missing == ["Gruenes Licht steuerbord"]
+
+    def test_short_words_never_cover_a_phrase(self):
+        index = RubricIndex()
+        rubric = index.rubric(["bei See"], "")
+
+        covered, _ = rubric.split_by_coverage(index.answer_terms("bei See"))
+
+        assert covered == []
+
+    def test_evicts_least_recently_used_rubric(self):
+        index = RubricIndex(max_rubrics=2)
+        first = index.rubric(["Kurs"], "")
+        index.rubric(["Peilung"], "")
+        index.rubric(["Kurs"], "")
+        index.rubric(["Abdrift"], "")
+
+        assert len(index) == 2
+        assert index.rubric(["Kurs"], "") is first
+        assert index.vocabulary_size == 3
+
+    def test_misspelled_terms_still_cover_a_phrase(self):
+        index = RubricIndex()
+        rubric = index.rubric(["Ausweichen nach Steuerbord"], "")
+
+        covered, _ = rubric.split_by_coverage(index.answer_terms("nach steuerbort ausweichn"))
+
+        assert covered == ["Ausweichen nach Steuerbord"]
+
+    def test_typo_tolerance_can_be_disabled(self):
+        index = RubricIndex(typo_tolerant=False)
+        rubric = index.rubric(["Steuerbord"], "")
+
+        covered, _ = rubric.split_by_coverage(index.answer_terms("Steuerbort"))
+
+        assert covered == []
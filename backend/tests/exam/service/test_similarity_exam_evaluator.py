@@ -0,0 +1,107 @@
+import pytest
+
+from exam.service.exam_evaluator_port import ExamEvaluationRequest
+from exam.service.similarity_exam_evaluator import (
+    ReferenceVectorIndex,
+    SimilarityExamEvaluator,
+)
+
+SHORT_ANSWER = ["Ausweichen nach Steuerbord", "Schallsignal ein kurzer Ton geben"]
+CATALOGUE = [
+    (SHORT_ANSWER, ""),
+    (["Rotes Licht an Backbord", "Gruenes Licht an Steuerbord"], ""),
+    (["Seekarten auf den neuesten Stand berichtigen"], ""),
+]
+
+
+@pytest.fixture
+def evaluator() -> SimilarityExamEvaluator:
+    index = ReferenceVectorIndex()
+    index.build(CATALOGUE)
+    return SimilarityExamEvaluator(index)
+
+
+def _request(answer: str, short_answer: list[str] = SHORT_ANSWER) -> ExamEvaluationRequest:
+    return ExamEvaluationRequest(
+        question_text="Wie weichen Sie aus?",
+        short_answer=short_answer,
+        reference_answer="",
+        student_answer=answer,
+        max_score=2.0,
+    )
+
+
+class TestSimilarityExamEvaluator:
+    def test_full_answer_gets_full_score(self, evaluator: SimilarityExamEvaluator):
+        evaluation = evaluator.evaluate_sync(
+            _request("Ich weiche nach Steuerbord aus und gebe einen kurzen Ton als Schallsignal.")
+        )
+
+        assert evaluation.score == 2.0
+        assert evaluation.is_correct
+        assert evaluation.errors == []
+
+    def test_partial_answer_reports_missing_point(self, evaluator: SimilarityExamEvaluator):
+        evaluation = evaluator.evaluate_sync(_request("Ausweichen nach Steuerbord"))
+
+        assert evaluation.score == 1.0
+        assert evaluation.errors == ["Fehlender Kernpunkt: Schallsignal ein kurzer Ton geben"]
+
+    def test_unrelated_answer_scores_zero(self, evaluator: SimilarityExamEvaluator):
+        evaluation = evaluator.evaluate_sync(_request("Die Seekarten berichtigen"))
+
+        assert evaluation.score == 0.0
+
+    def test_tolerates_typos(self, evaluator: SimilarityExamEvaluator):
+        evaluation = evaluator.evaluate_sync(_request("Ausweichn nach Steuerbort"))
+
+        assert evaluation.score == 1.0
+
+    def test_blank_answer_scores_zero(self, evaluator: SimilarityExamEvaluator):
+        assert evaluator.evaluate_sync(_request("  ")).score == 0.0
+
+    def test_card_outside_catalogue_is_vectorised_on_demand(self):
+        index = ReferenceVectorIndex()
+        index.build(CATALOGUE)
+        evaluator = SimilarityExamEvaluator(index)
+
+        evaluation = evaluator.evaluate_sync(
+            _request("Ankerball setzen", short_answer=["Ankerball setzen"])
+        )
+
+        assert evaluation.score == 2.0
+        assert len(index) == len(CATALOGUE)
+
+    def test_rebuild_replaces_the_catalogue(self):
+        index = ReferenceVectorIndex()
+        index.build(CATALOGUE)
+        index.build(CATALOGUE[:1])
+        evaluator = SimilarityExamEvaluator(index)
+
+        assert len(index) == 1
+        assert evaluator.evaluate_sync(_request("Ausweichen nach Steuerbord")).score == 1.0
+
+    @pytest.mark.asyncio
+    async def test_evaluate_many_keeps_order(self, evaluator: SimilarityExamEvaluator):
+        evaluations = await evaluator.evaluate_many(
+            [_request("Die Seekarten berichtigen"), _request("Ausweichen nach Steuerbord")]
+        )
+
+        assert [evaluation.score for evaluation in evaluations] == [0.0, 1.0]
+
+    def test_rejects_inverted_thresholds(self):
+        with pytest.raises(ValueError):
+            SimilarityExamEvaluator(ReferenceVectorIndex(), low_similarity=0.5, high_similarity=0.2)
+
+    def test_sheet_matches_single_evaluations(self, evaluator: SimilarityExamEvaluator):
+        requests = [
+            _request("Ausweichn nach Steuerbort"),
+            _request(" "),
+            _request("Ankerball setzen", short_answer=["Ankerball setzen"]),
+            _request("Nur ein Ton", short_answer=[]),
+            _request("Rotes Licht an Backbord", short_answer=CATALOGUE[1][0]),
+        ]
+
+        sheet = evaluator.evaluate_sheet(requests)
+
+        assert sheet == [evaluator.evaluate_sync(request) for request in requests]
@@ -0,0 +1,41 @@
+import pytest
+
+from exam.service.typo_vocabulary import SymSpellVocabulary, edit_distance
+
+
+@pytest.fixture
+def vocabulary() -> SymSpellVocabulary:
+    vocabulary = SymSpellVocabulary()
+    for term in ["steuerbord", "backbord", "kurs", "kompass", "kompassrose"]:
+        vocabulary.add(term)
+    return vocabulary
+
+
+class TestSymSpellVocabulary:
+    def test_exact_hit_wins(self, vocabulary: SymSpellVocabulary):
+        assert vocabulary.lookup("backbord") == ["backbord"]
+
+    def test_resolves_substitution_and_transposition(self, vocabulary: SymSpellVocabulary):
+        assert vocabulary.lookup("steuerbort") == ["steuerbord"]
+        assert vocabulary.lookup("bakcbord") == ["backbord"]
+
+    def test_long_words_allow_two_edits(self, vocabulary: SymSpellVocabulary):
+        assert vocabulary.lookup("kompssrse") == ["kompassrose"]
+
+    def test_short_words_must_match_exactly(self, vocabulary: SymSpellVocabulary):
+        assert vocabulary.lookup("kurz") == []
+
+    def test_unrelated_word_has_no_match(self, vocabulary: SymSpellVocabulary):
+        assert vocabulary.lookup("leuchtfeuer") == []
+
+
+class TestEditDistance:
+    @pytest.mark.parametrize(
+        ("a", "b", "expected"),
+        [("kurs", "kurs", 0), ("kurs", "kurz", 1), ("ab", "ba", 1), ("abc", "", 3)],
+    )
+    def test_distance(self, a: str, b: str, expected: int):
+        assert edit_distance(a, b, 5) == expected
+
+    def test_distance_is_capped(self):
+        assert edit_distance("steuerbord", "backbord", 2) == 2
@@ -0,0 +1,60 @@
+"""Integration test fixtures backed by a throwaway Postgres container.
+
+Tests in this package are skipped when Docker is not available.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncGenerator, Iterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture(scope="session")
+def database_url() -> Iterator[str]:
+    """Start Postgres, migrate it to head and yield its asyncpg URL."""
+    try:
+        from testcontainers.postgres import PostgresContainer
+
+        container = PostgresContainer("postgres:17-alpine", driver="asyncpg")
+        container.start()
+    except Exception as exc:  # Docker missing or not running
+        pytest.skip(f"Postgres container unavailable: {exc}")
+
+    try:
+        url = container.get_connection_url()
+        previous_url = os.environ.get("DATABASE_URL")
+        os.environ["DATABASE_URL"] = url
+        try:
+            config = Config(str(BACKEND_DIR / "alembic.ini"))
+            config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+            command.upgrade(config, "head")
+        finally:
+            if previous_url is None:
+                os.environ.pop("DATABASE_URL", None)
+            else:
+                os.environ["DATABASE_URL"] = previous_url
+        yield url
+    finally:
+        container.stop()
+
+
+@pytest_asyncio.fixture
+async def db_session(database_url: str) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session whose changes are rolled back after the test."""
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+    await engine.dispose()
@@ -0,0 +1,36 @@
+"""Streak bookkeeping of the daily_activity rollup against real Postgres."""
+
+from datetime import date
+
+import pytest
+
+from study.db.daily_activity_repository import DailyActivityRepository
+
+
+@pytest.mark.asyncio
+async def test_streak_extends_over_consecutive_days(db_session):
+    repo = DailyActivityRepository(db_session)
+
+    await repo.record_reviews(date(2026, 3, 1))
+    await repo.record_reviews(date(2026, 3, 2), review_count=3)
+    await repo.record_reviews(date(2026, 3, 2))
+
+    latest = await repo.get_latest()
+    assert latest.activity_date == date(2026, 3, 2)
+    assert latest.review_count == 4
+    assert latest.streak_days == 2
+
+
+@pytest.mark.asyncio
+async def test_late_day_renumbers_following_streak(db_session):
+    repo = DailyActivityRepository(db_session)
+
+    for day in (1, 3, 4, 6):
+        await repo.record_reviews(date(2026, 3, day))
+    # A buffered sync fills the gap on the 2nd after the 3rd and 4th exist.
+    await repo.record_reviews(date(2026, 3, 2))
+
+    streaks = {
+        day: (await repo.get(date(2026, 3, day))).streak_days for day in (1, 2, 3, 4, 6)
+    }
+    assert streaks == {1: 1, 2: 2, 3: 3, 4: 4, 6: 1}
@@ -0,0 +1,147 @@
+"""EXPLAIN-based regression tests for the hot study queue queries.
+
+Each test runs the real repository method, captures the statement it
+executes and asserts that Postgres serves it from the queue-order index
+without an explicit Sort node.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from scheduling.db.scheduling_repository import SchedulingRepository
+from study.db.study_queue_repository import StudyQueueRepository
+from study.model.queue_position import QueuePosition
+
+QUEUE_ORDER_INDEX = "ix_card_scheduling_info_queue_order"
+_CARD_COUNT = 5000
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class _CapturingSession:
+    """Delegates to a real session and records every executed statement."""
+
+    def __init__(self, session) -> None:
+        self._session = session
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return await self._session.execute(statement, *args, **kwargs)
+
+
+def _plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain(session, statement) -> list[dict]:
+    result = await session.execute(_Explain(statement))
+    return list(_plan_nodes(result.scalar()[0]["Plan"]))
+
+
+def _assert_index_ordered(nodes: list[dict]) -> None:
+    node_types = [node["Node Type"] for node in nodes]
+    assert not any("Sort" in node_type for node_type in node_types), node_types
+    assert any(node.get("Index Name") == QUEUE_ORDER_INDEX for node in nodes), node_types
+
+
+@pytest.fixture
+def now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def seeded_session(db_session, now):
+    # Mostly future-due rows with a small due backlog, like a real deck.
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO cards (card_id, front_text, front_images, answer_text,
+                               answer_images, short_answer, tags, exam_sheets)
+            SELECT 'card_' || n, '', '[]', '', '[]', '[]', ARRAY['navigation'], ARRAY[]::int[]
+            FROM generate_series(1, :count) AS n
+            """
+        ),
+        {"count": _CARD_COUNT},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO card_scheduling_info (card_id, state, stability, difficulty,
+                                              elapsed_days, scheduled_days, reps,
+                                              lapses, due, last_review)
+            SELECT 'card_' || n, 2, 1, 5, 0, 1, 1, 0,
+                   :now + make_interval(mins => n - 50),
+                   CASE WHEN n % 3 = 0 THEN NULL ELSE :now - interval '1 day' END
+            FROM generate_series(1, :count) AS n
+            """
+        ),
+        {"count": _CARD_COUNT, "now": now},
+    )
+    await db_session.execute(text("ANALYZE cards"))
+    await db_session.execute(text("ANALYZE card_scheduling_info"))
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    return db_session
+
+
+class TestQueueQueryPlans:
+    @pytest.mark.asyncio
+    async def test_get_due_uses_queue_order_index(self, seeded_session, now):
+        capturing = _CapturingSession(seeded_session)
+
+        await SchedulingRepository(capturing).get_due(now)
+
+        _assert_index_ordered(await _explain(seeded_session, capturing.statements[0]))
+
+    @pytest.mark.asyncio
+    async def test_due_queue_page_uses_queue_order_index(self, seeded_session, now):
+        capturing = _CapturingSession(seeded_session)
+
+        await StudyQueueRepository(capturing).list_scheduled_cards(
+            due_before=now, limit=20
+        )
+
+        _assert_index_ordered(await _explain(seeded_session, capturing.statements[0]))
+
+    @pytest.mark.asyncio
+    async def test_practice_top_up_uses_queue_order_index(self, seeded_session):
+        capturing = _CapturingSession(seeded_session)
+
+        await StudyQueueRepository(capturing).list_scheduled_cards(
+            exclude_card_ids={"card_1", "card_2"}, limit=20
+        )
+
+        _assert_index_ordered(await _explain(seeded_session, capturing.statements[0]))
+
+    @pytest.mark.asyncio
+    async def test_keyset_page_uses_queue_order_index(self, seeded_session, now):
+        capturing = _CapturingSession(seeded_session)
+
+        await StudyQueueRepository(capturing).list_scheduled_cards(
+            due_before=now,
+            after=QueuePosition(
+                due=now - timedelta(minutes=20),
+                last_review=None,
+                card_id="card_30",
+            ),
+            limit=5,
+        )
+
+        _assert_index_ordered(await _explain(seeded_session, capturing.statements[0]))
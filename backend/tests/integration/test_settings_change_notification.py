@@ -0,0 +1,64 @@
+"""LISTEN/NOTIFY round trip between SettingsService and SettingsChangeListener."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from settings.db.settings_change_listener import SettingsChangeListener
+from settings.db.settings_repository import SettingsRepository
+from settings.service.settings_service import SettingsService
+
+
+async def _wait_for(event: asyncio.Event) -> bool:
+    try:
+        await asyncio.wait_for(event.wait(), timeout=5)
+    except TimeoutError:
+        return False
+    return True
+
+
+@pytest.mark.asyncio
+async def test_committed_update_notifies_listener(database_url: str):
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    changed = asyncio.Event()
+    listener = SettingsChangeListener(engine, changed.set)
+    listener.start()
+    try:
+        # The listener invalidates once right after connecting.
+        assert await _wait_for(changed)
+        changed.clear()
+
+        async with session_factory() as session:
+            await SettingsService(SettingsRepository(session)).update(evaluation_concurrency=3)
+            await asyncio.sleep(0.2)
+            assert not changed.is_set()  # nothing is announced before commit
+            await session.commit()
+
+        assert await _wait_for(changed)
+    finally:
+        await listener.stop()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_update_is_not_announced(database_url: str):
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    changed = asyncio.Event()
+    listener = SettingsChangeListener(engine, changed.set)
+    listener.start()
+    try:
+        assert await _wait_for(changed)
+        changed.clear()
+
+        async with session_factory() as session:
+            await SettingsService(SettingsRepository(session)).update(evaluation_concurrency=2)
+            await session.rollback()
+
+        await asyncio.sleep(0.5)
+        assert not changed.is_set()
+    finally:
+        await listener.stop()
+        await engine.dispose()
@@ -2,6 +2,7 @@
 
 import pytest
 
+from navigation.model.key_answer import KeyAnswer, KeyValue, QuantityUnit
 from navigation.service.heuristic_navigation_evaluator import HeuristicNavigationEvaluator
 from navigation.service.navigation_evaluator_port import NavigationEvaluationRequest
 
@@ -58,3 +59,100 @@ async def test_no_key_answers_gives_half_score(evaluator):
     assert result.score == 1.0
     assert result.is_correct is False
     assert "Musterlösung" in result.feedback
+
+
+@pytest.mark.asyncio
+async def test_value_within_tolerance_matches(evaluator):
+    result = await evaluator.evaluate(_request("KaK 287°, Distanz 9,8 sm"))
+    assert result.score == 2.0
+
+
+@pytest.mark.asyncio
+async def test_value_outside_tolerance_does_not_match(evaluator):
+    result = await evaluator.evaluate(
+        _request("KaK = 286,5°", key_answers=["KaK = 286° [Keine Toleranz]"])
+    )
+    assert result.score == 0.0
+
+
+@pytest.mark.asyncio
+async def test_course_tolerance_wraps_around_north(evaluator):
+    result = await evaluator.evaluate(
+        _request("MgK = 001°", key_answers=["MgK = 359° [± 2°]"])
+    )
+    assert result.score == 2.0
+
+
+@pytest.mark.asyncio
+async def test_position_and_clock_time_match(evaluator):
+    keys = [
+        "Ob 15:20 BZ  = 53°50,6‘ N,  = 008°10,3‘ E [± 0,2‘]",
+        "ETA = 15:20 BZ + 2 h 18 min = 17:38 BZ [± 3 min]",
+    ]
+    result = await evaluator.evaluate(
+        _request("Position 53° 50,5' N 008° 10,4' E, Ankunft 17:40 Uhr", key_answers=keys)
+    )
+    assert result.score == 2.0
+
+
+@pytest.mark.asyncio
+async def test_uses_parsed_key_answers_when_given(evaluator):
+    request = NavigationEvaluationRequest(
+        context="",
+        sub_questions=[],
+        key_answers=["KaK = 286° [± 1°]"],
+        solution_text="",
+        student_answer="KaK = 100°",
+        max_score=2.0,
+        parsed_key_answers=[
+            KeyAnswer("KaK = 100°", "KaK", (KeyValue(100.0, QuantityUnit.DEGREES),))
+        ],
+    )
+    result = await evaluator.evaluate(request)
+    assert result.score == 2.0
+
+
+@pytest.mark.asyncio
+async def test_labelled_distance_does_not_satisfy_course_key(evaluator):
+    result = await evaluator.evaluate(
+        _request("KaK = 12, d = 286", key_answers=["KaK = 286° [± 1°]"])
+    )
+    assert result.score == 0.0
+
+
+
+@pytest.mark.asyncio
+async def test_swapped_course_values_do_not_match(evaluator):
+    result = await evaluator.evaluate(
+        _request("KaK = 290°, MgK = 286°", key_answers=["KaK = 286°", "MgK = 290°"])
+    )
+    assert result.score == 0.0
+
+
+@pytest.mark.asyncio
+async def test_other_course_label_does_not_satisfy_key(evaluator):
+    result = await evaluator.evaluate(_request("mwK = 286°", key_answers=["KaK = 286°"]))
+    assert result.score == 0.0
+
+
+@pytest.mark.asyncio
+async def test_signed_correction_does_not_wrap_around(evaluator):
+    result = await evaluator.evaluate(_request("Abl = 357°", key_answers=["Abl = -3°"]))
+    assert result.score == 0.0
+
+
+@pytest.mark.asyncio
+async def test_negative_angle_is_not_a_course(evaluator):
+    result = await evaluator.evaluate(_request("-74°", key_answers=["KaK = 286° [± 1°]"]))
+    assert result.score == 0.0
+
+
+@pytest.mark.asyncio
+async def test_formula_variables_do_not_label_the_result(evaluator):
+    result = await evaluator.evaluate(
+        _request(
+            "t = d / v * 60 = 9,7 / 5 * 60 = 116 min",
+            key_answers=["t = d / v * 60 = 9,7 / 5,0 * 60 = 116 min = 1 h 56 min [± 3 min]"],
+        )
+    )
+    assert result.score == 2.0
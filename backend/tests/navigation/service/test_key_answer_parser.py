@@ -0,0 +1,103 @@
+"""Unit tests for parsing navigation key answers."""
+
+import pytest
+
+from navigation.model.key_answer import KeyValue, QuantityUnit
+from navigation.service.key_answer_parser import (
+    parse_key_answer,
+    scan_labelled_values,
+    scan_values,
+)
+
+
+@pytest.mark.parametrize(
+    ("text", "quantity", "values"),
+    [
+        ("KaK = 286° [± 1°]", "KaK", [KeyValue(286.0, QuantityUnit.DEGREES, 1.0, "kak")]),
+        ("BS = – 7° [± 1°]", "BS", [KeyValue(-7.0, QuantityUnit.DEGREES, 1.0, "bs")]),
+        (
+            "BV = 110° / 1,2 sm [± 20° / ± 0,2 sm]",
+            "BV",
+            [
+                KeyValue(110.0, QuantityUnit.DEGREES, 20.0, "bv"),
+                KeyValue(1.2, QuantityUnit.NAUTICAL_MILES, 0.2, "bv"),
+            ],
+        ),
+        (
+            "d = 28,7 sm / 5 kn * 60 = 344 min = 5 h 44 min [± 4 min]",
+            "d",
+            [KeyValue(344.0, QuantityUnit.MINUTES, 4.0, "d")],
+        ),
+        (
+            "TS = zum 2. HW Spiekeroog 29.08.2013 = 3,2 – 0,9 m = 2,3 m [Keine Toleranz]",
+            "TS",
+            [KeyValue(2.3, QuantityUnit.METRES, 0.0, "ts")],
+        ),
+        (
+            "5,9 sm [± 0,1 sm] + 5,1 sm [± 0,1 sm] = 11 sm [± 0,2 sm]",
+            None,
+            [KeyValue(11.0, QuantityUnit.NAUTICAL_MILES, 0.2)],
+        ),
+        (
+            "02:00 BZ ca. HWZ StR = 137° StG = 0,5 kn [Keine Toleranz]",
+            None,
+            [
+                KeyValue(137.0, QuantityUnit.DEGREES, 0.0, "str"),
+                KeyValue(0.5, QuantityUnit.KNOTS, 0.0, "stg"),
+            ],
+        ),
+        (
+            "11:45 BZ = 1 h vor HWZ Helgoland 105° [± 5°]",
+            None,
+            [KeyValue(105.0, QuantityUnit.DEGREES, 5.0)],
+        ),
+        (
+            "Ob 15:20 BZ  = 53°50,6‘ N,  = 008°10,3‘ E [± 0,2‘]",
+            None,
+            [
+                KeyValue(53 * 60 + 50.6, QuantityUnit.LATITUDE, 0.2),
+                KeyValue(8 * 60 + 10.3, QuantityUnit.LONGITUDE, 0.2),
+            ],
+        ),
+        (
+            "ETA = 06:45 BZ + 7 h 33 min = 14:18 BZ",
+            "ETA",
+            [KeyValue(858.0, QuantityUnit.CLOCK_TIME, quantity="eta")],
+        ),
+        (
+            "t = d / v * 60 = 9,7 / 5,0 * 60 = 116 min = 1 h 56 min [± 3 min]",
+            "t",
+            [KeyValue(116.0, QuantityUnit.MINUTES, 3.0, "t")],
+        ),
+        (
+            "MgK = 270° [± 1°]* Abl = - 5°",
+            "MgK",
+            [
+                KeyValue(270.0, QuantityUnit.DEGREES, 1.0, "mgk"),
+                KeyValue(-5.0, QuantityUnit.DEGREES, 1.0, "abl"),
+            ],
+        ),
+    ],
+)
+def test_parse_key_answer(text, quantity, values):
+    parsed = parse_key_answer(text)
+    assert parsed.quantity == quantity
+    assert list(parsed.values) == pytest.approx(values)
+
+
+def test_unparseable_key_has_no_values():
+    assert parse_key_answer("[Keine Toleranz]").values == ()
+
+
+def test_scan_values_reads_bare_numbers_only_on_request():
+    assert scan_values("KaK 286") == []
+    assert scan_values("KaK 286,5", include_bare=True) == [KeyValue(286.5, QuantityUnit.NONE)]
+
+
+def test_scan_labelled_values_assigns_the_preceding_label():
+    assert scan_labelled_values("12 KaK = 286, FüG 5,5 kn, Distanz 3 sm") == [
+        KeyValue(12.0, QuantityUnit.NONE),
+        KeyValue(286.0, QuantityUnit.NONE, quantity="kak"),
+        KeyValue(5.5, QuantityUnit.KNOTS, quantity="füg"),
+        KeyValue(3.0, QuantityUnit.NAUTICAL_MILES, quantity="d"),
+    ]
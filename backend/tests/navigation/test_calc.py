@@ -0,0 +1,206 @@
+"""Unit tests for the navigation arithmetic, checked against catalogue tasks."""
+
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from navigation.calc import (
+    DeviationTable,
+    apply_leeway,
+    compass_to_true,
+    course_to_steer,
+    current_correction,
+    current_triangle,
+    degrees_minutes,
+    distance_nm,
+    normalize_course,
+    rhumb_destination,
+    rhumb_line,
+    signed_angle,
+    speed_kn,
+    travel_minutes,
+    true_to_compass,
+    twelfths_rule_height,
+)
+from navigation.service.key_answer_parser import parse_key_answers
+
+CATALOGUE = Path(__file__).resolve().parents[2] / "scripts" / "sks_navigation_catalog.json"
+_CHAIN_VALUE = re.compile(
+    r"\*\*(MgK|Abl|MwK|mwK|Mw|rwK|BW|KdW|BS|KüG)\*\*\s*=\s*\*{0,2}\s*([+\-–]?)\s*(\d+)\s*°"
+)
+
+
+def test_angles_are_normalised():
+    assert normalize_course(-5) == 355
+    assert signed_angle(350) == -10
+    assert signed_angle(180) == 180
+
+
+def test_course_conversion_round_trip():
+    # Sheet 2, task 12: MgK 270° + Abl -5° + Mw +1° = rwK 266°.
+    assert compass_to_true(270, -5, 1) == 266
+    assert true_to_compass(266, 1, -5) == 270
+    assert apply_leeway(266, -7) == 259
+
+
+def test_deviation_table_interpolates_and_inverts():
+    table = DeviationTable({0: 2, 90: 11, 180: -2, 270: -5})
+
+    assert table.deviation(45) == pytest.approx(6.5)
+    assert table.deviation(315) == pytest.approx(-1.5)
+    compass = true_to_compass(94, 1, table)
+    assert compass + table.deviation(compass) == pytest.approx(93)
+
+
+def test_course_to_steer_matches_sheet_1_task_14():
+    # KaK 085°, StR 050° / StG 1,2 kn, FdW 5,8 kn -> KdW 092°, FüG 6,7 kn.
+    course, speed = course_to_steer(85, 5.8, 50, 1.2)
+
+    assert round(course) == 92
+    assert round(speed, 1) == 6.7
+    assert round(current_correction(92, 85)) == -7
+
+
+def test_current_triangle_is_inverse_of_course_to_steer():
+    course, speed = course_to_steer(200, 6.5, 55, 1.4)
+
+    assert current_triangle(course, 6.5, 55, 1.4) == pytest.approx((200, speed))
+
+
+def test_current_too_strong_is_rejected():
+    with pytest.raises(ValueError):
+        course_to_steer(0, 1.0, 90, 2.0)
+
+
+def test_distance_speed_time():
+    assert travel_minutes(9.7, 5.0) == pytest.approx(116.4)
+    assert distance_nm(3.5, 75) == pytest.approx(4.375)
+    assert speed_kn(6.1, 73) == pytest.approx(5.0, abs=0.02)
+
+
+@pytest.mark.parametrize(
+    ("dead_reckoning", "observed", "expected"),
+    [
+        (((54, 6.1), (8, 32.2)), ((54, 6.2), (8, 33.5)), (83, 0.8)),
+        (((54, 12.4), (8, 29.7)), ((54, 12.0), (8, 31.6)), (110, 1.2)),
+        (((54, 10.2), (7, 41.2)), ((54, 9.4), (7, 41.8)), (157, 0.9)),
+    ],
+)
+def test_rhumb_line_reproduces_catalogue_offsets(dead_reckoning, observed, expected):
+    course, distance = rhumb_line(
+        degrees_minutes(*dead_reckoning[0]),
+        degrees_minutes(*dead_reckoning[1]),
+        degrees_minutes(*observed[0]),
+        degrees_minutes(*observed[1]),
+    )
+
+    assert course == pytest.approx(expected[0], abs=1.5)
+    assert round(distance, 1) == expected[1]
+
+
+def test_rhumb_destination_inverts_rhumb_line():
+    start = (54.1, 8.5)
+    course, distance = rhumb_line(*start, 53.9, 7.8)
+
+    assert rhumb_destination(*start, course, distance) == pytest.approx((53.9, 7.8))
+
+
+def test_twelfths_rule():
+    assert twelfths_rule_height(1.0, 4.0, 0) == pytest.approx(1.0)
+    assert twelfths_rule_height(1.0, 4.0, 2) == pytest.approx(1.75)
+    assert twelfths_rule_height(1.0, 4.0, 2.5) == pytest.approx(2.125)
+    assert twelfths_rule_height(1.0, 4.0, 8) == pytest.approx(4.0)
+
+
+def _catalogue_course_chains() -> list[tuple[dict[str, int], list[str]]]:
+    """Complete MgK → KüG chains of the catalogue with the task's key answers."""
+    chains = []
+    for sheet in json.loads(CATALOGUE.read_text()):
+        for task in sheet["tasks"]:
+            values: dict[str, int] = {}
+            for name, sign, number in _CHAIN_VALUE.findall(
+                task["solution"].get("solution_markdown", "")
+            ):
+                value = -int(number) if sign in ("-", "–") else int(number)
+                values.setdefault("MwK" if name == "mwK" else name, value)
+            if len(values) == 9:
+                chains.append((values, task["solution"]["key_answers"]))
+    return chains
+
+
+def test_catalogue_course_chains_are_consistent():
+    chains = _catalogue_course_chains()
+
+    for values, _ in chains:
+        assert normalize_course(values["MgK"] + values["Abl"]) == values["MwK"]
+        assert compass_to_true(values["MgK"], values["Abl"], values["Mw"]) == values["rwK"]
+        assert apply_leeway(values["rwK"], values["BW"]) == values["KdW"]
+        assert normalize_course(values["KdW"] + values["BS"]) == values["KüG"]
+    assert chains
+
+
+def test_catalogue_compass_key_answers_follow_from_their_chains():
+    chains = _catalogue_course_chains()
+    column = {name: np.array([values[name] for values, _ in chains]) for name in chains[0][0]}
+    keyed_compass_courses = [
+        next(key.values[0].value for key in parse_key_answers(keys) if key.quantity == "MgK")
+        for _, keys in chains
+    ]
+
+    assert np.array_equal(
+        compass_to_true(column["MgK"], column["Abl"], column["Mw"]), column["rwK"]
+    )
+    assert np.array_equal(
+        true_to_compass(column["rwK"], column["Mw"], column["Abl"]), keyed_compass_courses
+    )
+
+
+def test_arrays_are_computed_element_wise():
+    table = DeviationTable({0: 2, 90: 11, 180: -2, 270: -5})
+    courses = np.arange(-90.0, 450.0, 7.5)
+
+    assert table.deviation(courses) == pytest.approx([table.deviation(c) for c in courses])
+    assert true_to_compass(courses, 1, table) == pytest.approx(
+        [true_to_compass(course, 1, table) for course in courses]
+    )
+    assert signed_angle(courses) == pytest.approx([signed_angle(c) for c in courses])
+
+    tracks = np.array([85.0, 200.0, 10.0])
+    steered, over_ground = course_to_steer(tracks, 5.8, 50, 1.2)
+    course_over_ground, speed_over_ground = current_triangle(steered, 5.8, 50, 1.2)
+    assert course_over_ground == pytest.approx(tracks)
+    assert speed_over_ground == pytest.approx(over_ground)
+    assert travel_minutes(np.array([9.7, 5.8]), np.array([5.0, 5.8])) == pytest.approx(
+        [116.4, 60.0]
+    )
+    assert twelfths_rule_height(1.0, 4.0, np.array([0, 2, 2.5, 8])) == pytest.approx(
+        [1.0, 1.75, 2.125, 4.0]
+    )
+
+    positions = [(54.1, 8.5, 53.9, 7.8), (60.0, 0.0, 60.0, 1.0), (-10.0, 179.5, -9.0, -179.5)]
+    latitude, longitude, to_latitude, to_longitude = np.array(positions).T
+    course_array, distance_array = rhumb_line(latitude, longitude, to_latitude, to_longitude)
+    expected = [rhumb_line(*position) for position in positions]
+    assert course_array == pytest.approx([course for course, _ in expected])
+    assert distance_array == pytest.approx([distance for _, distance in expected])
+    reached = rhumb_destination(latitude, longitude, course_array, distance_array)
+    assert reached[0] == pytest.approx(to_latitude)
+    assert reached[1] == pytest.approx(to_longitude)
+
+
+def test_one_invalid_element_rejects_the_batch():
+    with pytest.raises(ValueError):
+        course_to_steer(np.array([0.0, 0.0]), np.array([5.0, 1.0]), 90, 2.0)
+    with pytest.raises(ValueError):
+        travel_minutes(np.array([1.0, 2.0]), np.array([5.0, 0.0]))
+
+
+def test_rhumb_line_due_east():
+    course, distance = rhumb_line(60.0, 0.0, 60.0, 1.0)
+
+    assert course == pytest.approx(90)
+    assert distance == pytest.approx(30.0)
+    assert rhumb_destination(60.0, 0.0, 90, 30.0) == pytest.approx((60.0, 1.0))
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 from scheduling.model.card_scheduling_info import CardSchedulingInfo
 from scheduling.model.card_state import CardState
 from scheduling.model.rating import Rating
@@ -57,3 +59,16 @@ class TestGetRetrievability:
         r = service.get_retrievability(reviewed)
 
         assert 0.0 < r <= 1.0
+
+
+class TestReviewCardAt:
+    def test_uses_given_review_time(self):
+        service = SchedulingService()
+        reviewed_at = datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)
+        card = CardSchedulingInfo(due=reviewed_at - timedelta(days=1))
+
+        updated, log = service.review_card(card, Rating.GOOD, reviewed_at=reviewed_at)
+
+        assert log.reviewed_at == reviewed_at
+        assert updated.last_review == reviewed_at
+        assert updated.due > reviewed_at
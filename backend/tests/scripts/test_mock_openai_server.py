@@ -0,0 +1,93 @@
+import random
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from exam.service.exam_evaluator_port import ExamEvaluationRequest
+from exam.service.openai_exam_evaluator import OpenAiExamEvaluator
+from scripts.mock_openai_server import LatencyDistribution, MockConfig, create_app
+
+
+def _client(config: MockConfig) -> AsyncOpenAI:
+    transport = httpx.ASGITransport(app=create_app(config))
+    return AsyncOpenAI(
+        api_key="sk-mock",
+        base_url="http://mock/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def _request(answer: str) -> ExamEvaluationRequest:
+    return ExamEvaluationRequest(
+        question_text="Was bedeutet ein gelbes Blitzlicht?",
+        short_answer=["Sonderzeichen"],
+        reference_answer="Sonderzeichen",
+        student_answer=answer,
+        max_score=2.0,
+    )
+
+
+class TestLatencyDistribution:
+    def test_parses_specs(self):
+        assert LatencyDistribution.parse("fixed:200").sample_ms(random.Random()) == 200.0
+        uniform = LatencyDistribution.parse("uniform:100:300")
+        assert 100.0 <= uniform.sample_ms(random.Random(1)) <= 300.0
+        assert LatencyDistribution.parse("lognormal:300:0.5").sample_ms(random.Random(1)) > 0
+
+    @pytest.mark.parametrize("spec", ["", "fixed", "uniform:1", "gauss:1:2", "fixed:-1"])
+    def test_rejects_invalid_specs(self, spec: str):
+        with pytest.raises(ValueError):
+            LatencyDistribution.parse(spec)
+
+
+class TestMockOpenAiServer:
+    @pytest.mark.asyncio
+    async def test_exam_evaluator_grades_single_answer(self):
+        evaluator = OpenAiExamEvaluator(
+            api_key="sk-mock",
+            model="mock",
+            timeout_seconds=5,
+            client=_client(MockConfig(score_ratio=0.5, feedback="Halb richtig.")),
+        )
+
+        evaluation = await evaluator.evaluate(_request("Sonderzeichen"))
+
+        assert evaluation.score == 1.0
+        assert evaluation.feedback == "Halb richtig."
+        assert not evaluation.from_fallback
+
+    @pytest.mark.asyncio
+    async def test_exam_evaluator_grades_batch(self):
+        evaluator = OpenAiExamEvaluator(
+            api_key="sk-mock", model="mock", timeout_seconds=5, client=_client(MockConfig())
+        )
+
+        evaluations = await evaluator.evaluate_many([_request("a"), _request("b")])
+
+        assert [evaluation.score for evaluation in evaluations] == [2.0, 2.0]
+        assert all(evaluation.is_correct for evaluation in evaluations)
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_trigger_fallback(self):
+        evaluator = OpenAiExamEvaluator(
+            api_key="sk-mock",
+            model="mock",
+            timeout_seconds=5,
+            client=_client(MockConfig(error_rate=1.0, error_status=503)),
+        )
+
+        evaluation = await evaluator.evaluate(_request("Sonderzeichen"))
+
+        assert evaluation.from_fallback
+
+    @pytest.mark.asyncio
+    async def test_transcription_returns_canned_text(self):
+        client = _client(MockConfig(transcript="Gruenes Licht"))
+
+        transcription = await client.audio.transcriptions.create(
+            model="mock", file=("answer.webm", b"\x00\x01")
+        )
+
+        assert transcription.text == "Gruenes Licht"
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from settings.model.app_settings import AppSettings
+from settings.service.settings_cache import SettingsCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.model = "gpt-a"
+
+    async def __call__(self) -> AppSettings:
+        self.calls += 1
+        return AppSettings(openai_chat_model=self.model)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> SettingsCache:
+    return SettingsCache(max_age_seconds=60, clock=clock)
+
+
+class TestSettingsCache:
+    @pytest.mark.asyncio
+    async def test_loads_once_until_invalidated(self, cache: SettingsCache):
+        load = CountingLoader()
+
+        await cache.get(load)
+        await cache.get(load)
+        assert load.calls == 1
+
+        load.model = "gpt-b"
+        cache.invalidate()
+
+        assert (await cache.get(load)).openai_chat_model == "gpt-b"
+        assert load.calls == 2
+        assert cache.version == 1
+
+    @pytest.mark.asyncio
+    async def test_expires_after_max_age(self, cache: SettingsCache, clock: FakeClock):
+        load = CountingLoader()
+        await cache.get(load)
+
+        clock.now = 59.0
+        await cache.get(load)
+        assert load.calls == 1
+
+        clock.now = 60.0
+        await cache.get(load)
+        assert load.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_load_overtaken_by_invalidation_is_not_stored(self, cache: SettingsCache):
+        loading = asyncio.Event()
+        release = asyncio.Event()
+        load = CountingLoader()
+
+        async def slow_load() -> AppSettings:
+            loading.set()
+            await release.wait()
+            return AppSettings(openai_chat_model="stale")
+
+        pending = asyncio.create_task(cache.get(slow_load))
+        await loading.wait()
+        cache.invalidate()
+        release.set()
+
+        assert (await pending).openai_chat_model == "stale"
+        assert (await cache.get(load)).openai_chat_model == "gpt-a"
+        assert load.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_callers_get_independent_copies(self, cache: SettingsCache):
+        load = CountingLoader()
+
+        first = await cache.get(load)
+        first.openai_chat_model = "mutated"
+
+        assert (await cache.get(load)).openai_chat_model == "gpt-a"
@@ -0,0 +1,51 @@
+from study.model.study_queue_counts import StudyQueueCounts
+
+
+class TestDueNow:
+    def test_adds_new_cards_up_to_the_limit(self):
+        counts = StudyQueueCounts(
+            due_by_topic={"navigation": 2},
+            scheduled_cards=5,
+            new_card_topics=["wetterkunde", "wetterkunde", "navigation"],
+        )
+
+        assert counts.due_now(new_card_limit=4) == 4
+
+    def test_due_cards_are_not_capped_by_the_limit(self):
+        counts = StudyQueueCounts(due_by_topic={"navigation": 7}, scheduled_cards=7)
+
+        assert counts.due_now(new_card_limit=3) == 7
+
+
+class TestDueNowByTopic:
+    def test_includes_every_topic_and_introduced_new_cards(self):
+        counts = StudyQueueCounts(
+            due_by_topic={"navigation": 1, None: 1},
+            new_card_topics=["wetterkunde", "navigation"],
+        )
+
+        by_topic = counts.due_now_by_topic(new_card_limit=3)
+
+        assert by_topic == {
+            "navigation": 1,
+            "schifffahrtsrecht": 0,
+            "wetterkunde": 1,
+            "seemannschaft_i": 0,
+            "seemannschaft_ii": 0,
+        }
+
+
+class TestAvailableCards:
+    def test_fills_up_to_limit_from_scheduled_and_new_cards(self):
+        counts = StudyQueueCounts(
+            due_by_topic={"navigation": 1},
+            scheduled_cards=3,
+            new_card_topics=["navigation"],
+        )
+
+        assert counts.available_cards(new_card_limit=20) == 4
+
+    def test_is_capped_at_limit_when_few_cards_are_due(self):
+        counts = StudyQueueCounts(due_by_topic={"navigation": 1}, scheduled_cards=50)
+
+        assert counts.available_cards(new_card_limit=20) == 20
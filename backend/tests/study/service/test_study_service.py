@@ -0,0 +1,511 @@
+from collections.abc import Collection
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from card.model.card import Card
+from scheduling.model.card_scheduling_info import CardSchedulingInfo
+from scheduling.model.card_state import CardState
+from scheduling.model.rating import Rating
+from scheduling.model.review_log import ReviewLog
+from scheduling.service.scheduling_service import SchedulingService
+from study.model.buffered_review import BufferedReview
+from study.model.daily_activity import DailyActivity
+from study.model.queue_position import QueuePosition
+from study.model.sks_topic import SksTopic
+from study.model.study_card import StudyCard
+from study.model.study_queue_counts import StudyQueueCounts
+from study.service.study_service import StudyService
+
+_NOW = datetime.now(timezone.utc)
+
+
+class InMemoryCardRepository:
+    def __init__(self, cards: list[Card]) -> None:
+        self.cards = {card.card_id: card for card in cards}
+
+    async def list_all(self) -> list[Card]:
+        return list(self.cards.values())
+
+    async def get_by_id(self, card_id: str) -> Card | None:
+        return self.cards.get(card_id)
+
+    async def get_by_tags(self, tags: list[str]) -> list[Card]:
+        return [c for c in self.cards.values() if set(c.tags) & set(tags)]
+
+
+class InMemorySchedulingRepository:
+    def __init__(self, infos: list[CardSchedulingInfo]) -> None:
+        self.infos = {info.card_id: info for info in infos}
+        self.logs: list[ReviewLog] = []
+
+    async def list_all(self) -> list[CardSchedulingInfo]:
+        return list(self.infos.values())
+
+    async def get_by_card_id(self, card_id: str) -> CardSchedulingInfo | None:
+        return self.infos.get(card_id)
+
+    async def get_due(self, before: datetime) -> list[CardSchedulingInfo]:
+        return [info for info in self.infos.values() if info.due <= before]
+
+    async def save(self, info: CardSchedulingInfo) -> None:
+        self.infos[info.card_id] = info
+
+    async def insert_many(self, infos: list[CardSchedulingInfo]) -> None:
+        for info in infos:
+            self.infos.setdefault(info.card_id, info)
+
+    async def save_many(self, infos: list[CardSchedulingInfo]) -> None:
+        for info in infos:
+            self.infos[info.card_id] = info
+
+    async def save_review_log(self, log: ReviewLog) -> None:
+        self.logs.append(log)
+
+    async def save_review_logs(self, logs: list[ReviewLog]) -> None:
+        self.logs.extend(logs)
+
+    async def list_review_logs(self) -> list[ReviewLog]:
+        return sorted(self.logs, key=lambda log: log.reviewed_at, reverse=True)
+
+
+class InMemoryDailyActivityRepository:
+    def __init__(self) -> None:
+        self.days: dict[date, DailyActivity] = {}
+
+    async def record_reviews(self, activity_date: date, review_count: int = 1) -> None:
+        existing = self.days.get(activity_date)
+        if existing is not None:
+            self.days[activity_date] = replace(
+                existing, review_count=existing.review_count + review_count
+            )
+            return
+        previous = self.days.get(activity_date - timedelta(days=1))
+        self.days[activity_date] = DailyActivity(
+            activity_date=activity_date,
+            review_count=review_count,
+            streak_days=(previous.streak_days if previous else 0) + 1,
+        )
+
+    async def get(self, activity_date: date) -> DailyActivity | None:
+        return self.days.get(activity_date)
+
+    async def get_latest(self) -> DailyActivity | None:
+        return self.days[max(self.days)] if self.days else None
+
+
+def _queue_key(position: QueuePosition) -> tuple:
+    return (
+        position.due,
+        position.last_review is not None,
+        position.last_review or _NOW,
+        position.card_id,
+    )
+
+
+class InMemoryStudyQueueRepository:
+    """Mirrors the SQL semantics of StudyQueueRepository over the fakes above."""
+
+    def __init__(
+        self,
+        card_repo: InMemoryCardRepository,
+        scheduling_repo: InMemorySchedulingRepository,
+    ) -> None:
+        self._cards = card_repo
+        self._scheduling = scheduling_repo
+
+    async def list_scheduled_cards(
+        self,
+        *,
+        topic: SksTopic | None = None,
+        due_before: datetime | None = None,
+        card_ids: Collection[str] | None = None,
+        exclude_card_ids: Collection[str] = (),
+        after: QueuePosition | None = None,
+        limit: int | None = None,
+    ) -> list[StudyCard]:
+        rows = [
+            StudyCard(card=self._cards.cards[info.card_id], scheduling_info=info)
+            for info in self._scheduling.infos.values()
+            if info.card_id in self._cards.cards
+            and (due_before is None or info.due <= due_before)
+            and (card_ids is None or info.card_id in card_ids)
+            and info.card_id not in exclude_card_ids
+            and (topic is None or topic.value in self._cards.cards[info.card_id].tags)
+        ]
+        rows.sort(key=lambda sc: _queue_key(QueuePosition.of(sc.scheduling_info)))
+        if after is not None:
+            rows = [
+                sc for sc in rows
+                if _queue_key(QueuePosition.of(sc.scheduling_info)) > _queue_key(after)
+            ]
+        return rows if limit is None else rows[:limit]
+
+    async def list_unscheduled_cards(
+        self,
+        *,
+        topic: SksTopic | None = None,
+        limit: int,
+    ) -> list[Card]:
+        cards = sorted(
+            (
+                card
+                for card in self._cards.cards.values()
+                if card.card_id not in self._scheduling.infos
+                and (topic is None or topic.value in card.tags)
+            ),
+            key=lambda card: card.card_id,
+        )
+        return cards[:limit]
+
+    async def get_queue_counts(
+        self,
+        *,
+        due_before: datetime,
+        new_card_limit: int,
+    ) -> StudyQueueCounts:
+        due_by_topic: dict[str | None, int] = {}
+        for sc in await self.list_scheduled_cards(due_before=due_before):
+            topic = _primary_topic(sc.card)
+            due_by_topic[topic] = due_by_topic.get(topic, 0) + 1
+        return StudyQueueCounts(
+            due_by_topic=due_by_topic,
+            scheduled_cards=len(await self.list_scheduled_cards()),
+            new_card_topics=[
+                _primary_topic(card)
+                for card in await self.list_unscheduled_cards(limit=new_card_limit)
+            ],
+        )
+
+
+def _primary_topic(card: Card) -> str | None:
+    return next((t.value for t in SksTopic if t.value in card.tags), None)
+
+
+def _card(card_id: str, topic: SksTopic = SksTopic.NAVIGATION) -> Card:
+    return Card(card_id=card_id, tags=[topic.value])
+
+
+def _info(card_id: str, due_offset_minutes: int) -> CardSchedulingInfo:
+    return CardSchedulingInfo(
+        card_id=card_id,
+        due=_NOW + timedelta(minutes=due_offset_minutes),
+    )
+
+
+def _build(
+    cards: list[Card],
+    infos: list[CardSchedulingInfo],
+    new_card_limit_per_queue: int = 20,
+    activity_repo: InMemoryDailyActivityRepository | None = None,
+) -> tuple[InMemoryCardRepository, InMemorySchedulingRepository, StudyService]:
+    card_repo = InMemoryCardRepository(cards)
+    scheduling_repo = InMemorySchedulingRepository(infos)
+    return card_repo, scheduling_repo, StudyService(
+        card_repo=card_repo,
+        scheduling_repo=scheduling_repo,
+        queue_repo=InMemoryStudyQueueRepository(card_repo, scheduling_repo),
+        activity_repo=activity_repo or InMemoryDailyActivityRepository(),
+        scheduling_service=SchedulingService(),
+        new_card_limit_per_queue=new_card_limit_per_queue,
+    )
+
+
+class TestGetDueCards:
+    @pytest.mark.asyncio
+    async def test_returns_due_cards_in_queue_order(self):
+        _, _, service = _build(
+            cards=[_card("a"), _card("b"), _card("c")],
+            infos=[_info("a", -5), _info("b", -10), _info("c", 60)],
+        )
+
+        due = await service.get_due_cards()
+
+        assert [sc.card.card_id for sc in due] == ["b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_filters_by_topic(self):
+        _, _, service = _build(
+            cards=[_card("a"), _card("b", SksTopic.WETTERKUNDE)],
+            infos=[_info("a", -5), _info("b", -5)],
+        )
+
+        due = await service.get_due_cards(topic=SksTopic.WETTERKUNDE)
+
+        assert [sc.card.card_id for sc in due] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_skips_scheduling_rows_without_card(self):
+        _, _, service = _build(
+            cards=[_card("a")],
+            infos=[_info("a", -5), _info("orphan", -10)],
+        )
+
+        due = await service.get_due_cards()
+
+        assert [sc.card.card_id for sc in due] == ["a"]
+
+
+class TestNewCardIntroduction:
+    @pytest.mark.asyncio
+    async def test_fills_remaining_slots_with_unscheduled_cards(self):
+        _, scheduling_repo, service = _build(
+            cards=[_card("a"), _card("n2"), _card("n1"), _card("n3")],
+            infos=[_info("a", -5)],
+            new_card_limit_per_queue=3,
+        )
+
+        due = await service.get_due_cards()
+
+        assert [sc.card.card_id for sc in due] == ["a", "n1", "n2"]
+        assert set(scheduling_repo.infos) == {"a", "n1", "n2"}
+
+    @pytest.mark.asyncio
+    async def test_respects_topic_for_new_cards(self):
+        _, _, service = _build(
+            cards=[_card("n1"), _card("n2", SksTopic.WETTERKUNDE)],
+            infos=[],
+        )
+
+        due = await service.get_due_cards(topic=SksTopic.WETTERKUNDE)
+
+        assert [sc.card.card_id for sc in due] == ["n2"]
+
+    @pytest.mark.asyncio
+    async def test_dashboard_does_not_persist_new_cards(self):
+        _, scheduling_repo, service = _build(cards=[_card("n1")], infos=[])
+
+        summary = await service.get_dashboard_summary()
+
+        assert summary.due_now == 1
+        assert scheduling_repo.infos == {}
+
+
+class TestGetPracticeCards:
+    @pytest.mark.asyncio
+    async def test_tops_up_due_cards_with_next_scheduled_cards(self):
+        _, _, service = _build(
+            cards=[_card("a"), _card("b"), _card("c"), _card("d")],
+            infos=[_info("a", -5), _info("b", 30), _info("c", 10), _info("d", 60)],
+            new_card_limit_per_queue=3,
+        )
+
+        practice = await service.get_practice_cards()
+
+        assert [sc.card.card_id for sc in practice] == ["a", "c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_filters_upcoming_cards_by_topic(self):
+        _, _, service = _build(
+            cards=[_card("a"), _card("b", SksTopic.WETTERKUNDE)],
+            infos=[_info("a", 10), _info("b", 20)],
+        )
+
+        practice = await service.get_practice_cards(topic=SksTopic.WETTERKUNDE)
+
+        assert [sc.card.card_id for sc in practice] == ["b"]
+
+
+class TestGetDashboardSummary:
+    @pytest.mark.asyncio
+    async def test_counts_due_cards_by_topic_and_recommends_busiest(self):
+        _, _, service = _build(
+            cards=[
+                _card("a"),
+                _card("b", SksTopic.WETTERKUNDE),
+                _card("c", SksTopic.WETTERKUNDE),
+                _card("d"),
+            ],
+            infos=[_info("a", -5), _info("b", -5), _info("c", -5), _info("d", 60)],
+        )
+
+        summary = await service.get_dashboard_summary()
+
+        assert summary.due_now == 3
+        assert summary.due_by_topic["wetterkunde"] == 2
+        assert summary.due_by_topic["navigation"] == 1
+        assert summary.recommended_topic == "wetterkunde"
+        assert summary.available_cards == 4
+
+    @pytest.mark.asyncio
+    async def test_reports_reviews_today_and_streak_from_activity_rollup(self):
+        _, _, service = _build(
+            cards=[_card("a"), _card("b")],
+            infos=[_info("a", -5), _info("b", -5)],
+        )
+
+        await service.review_card("a", Rating.GOOD)
+        await service.review_card("b", Rating.AGAIN)
+        summary = await service.get_dashboard_summary()
+
+        assert summary.reviewed_today == 2
+        assert summary.streak_days == 1
+
+
+
+class TestReviewAndGetNext:
+    @pytest.mark.asyncio
+    async def test_returns_cards_behind_the_cursor(self):
+        _, scheduling_repo, service = _build(
+            cards=[_card("a"), _card("b"), _card("c"), _card("d"), _card("e")],
+            infos=[
+                _info("a", -30),
+                _info("b", -20),
+                _info("c", -10),
+                _info("d", -5),
+                _info("e", -1),
+            ],
+        )
+
+        result = await service.review_and_get_next(
+            "a", Rating.GOOD, after_card_id="b", limit=2
+        )
+
+        assert result.reviewed.card.card_id == "a"
+        assert scheduling_repo.infos["a"].reps == 1
+        assert [sc.card.card_id for sc in result.next_cards] == ["c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_on_reviewed_card_uses_its_queue_position(self):
+        _, _, service = _build(
+            cards=[_card("a"), _card("b")],
+            infos=[_info("a", -30), _info("b", -20)],
+        )
+
+        result = await service.review_and_get_next(
+            "a", Rating.AGAIN, after_card_id="a", limit=5
+        )
+
+        assert [sc.card.card_id for sc in result.next_cards] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_tops_up_page_with_new_cards(self):
+        _, scheduling_repo, service = _build(
+            cards=[_card("a"), _card("b"), _card("c")],
+            infos=[_info("a", -10)],
+        )
+
+        result = await service.review_and_get_next("a", Rating.GOOD, limit=5)
+
+        assert [sc.card.card_id for sc in result.next_cards] == ["b", "c"]
+        assert {"b", "c"} <= scheduling_repo.infos.keys()
+
+    @pytest.mark.asyncio
+    async def test_new_cards_respect_the_queue_budget_before_the_cursor(self):
+        _, scheduling_repo, service = _build(
+            cards=[_card("a"), _card("b"), _card("c"), _card("n1"), _card("n2")],
+            infos=[_info("a", -30), _info("b", -20), _info("c", -10)],
+            new_card_limit_per_queue=3,
+        )
+
+        result = await service.review_and_get_next(
+            "a", Rating.GOOD, after_card_id="c", limit=5
+        )
+
+        assert [sc.card.card_id for sc in result.next_cards] == ["n1"]
+        assert "n2" not in scheduling_repo.infos
+
+    @pytest.mark.asyncio
+    async def test_unknown_cursor_raises_before_reviewing(self):
+        _, scheduling_repo, service = _build(
+            cards=[_card("a")],
+            infos=[_info("a", -10)],
+        )
+
+        with pytest.raises(ValueError):
+            await service.review_and_get_next(
+                "a", Rating.GOOD, after_card_id="missing", limit=5
+            )
+        assert scheduling_repo.logs == []
+
+
+class TestReviewCards:
+    @pytest.mark.asyncio
+    async def test_replays_reviews_in_order_and_returns_final_states(self):
+        _, scheduling_repo, service = _build(
+            cards=[_card("a"), _card("b")],
+            infos=[_info("a", -5), _info("b", -5)],
+        )
+        start = _NOW - timedelta(minutes=3)
+
+        results = await service.review_cards(
+            [
+                BufferedReview("a", Rating.AGAIN, start),
+                BufferedReview("b", Rating.GOOD, start + timedelta(minutes=1)),
+                BufferedReview("a", Rating.GOOD, start + timedelta(minutes=2)),
+            ]
+        )
+
+        assert [sc.card.card_id for sc in results] == ["a", "b"]
+        assert results[0].scheduling_info.reps == 2
+        assert scheduling_repo.infos["a"].reps == 2
+        assert [log.card_id for log in scheduling_repo.logs] == ["a", "b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_review_before_last_review_is_clamped(self):
+        last_review = _NOW - timedelta(hours=1)
+        _, scheduling_repo, service = _build(
+            cards=[_card("a")],
+            infos=[
+                replace(
+                    _info("a", -5),
+                    state=CardState.REVIEW,
+                    stability=5.0,
+                    difficulty=5.0,
+                    scheduled_days=1,
+                    reps=1,
+                    last_review=last_review,
+                )
+            ],
+        )
+
+        results = await service.review_cards(
+            [
+                BufferedReview("a", Rating.GOOD, _NOW - timedelta(days=3)),
+                BufferedReview("a", Rating.GOOD, _NOW - timedelta(days=4)),
+            ]
+        )
+
+        assert [log.reviewed_at for log in scheduling_repo.logs] == [
+            last_review,
+            last_review,
+        ]
+        assert results[0].scheduling_info.last_review == last_review
+        assert results[0].scheduling_info.reps == 3
+
+    @pytest.mark.asyncio
+    async def test_rolls_up_activity_per_day(self):
+        activity_repo = InMemoryDailyActivityRepository()
+        _, _, service = _build(
+            cards=[_card("a")],
+            infos=[_info("a", -60 * 24 * 2)],
+            activity_repo=activity_repo,
+        )
+
+        await service.review_cards(
+            [
+                BufferedReview("a", Rating.GOOD, _NOW - timedelta(days=1)),
+                BufferedReview("a", Rating.GOOD, _NOW),
+                BufferedReview("a", Rating.EASY, _NOW),
+            ]
+        )
+
+        latest = await activity_repo.get_latest()
+        assert latest.review_count == 2
+        assert latest.streak_days == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_card_writes_nothing(self):
+        _, scheduling_repo, service = _build(cards=[_card("a")], infos=[_info("a", -5)])
+
+        with pytest.raises(ValueError):
+            await service.review_cards(
+                [
+                    BufferedReview("a", Rating.GOOD, _NOW),
+                    BufferedReview("missing", Rating.GOOD, _NOW),
+                ]
+            )
+
+        assert scheduling_repo.logs == []
+        assert scheduling_repo.infos["a"].reps == 0
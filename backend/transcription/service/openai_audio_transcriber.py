@@ -18,8 +18,10 @@ class OpenAiAudioTranscriber(AudioTranscriberPort):
         api_key: str,
         model: str,
         timeout_seconds: float,
+        client: AsyncOpenAI | None = None,
+        base_url: str | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = client or AsyncOpenAI(api_key=api_key, base_url=base_url)
         self._model = model
         self._timeout_seconds = timeout_seconds
 